@@ -2,25 +2,28 @@
 # Clean modular architecture implementation
 
 # --- Standard Library Imports ---
+import asyncio
 import json
 import logging
-import base64
+import pybase64  # SIMD-accelerated base64 for multi-MB audio payloads
 import os
 import uuid
+import hashlib
 import sqlite3
 import re
 import threading
 from datetime import datetime, timedelta
+from dataclasses import asdict
 from pathlib import Path
 from functools import lru_cache
-from typing import Dict, List, Optional, Union
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
 
 # --- Third-Party Imports ---
 import requests
 import azure.cognitiveservices.speech as speechsdk
-from fastapi import FastAPI, Form, UploadFile, HTTPException
+from fastapi import FastAPI, Form, Header, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from dotenv import load_dotenv
 from google.cloud import texttospeech_v1beta1 as texttospeech
 from contextlib import asynccontextmanager
@@ -36,11 +39,17 @@ from .services.gemini_service import (
     generate_gemini_content, 
     process_audio_with_gemini,
     translate_text_with_gemini,
+    translate_text_with_gemini_stream,
     generate_expert_response_with_gemini
 )
 from .services.tts_service import synthesize_text_to_audio
+from .services.tts_cache_service import tts_audio_cache
+from .services.azure_synthesizer_pool import AzureSynthesizerPool
+from .services.response_cache import gemini_audio_result_cache, audio_blob_cache, idempotent_response_cache
+from .services.ai_assistant import analyze_conversation_intent, generate_conversation_summary
 from .utils.response_parser import fix_json_response, validate_and_fix_response, create_fallback_response
 from .utils.ssml_utils import fix_ssml_content, process_text_to_ssml
+from .utils.language_utils import base_language_code
 
 # --- Logging Setup ---
 logging.basicConfig(level=logging.INFO)
@@ -51,6 +60,12 @@ env_path = Path(__file__).resolve().parent / '.env'
 logger.info(f"Loading .env file from: {env_path}")
 load_dotenv(dotenv_path=env_path)
 
+# LOG_LEVEL (see .env.example) applies to the app and uvicorn's per-request access log;
+# set it to WARNING in production to skip formatting/emitting hot-path INFO records
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+logging.getLogger().setLevel(LOG_LEVEL)
+logging.getLogger("uvicorn.access").setLevel(LOG_LEVEL)
+
 logger.info(f"Environment variable GOOGLE_API_KEY exists: {'GOOGLE_API_KEY' in os.environ}")
 logger.info(f"Environment variable PLAYAI_KEY exists: {'PLAYAI_KEY' in os.environ}")
 logger.info(f"Environment variable PLAYAI_USER_ID exists: {'PLAYAI_USER_ID' in os.environ}")
@@ -81,6 +96,9 @@ async def lifespan(app: FastAPI):
             # Load datasets from Azure on startup
             await azure_speech_service.initialize_datasets_on_startup()
             
+            # Open premium TTS connections before the first request needs them
+            await asyncio.to_thread(azure_synthesizer_pool.prewarm)
+            
             # Log initialization success with stats
             stats = azure_speech_service.get_dataset_stats()
             logger.info(f"✅ Azure Speech datasets initialized successfully!")
@@ -106,7 +124,7 @@ async def lifespan(app: FastAPI):
         logger.info("=== FastAPI Shutdown ===")
 
 # --- FastAPI App Setup ---
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -121,6 +139,23 @@ DEFAULT_TTS_VOICE_GENDER = texttospeech.SsmlVoiceGender.SSML_VOICE_GENDER_UNSPEC
 DEFAULT_AUDIO_ENCODING = texttospeech.AudioEncoding.MP3
 DEFAULT_AUDIO_MIME_TYPE = "audio/mp3"
 
+# Upload limits: Gemini's inline-data limit is ~20-25 MB, so larger uploads can never succeed
+MAX_AUDIO_UPLOAD_BYTES = 25 * 1024 * 1024
+AUDIO_UPLOAD_CHUNK_BYTES = 64 * 1024
+ALLOWED_AUDIO_CONTENT_TYPES = frozenset({
+    'audio/ogg', 'audio/mp3', 'audio/mpeg', 'audio/wav', 'audio/x-wav',
+    'audio/webm', 'audio/m4a', 'audio/mp4', 'audio/aac', 'audio/flac'
+})
+
+# Request-field lookups built once instead of per request
+PREMIUM_TRUE_VALUES = frozenset({"true", "1", "yes"})
+TTS_GENDER_MAP = {
+    "SSML_VOICE_GENDER_UNSPECIFIED": texttospeech.SsmlVoiceGender.SSML_VOICE_GENDER_UNSPECIFIED,
+    "MALE": texttospeech.SsmlVoiceGender.MALE,
+    "FEMALE": texttospeech.SsmlVoiceGender.FEMALE,
+    "NEUTRAL": texttospeech.SsmlVoiceGender.NEUTRAL,
+}
+
 # Model availability and retry configuration
 MODEL_RETRY_DELAY = int(os.environ.get("MODEL_RETRY_DELAY", "60"))  # seconds
 MODEL_CHECK_TIMEOUT = int(os.environ.get("MODEL_CHECK_TIMEOUT", "30"))  # seconds
@@ -148,12 +183,11 @@ else:
     logger.info(f"Using Azure region: {AZURE_SPEECH_REGION}")
 
 # --- Client Setup ---
-# Initialize Google Cloud Text-to-Speech client
-try:
-    tts_client = texttospeech.TextToSpeechClient()
-    logger.info("Google Cloud Text-to-Speech client initialized.")
-except Exception as e:
-    logger.error(f"Failed to initialize Google Cloud Text-to-Speech client: {e}", exc_info=True)
+# Warm Azure synthesizers for premium TTS (prewarmed in the lifespan hook)
+azure_synthesizer_pool = AzureSynthesizerPool(AZURE_SPEECH_KEY, AZURE_SPEECH_REGION)
+# Bytes per read from the Azure audio stream when premium speech is streamed to the client
+AZURE_STREAM_CHUNK_SIZE = 4096
+# The Google Cloud Text-to-Speech client is created lazily and shared in services/tts_service.py
 
 # --- System Prompt ---
 
@@ -337,13 +371,15 @@ init_conversation_db()
 
 def get_tts_gender(gender_str):
     """Map Gemini's gender string to Google TTS enum"""
-    gender_map = {
-        "SSML_VOICE_GENDER_UNSPECIFIED": texttospeech.SsmlVoiceGender.SSML_VOICE_GENDER_UNSPECIFIED,
-        "MALE": texttospeech.SsmlVoiceGender.MALE,
-        "FEMALE": texttospeech.SsmlVoiceGender.FEMALE,
-        "NEUTRAL": texttospeech.SsmlVoiceGender.NEUTRAL,
-    }
-    return gender_map.get(str(gender_str).upper(), texttospeech.SsmlVoiceGender.SSML_VOICE_GENDER_UNSPECIFIED)
+    return TTS_GENDER_MAP.get(str(gender_str).upper(), texttospeech.SsmlVoiceGender.SSML_VOICE_GENDER_UNSPECIFIED)
+
+def encode_audio_for_delivery(audio_bytes: bytes, deliver_as_url: bool) -> str:
+    """Return audio as inline base64, or store it and return a short-lived /audio/ URL"""
+    if not deliver_as_url:
+        return pybase64.b64encode_as_string(audio_bytes)
+    audio_id = uuid.uuid4().hex
+    audio_blob_cache.set(audio_id, audio_bytes)
+    return f"/audio/{audio_id}"
 
 def create_frontend_response(full_response: dict) -> dict:
     """Create a cleaned response optimized for frontend consumption"""
@@ -353,18 +389,12 @@ def create_frontend_response(full_response: dict) -> dict:
         """Get human-readable language name from Azure language dataset"""
         global azure_speech_service
         
-        if azure_speech_service and hasattr(azure_speech_service, 'languages_dataset'):
-            # Search in the loaded Azure language dataset
-            for lang in azure_speech_service.languages_dataset:
-                if lang.get('code', '').lower() == language_code.lower():
-                    return lang.get('name', language_code)
-            
-            # If not found, try matching just the base language code (e.g., 'en' from 'en-US')
-            base_code = language_code.split('-')[0].lower()
-            for lang in azure_speech_service.languages_dataset:
-                lang_base = lang.get('code', '').split('-')[0].lower()
-                if lang_base == base_code:
-                    return lang.get('name', language_code)
+        if azure_speech_service:
+            # Indexed lookup in the loaded Azure language dataset; falls back to the
+            # base language code (e.g., 'en' from 'en-US') when the locale is unknown
+            name = azure_speech_service.find_language_name(language_code)
+            if name:
+                return name
         
         # Fallback: extract readable name from code or return the code itself
         if '-' in language_code:
@@ -405,7 +435,8 @@ def create_frontend_response(full_response: dict) -> dict:
         # Session management
         "session_id": full_response.get("session_id"),
         
-        # Audio data
+        # Audio data ("audio_delivery": "url" means the audio fields are /audio/{id} URLs)
+        "audio_delivery": full_response.get("audio_delivery"),
         "translation_audio": full_response.get("translation_audio"),
         "translation_audio_mime_type": full_response.get("translation_audio_mime_type"),
         "audio_type": full_response.get("audio_type"),
@@ -453,7 +484,8 @@ def get_azure_voices():
     try:
         # Get voices from the pre-loaded dataset (synchronous access)
         if hasattr(azure_speech_service, 'voices_dataset') and azure_speech_service.voices_dataset:
-            voices = azure_speech_service.voices_dataset.copy()
+            # The service stores slotted SupportedVoice records; hand out plain dicts here
+            voices = [asdict(voice) for voice in azure_speech_service.voices_dataset]
             logger.debug(f"Retrieved {len(voices)} voices from Azure datasets")
             return voices
         else:
@@ -464,6 +496,22 @@ def get_azure_voices():
         logger.error(f"Error retrieving Azure voices from datasets: {e}", exc_info=True)
         return []
 
+@lru_cache(maxsize=1)
+def get_azure_voice_rows() -> List[Tuple[str, str, FrozenSet[str], str, str]]:
+    """Voice selection rows (language, gender, styles, shortname, display name), lowercased once"""
+    rows = []
+    for voice in get_azure_voices():
+        # Normalize voice data keys (handle both old and new formats)
+        voice_name = voice.get('shortname', voice.get('ShortName', ''))
+        rows.append((
+            voice.get('language_code', voice.get('Language', '')).lower(),
+            voice.get('gender', voice.get('Gender', '')).lower(),
+            frozenset(style.lower() for style in voice.get('styles', ())),
+            voice_name,
+            voice.get('display_name', voice_name)
+        ))
+    return rows
+
 async def generate_expert_response(query: str, context: List[ConversationItem], target_language: str) -> Dict:
     """Generate expert response using Gemini for assistant queries"""
     
@@ -490,91 +538,96 @@ async def generate_expert_response(query: str, context: List[ConversationItem],
             'error_message': str(e)
         }
 
-def synthesize_text_to_audio_gemini(text: str, language_code: str, gender: texttospeech.SsmlVoiceGender, tone: str = "neutral") -> bytes:
+async def synthesize_text_to_audio_gemini(text: str, language_code: str, gender: texttospeech.SsmlVoiceGender, tone: str = "neutral") -> bytes:
     """Converts text to speech using Microsoft Azure's TTS API with SSML for premium users."""
-    try:
-        logger.info(f"Using premium Azure TTS for language: {language_code} with tone: {tone}")
-        
-        # Extract the base language code (e.g., 'en-US' becomes 'en')
-        base_language = language_code.split('-')[0].lower()
-        gender_str = 'Female' if gender == texttospeech.SsmlVoiceGender.FEMALE else (
-            'Male' if gender == texttospeech.SsmlVoiceGender.MALE else 'Neutral')
-
-        # Get cached voices list
-        voices = get_azure_voices()
-        selected_voice = None
-        selected_voice_name = None
-        
-        # Smart voice selection with single loop and priority-based matching
-        best_match_score = 0
-        fallback_voice = None
-        fallback_voice_name = None
-        
-        for voice in voices:
-            # Normalize voice data keys (handle both old and new formats)
-            voice_lang = voice.get('language_code', voice.get('Language', '')).lower()
-            voice_gender = voice.get('gender', voice.get('Gender', '')).lower()
-            voice_name = voice.get('shortname', voice.get('ShortName', ''))
-            voice_styles = voice.get('styles', [])
-            
-            # Calculate match score
-            match_score = 0
-            
-            # Language matching (highest priority)
-            if voice_lang == language_code.lower():
-                match_score += 100  # Exact language match
-            elif voice_lang.startswith(base_language):
-                match_score += 50   # Base language match
-            elif voice_lang.startswith('en'):
-                match_score += 10   # English fallback
-            else:
-                continue  # Skip non-matching languages
-            
-            # Gender matching (medium priority)
-            if voice_gender == gender_str.lower():
-                match_score += 30
-            elif voice_gender == 'neutral':
-                match_score += 15   # Neutral is acceptable fallback
-            
-            # Style/tone matching (lower priority)
-            if tone.lower() in [s.lower() for s in voice_styles]:
-                match_score += 20
-            
-            # Update best match if this voice scores higher
-            if match_score > best_match_score:
-                best_match_score = match_score
-                selected_voice = voice_name
-                selected_voice_name = voice.get('display_name', voice_name)
-                
-                # Perfect match found (exact language + gender + style)
-                if match_score >= 150:  # 100 + 30 + 20
-                    logger.info(f"Perfect voice match found with score {match_score}")
-                    break
+    # The Azure SDK call blocks until the audio is rendered, so it runs in a worker thread
+    # and the event loop keeps serving other requests; identical concurrent requests share it
+    return await tts_audio_cache.aget_or_create(
+        (text, language_code, gender, tone, True),
+        lambda: asyncio.to_thread(_synthesize_with_azure, text, language_code, gender, tone)
+    )
+
+def _build_azure_ssml(text: str, language_code: str, gender: texttospeech.SsmlVoiceGender, tone: str) -> Tuple[str, str]:
+    """Select the premium Azure voice and build the SSML document; returns (voice name, SSML)"""
+    logger.info(f"Using premium Azure TTS for language: {language_code} with tone: {tone}")
+    
+    # Extract the base language code (e.g., 'en-US' becomes 'en')
+    base_language = base_language_code(language_code)
+    gender_str = 'Female' if gender == texttospeech.SsmlVoiceGender.FEMALE else (
+        'Male' if gender == texttospeech.SsmlVoiceGender.MALE else 'Neutral')
+
+    # Get cached, pre-lowercased voice rows
+    voice_rows = get_azure_voice_rows()
+    requested_language = language_code.lower()
+    requested_gender = gender_str.lower()
+    requested_tone = tone.lower()
+    selected_voice = None
+    selected_voice_name = None
+    
+    # Smart voice selection with single loop and priority-based matching
+    best_match_score = 0
+    fallback_voice = None
+    fallback_voice_name = None
+    
+    for voice_lang, voice_gender, voice_styles, voice_name, voice_display_name in voice_rows:
+        # Calculate match score
+        match_score = 0
+        
+        # Language matching (highest priority)
+        if voice_lang == requested_language:
+            match_score += 100  # Exact language match
+        elif voice_lang.startswith(base_language):
+            match_score += 50   # Base language match
+        elif voice_lang.startswith('en'):
+            match_score += 10   # English fallback
+        else:
+            continue  # Skip non-matching languages
+        
+        # Gender matching (medium priority)
+        if voice_gender == requested_gender:
+            match_score += 30
+        elif voice_gender == 'neutral':
+            match_score += 15   # Neutral is acceptable fallback
+        
+        # Style/tone matching (lower priority)
+        if requested_tone in voice_styles:
+            match_score += 20
+        
+        # Update best match if this voice scores higher
+        if match_score > best_match_score:
+            best_match_score = match_score
+            selected_voice = voice_name
+            selected_voice_name = voice_display_name
             
-            # Keep track of any English voice as ultimate fallback
-            if not fallback_voice and voice_lang.startswith('en'):
-                fallback_voice = voice_name
-                fallback_voice_name = voice.get('display_name', voice_name)
-        
-        # Use fallback if no suitable voice found
-        if not selected_voice:
-            if fallback_voice:
-                selected_voice = fallback_voice
-                selected_voice_name = fallback_voice_name
-                logger.warning(f"No suitable voice found for {language_code}/{gender_str}/{tone}. Using English fallback: {selected_voice}")
-            else:
-                selected_voice = 'en-US-AriaNeural'  # Ultimate fallback
-                selected_voice_name = 'Microsoft Server Speech Text to Speech Voice (en-US, AriaNeural)'
-                logger.warning(f"No voices available in dataset. Using hardcoded fallback: {selected_voice}")
+            # Perfect match found (exact language + gender + style)
+            if match_score >= 150:  # 100 + 30 + 20
+                logger.info(f"Perfect voice match found with score {match_score}")
+                break
+        
+        # Keep track of any English voice as ultimate fallback
+        if not fallback_voice and voice_lang.startswith('en'):
+            fallback_voice = voice_name
+            fallback_voice_name = voice_display_name
+    
+    # Use fallback if no suitable voice found
+    if not selected_voice:
+        if fallback_voice:
+            selected_voice = fallback_voice
+            selected_voice_name = fallback_voice_name
+            logger.warning(f"No suitable voice found for {language_code}/{gender_str}/{tone}. Using English fallback: {selected_voice}")
+        else:
+            selected_voice = 'en-US-AriaNeural'  # Ultimate fallback
+            selected_voice_name = 'Microsoft Server Speech Text to Speech Voice (en-US, AriaNeural)'
+            logger.warning(f"No voices available in dataset. Using hardcoded fallback: {selected_voice}")
 
-        logger.info(f"Selected Azure voice: {selected_voice} (score: {best_match_score}) for {gender_str} {language_code} tone {tone}")
-        
-        # Process and clean the text for SSML
-        processed_text = process_text_to_ssml(text, tone)
-        cleaned_text = fix_ssml_content(processed_text)
-        
-        # Build SSML with all recommended namespaces and proper nesting
-        ssml_text = f"""
+    logger.info(f"Selected Azure voice: {selected_voice} (score: {best_match_score}) for {gender_str} {language_code} tone {tone}")
+    
+    # Process and clean the text for SSML
+    processed_text = process_text_to_ssml(text, tone)
+    cleaned_text = fix_ssml_content(processed_text)
+    
+    # Build SSML with all recommended namespaces and proper nesting
+    ssml_text = f"""
             <speak version="1.0"
                 xmlns="http://www.w3.org/2001/10/synthesis"
                 xmlns:mstts="http://www.w3.org/2001/mstts"
@@ -585,44 +638,66 @@ def synthesize_text_to_audio_gemini(text: str, language_code: str, gender: textt
                 {cleaned_text}
             </voice>
             </speak>"""
+    return selected_voice, ssml_text
+
+def _synthesize_with_azure(text: str, language_code: str, gender: texttospeech.SsmlVoiceGender, tone: str) -> bytes:
+    """Uncached Azure premium synthesis; use synthesize_text_to_audio_gemini instead."""
+    try:
+        selected_voice, ssml_text = _build_azure_ssml(text, language_code, gender, tone)
         
-        # Initialize Azure speech config
-        speech_config = speechsdk.SpeechConfig(subscription=AZURE_SPEECH_KEY, region=AZURE_SPEECH_REGION)
-        
-        # Set speech synthesis output format to MP3
-        speech_config.set_speech_synthesis_output_format(
-            speechsdk.SpeechSynthesisOutputFormat.Audio16Khz32KBitRateMonoMp3
-        )
-        
-        # Set voice name
-        speech_config.speech_synthesis_voice_name = selected_voice
-        
-        # Create speech synthesizer with no audio output (we want the raw bytes)
-        synthesizer = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=None)
-        
-        # Request synthesis
-        logger.info(f"Sending request to Azure TTS API for {selected_voice}")
-        result = synthesizer.speak_ssml_async(ssml_text).get()
-        
-        # Check if successfully synthesized
-        if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-            logger.info(f"Successfully synthesized premium speech using Azure TTS with voice: {selected_voice}")
-            return result.audio_data  # Returns audio as bytes
-        else:
-            if result.reason == speechsdk.ResultReason.Canceled:
-                cancellation_details = result.cancellation_details
-                logger.error(f"Azure TTS API synthesis canceled: {cancellation_details.reason}")
-                if cancellation_details.error_details:
-                    logger.error(f"Azure TTS API error details: {cancellation_details.error_details}")
-                raise Exception(f"Azure TTS API error: {cancellation_details.reason} - {cancellation_details.error_details}")
+        # Borrow a pre-connected synthesizer (MP3 output; the voice is selected by the SSML)
+        with azure_synthesizer_pool.synthesizer() as synthesizer:
+            # Request synthesis
+            logger.info(f"Sending request to Azure TTS API for {selected_voice}")
+            result = synthesizer.speak_ssml_async(ssml_text).get()
+            
+            # Check if successfully synthesized (raising here drops the synthesizer from the pool)
+            if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
+                logger.info(f"Successfully synthesized premium speech using Azure TTS with voice: {selected_voice}")
+                return result.audio_data  # Returns audio as bytes
             else:
-                logger.error(f"Azure TTS API synthesis failed: {result.reason}")
-                raise Exception(f"Azure TTS API error: {result.reason}")
+                if result.reason == speechsdk.ResultReason.Canceled:
+                    _raise_for_azure_cancellation(result.cancellation_details)
+                else:
+                    logger.error(f"Azure TTS API synthesis failed: {result.reason}")
+                    raise Exception(f"Azure TTS API error: {result.reason}")
     
     except Exception as e:
         logger.error(f"Azure TTS API error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Text-to-Speech synthesis failed: {e}")
 
+def _stream_with_azure(selected_voice: str, ssml_text: str) -> Iterator[bytes]:
+    """Yield MP3 chunks from a pooled synthesizer as Azure renders them (uncached)"""
+    # Borrow a pre-connected synthesizer; closing this generator early returns or evicts it
+    with azure_synthesizer_pool.synthesizer() as synthesizer:
+        # start_speaking returns once the first audio is available, not when all of it is
+        logger.info(f"Sending streaming request to Azure TTS API for {selected_voice}")
+        result = synthesizer.start_speaking_ssml_async(ssml_text).get()
+        
+        if result.reason == speechsdk.ResultReason.Canceled:
+            _raise_for_azure_cancellation(result.cancellation_details)
+        if result.reason != speechsdk.ResultReason.SynthesizingAudioStarted:
+            logger.error(f"Azure TTS API synthesis failed: {result.reason}")
+            raise Exception(f"Azure TTS API error: {result.reason}")
+        
+        stream = speechsdk.AudioDataStream(result)
+        buffer = bytes(AZURE_STREAM_CHUNK_SIZE)
+        filled = stream.read_data(buffer)
+        while filled > 0:
+            yield buffer[:filled]
+            filled = stream.read_data(buffer)
+        
+        if stream.status == speechsdk.StreamStatus.Canceled:
+            _raise_for_azure_cancellation(stream.cancellation_details)
+        logger.info(f"Successfully streamed premium speech using Azure TTS with voice: {selected_voice}")
+
+def _raise_for_azure_cancellation(cancellation_details) -> None:
+    logger.error(f"Azure TTS API synthesis canceled: {cancellation_details.reason}")
+    if cancellation_details.error_details:
+        logger.error(f"Azure TTS API error details: {cancellation_details.error_details}")
+    raise Exception(f"Azure TTS API error: {cancellation_details.reason} - {cancellation_details.error_details}")
+
+
 # ==============================================
 # API ENDPOINTS (NO DUPLICATION)
 # ==============================================
@@ -633,7 +708,9 @@ async def process_audio(
     main_language: str = Form(...),
     other_language: str = Form(...),
     is_premium: str = Form("false"),
-    session_id: str = Form(...)  # MANDATORY session ID
+    session_id: str = Form(...),  # MANDATORY session ID
+    audio_delivery: str = Form("inline"),  # "inline" (base64) or "url" (fetch raw bytes from /audio/{id})
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key")
 ):
     # START DETAILED LATENCY TRACKING
     timing_data = audio_latency_tracker.start_timing()
@@ -648,7 +725,7 @@ async def process_audio(
     input_audio_duration_ms = 0
     
     try:
-        logger.info(f"Received file: name={file.filename}, content_type={file.content_type}, session_id={session_id}")
+        logger.info("Received file: name=%s, content_type=%s, session_id=%s", file.filename, file.content_type, session_id)
 
         # Session validation - session_id is now mandatory
         if not session_id or session_id.strip() == "":
@@ -659,7 +736,27 @@ async def process_audio(
                 detail="Session ID is required for audio processing. Frontend must provide a valid session ID."
             )
 
-        audio_content = await file.read()
+        # Client retries/resubmits carrying the same Idempotency-Key get the earlier response (skips Gemini + TTS)
+        idempotent_cache_key = None
+        if idempotency_key:
+            idempotent_cache_key = (idempotency_key, session_id, main_language, other_language, is_premium, audio_delivery)
+            cached_response = idempotent_response_cache.get(idempotent_cache_key)
+            if cached_response is not None:
+                logger.info("Idempotency-Key hit for session %s - returning cached response", session_id)
+                return cached_response
+
+        # Starlette has already spooled the multipart body to a temp file by now; the running
+        # size check only stops an oversized upload from being copied into memory
+        audio_buffer = bytearray()
+        while chunk := await file.read(AUDIO_UPLOAD_CHUNK_BYTES):
+            if len(audio_buffer) + len(chunk) > MAX_AUDIO_UPLOAD_BYTES:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Audio upload exceeds the {MAX_AUDIO_UPLOAD_BYTES // (1024 * 1024)} MB limit"
+                )
+            audio_buffer.extend(chunk)
+        audio_content = bytes(audio_buffer)
+        del audio_buffer
         content_type = file.content_type
         
         # Capture audio metrics for latency tracking
@@ -670,31 +767,23 @@ async def process_audio(
         input_audio_duration_ms = int((input_audio_size_bytes * 8) / (estimated_bitrate_kbps * 1000) * 1000) if input_audio_size_bytes > 0 else 0
 
         # Attempt to infer content type if generic or incorrect
-        if content_type == 'application/octet-stream' or not content_type.startswith('audio/'):
-             logger.warning(f"Received potentially ambiguous or non-audio content type: {content_type}. Attempting as audio/ogg.")
+        # (parameters such as ';codecs=opus' are dropped before the set lookup)
+        base_content_type = (content_type or '').partition(';')[0].strip().lower()
+        if base_content_type in ALLOWED_AUDIO_CONTENT_TYPES:
+            content_type = base_content_type
+        else:
+             logger.warning("Received potentially ambiguous or non-audio content type: %s. Attempting as audio/ogg.", content_type)
              content_type = 'audio/ogg' # Defaulting to ogg, adjust if your frontend sends a different format
         
         # Convert is_premium string to boolean
-        is_premium_bool = is_premium.lower() == "true"
+        is_premium_bool = is_premium.lower() in PREMIUM_TRUE_VALUES
+        deliver_audio_as_url = audio_delivery.lower() == "url"
         
         # Create session if it doesn't exist (for new sessions)
-        if not in_memory_sessions.sessions.get(session_id):
-            logger.info(f"Creating new session for ID: {session_id}")
-            in_memory_sessions.sessions[session_id] = {
-                "session_id": session_id,
-                "main_language": main_language,
-                "other_language": other_language,
-                "is_premium": is_premium_bool,
-                "created_at": datetime.now(),
-                "last_activity": datetime.now(),
-                "messages": [],
-                "memory_facts": {},
-                "context_references": [],
-                "message_count": 0,
-                "facts_count": 0
-            }
+        if in_memory_sessions.get_or_create_session(session_id, main_language, other_language, is_premium_bool):
+            logger.info("Created new session for ID: %s", session_id)
         else:
-            logger.info(f"Using existing session: {session_id}")
+            logger.info("Using existing session: %s", session_id)
         
         # Build enhanced prompt with session context
         enhanced_system_prompt = in_memory_sessions.build_enhanced_prompt(
@@ -707,22 +796,44 @@ async def process_audio(
         # MARK AUDIO PROCESSING START
         audio_latency_tracker.mark_audio_start(timing_data)
 
-        # Use the modular Gemini service for audio processing
-        gemini_result = process_audio_with_gemini(
-            audio_content=audio_content,
-            content_type=content_type,
-            system_prompt=enhanced_system_prompt,  # Use enhanced prompt with context
-            main_language=main_language,
-            other_language=other_language,
-            is_premium=is_premium_bool
+        # Replayed audio (retries, repeated phrases) reuses the earlier Gemini result. The prompt
+        # carries the session's facts and recent messages, which shape the result (fact_management
+        # included), so it is part of the key: a hit only happens against identical context.
+        gemini_cache_key = (
+            hashlib.sha256(audio_content).hexdigest(),
+            hashlib.sha256(enhanced_system_prompt.encode("utf-8")).hexdigest(),
+            main_language,
+            other_language,
+            is_premium_bool
         )
+        gemini_result = gemini_audio_result_cache.get(gemini_cache_key)
+        gemini_cache_hit = gemini_result is not None
+        if gemini_cache_hit:
+            logger.info("Gemini result cache hit - skipping model call")
+        else:
+            # Use the modular Gemini service for audio processing.
+            # The SDK call is blocking, so run it on a worker thread: concurrent requests
+            # then overlap their Gemini round-trips instead of queuing on the event loop.
+            gemini_result = await asyncio.to_thread(
+                process_audio_with_gemini,
+                audio_content=audio_content,
+                content_type=content_type,
+                system_prompt=enhanced_system_prompt,  # Use enhanced prompt with context
+                main_language=main_language,
+                other_language=other_language,
+                is_premium=is_premium_bool
+            )
+            if gemini_result["success"]:
+                gemini_audio_result_cache.set(gemini_cache_key, gemini_result)
         
         # MARK AUDIO PROCESSING END
         audio_latency_tracker.mark_audio_end(timing_data)
         
         # Extract token usage from Gemini response
-        gemini_input_tokens = gemini_result.get("input_tokens", 0)
-        gemini_output_tokens = gemini_result.get("output_tokens", 0)
+        # (a cache hit spent no tokens on this request)
+        if not gemini_cache_hit:
+            gemini_input_tokens = gemini_result.get("input_tokens", 0)
+            gemini_output_tokens = gemini_result.get("output_tokens", 0)
         
         # MARK TRANSLATION PROCESSING START
         audio_latency_tracker.mark_translation_start(timing_data)
@@ -752,7 +863,7 @@ async def process_audio(
                 frontend_fallback = create_frontend_response(response_json)
                 
                 # Return fallback response immediately (no TTS needed for error message)
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=503,  # Service Unavailable
                     content={
                         **frontend_fallback,
@@ -766,7 +877,7 @@ async def process_audio(
         response_text = gemini_result["response_text"]
         logger.info(f"Gemini API response received.")
         if gemini_result.get("prompt_feedback"):
-            logger.info(f"Finish reason: {gemini_result['prompt_feedback'].finish_reason}. Safety ratings: {gemini_result['prompt_feedback'].safety_ratings}")
+            logger.info("Finish reason: %s. Safety ratings: %s", gemini_result['prompt_feedback'].finish_reason, gemini_result['prompt_feedback'].safety_ratings)
 
         # --- Parse Gemini JSON Response with Robust Handling ---
         try:
@@ -774,7 +885,7 @@ async def process_audio(
             response_json["timestamp"] = datetime.utcnow().isoformat()
             logger.info("Successfully parsed and validated Gemini response")
         except Exception as e:
-            logger.warning(f"Gemini response validation failed: {e}. Creating fallback response.")
+            logger.warning("Gemini response validation failed: %s. Creating fallback response.", e)
             response_json = create_fallback_response(response_text, main_language, other_language)
             response_json["session_id"] = session_id  # Add session ID to fallback
             frontend_fallback = create_frontend_response(response_json)
@@ -804,7 +915,7 @@ async def process_audio(
         translation_audio_base64 = None
         direct_response_audio_base64 = None
 
-        logger.info(f"Processing TTS request, premium status: {is_premium_bool}")
+        logger.info("Processing TTS request, premium status: %s", is_premium_bool)
 
         # MARK AUDIO SYNTHESIS START
         audio_latency_tracker.mark_synthesis_start(timing_data)
@@ -820,22 +931,22 @@ async def process_audio(
             try:
                 if is_premium_bool:
                     try:
-                        logger.info(f"Using Azure TTS for premium user with tone: {tone}")
+                        logger.info("Using Azure TTS for premium user with tone: %s", tone)
                         text_for_tts = Translation_with_gestures if Translation_with_gestures else translation_text
                         # Apply robust SSML fixing before passing to TTS
                         processed_text = fix_ssml_content(text_for_tts)
-                        audio_content_bytes = synthesize_text_to_audio_gemini(
+                        audio_content_bytes = await synthesize_text_to_audio_gemini(
                             text=processed_text,
                             language_code=translation_language_code,
                             gender=tts_gender,
                             tone='Informative'
                         )
                     except Exception as premium_exc:
-                        logger.error(f"Premium Azure TTS failed: {premium_exc}. Falling back to standard TTS.", exc_info=True)
+                        logger.error("Premium Azure TTS failed: %s. Falling back to standard TTS.", premium_exc, exc_info=True)
                         logger.info("Falling back to standard TTS after premium TTS failure")
                         # Also apply SSML fixing for fallback
                         processed_text = fix_ssml_content(translation_text)
-                        audio_content_bytes = synthesize_text_to_audio(
+                        audio_content_bytes = await synthesize_text_to_audio(
                             text=processed_text,
                             language_code=translation_language_code,
                             gender=tts_gender
@@ -844,17 +955,17 @@ async def process_audio(
                     logger.info("Using standard TTS for non-premium user")
                     # Apply SSML fixing for standard TTS too
                     processed_text = fix_ssml_content(translation_text)
-                    audio_content_bytes = synthesize_text_to_audio(
+                    audio_content_bytes = await synthesize_text_to_audio(
                         text=processed_text,
                         language_code=translation_language_code,
                         gender=tts_gender
                     )
-                translation_audio_base64 = base64.b64encode(audio_content_bytes).decode('utf-8')
+                translation_audio_base64 = encode_audio_for_delivery(audio_content_bytes, deliver_audio_as_url)
                 logger.info("Translation audio synthesized and base64 encoded.")
             except HTTPException as http_exc:
                 raise http_exc
             except Exception as e:
-                logger.error(f"Error during Text-to-Speech synthesis or encoding: {e}", exc_info=True)
+                logger.error("Error during Text-to-Speech synthesis or encoding: %s", e, exc_info=True)
                 response_json["tts_error"] = f"Failed to generate translation audio: {str(e)}"
 
         # Synthesize AI response audio if present and is_direct_query is true
@@ -870,21 +981,21 @@ async def process_audio(
             try:
                 if is_premium_bool:
                     try:
-                        logger.info(f"Using Azure TTS for AI response (premium) with tone: {tone}")
+                        logger.info("Using Azure TTS for AI response (premium) with tone: %s", tone)
                         # Apply robust SSML fixing for AI response
                         processed_ai_response = fix_ssml_content(ai_response_text)
-                        audio_content_bytes = synthesize_text_to_audio_gemini(
+                        audio_content_bytes = await synthesize_text_to_audio_gemini(
                             text=processed_ai_response,
                             language_code=ai_response_language,
                             gender=tts_gender,
                             tone=tone
                         )
                     except Exception as premium_exc:
-                        logger.error(f"Premium Azure TTS failed for AI response: {premium_exc}. Falling back to standard TTS.", exc_info=True)
+                        logger.error("Premium Azure TTS failed for AI response: %s. Falling back to standard TTS.", premium_exc, exc_info=True)
                         logger.info("Falling back to standard TTS after premium TTS failure (AI response)")
                         # Also apply SSML fixing for fallback
                         processed_ai_response = fix_ssml_content(ai_response_text)
-                        audio_content_bytes = synthesize_text_to_audio(
+                        audio_content_bytes = await synthesize_text_to_audio(
                             text=processed_ai_response,
                             language_code=ai_response_language,
                             gender=tts_gender
@@ -893,17 +1004,17 @@ async def process_audio(
                     logger.info("Using standard TTS for AI response (non-premium)")
                     # Apply SSML fixing for standard TTS too
                     processed_ai_response = fix_ssml_content(ai_response_text)
-                    audio_content_bytes = synthesize_text_to_audio(
+                    audio_content_bytes = await synthesize_text_to_audio(
                         text=processed_ai_response,
                         language_code=ai_response_language,
                         gender=tts_gender
                     )
-                direct_response_audio_base64 = base64.b64encode(audio_content_bytes).decode('utf-8')
+                direct_response_audio_base64 = encode_audio_for_delivery(audio_content_bytes, deliver_audio_as_url)
                 logger.info("AI response audio synthesized and base64 encoded.")
             except HTTPException as http_exc:
                 raise http_exc
             except Exception as e:
-                logger.error(f"Error during TTS synthesis for AI response: {e}", exc_info=True)
+                logger.error("Error during TTS synthesis for AI response: %s", e, exc_info=True)
                 response_json["tts_error"] = f"Failed to generate AI response audio: {str(e)}"
 
             # NEW: Generate audio for AI response TRANSLATION if available
@@ -920,17 +1031,17 @@ async def process_audio(
                         try:
                             logger.info(f"Using Azure TTS for AI response translation (premium)")
                             processed_translation = fix_ssml_content(ai_answer_translated)
-                            audio_content_bytes = synthesize_text_to_audio_gemini(
+                            audio_content_bytes = await synthesize_text_to_audio_gemini(
                                 text=processed_translation,
                                 language_code=translation_language_code,
                                 gender=tts_gender,
                                 tone=tone
                             )
                         except Exception as premium_exc:
-                            logger.error(f"Premium Azure TTS failed for AI translation: {premium_exc}")
+                            logger.error("Premium Azure TTS failed for AI translation: %s", premium_exc)
                             logger.info("Falling back to standard TTS for AI translation")
                             processed_translation = fix_ssml_content(ai_answer_translated)
-                            audio_content_bytes = synthesize_text_to_audio(
+                            audio_content_bytes = await synthesize_text_to_audio(
                                 text=processed_translation,
                                 language_code=translation_language_code,
                                 gender=tts_gender
@@ -938,16 +1049,16 @@ async def process_audio(
                     else:
                         logger.info("Using standard TTS for AI response translation")
                         processed_translation = fix_ssml_content(ai_answer_translated)
-                        audio_content_bytes = synthesize_text_to_audio(
+                        audio_content_bytes = await synthesize_text_to_audio(
                             text=processed_translation,
                             language_code=translation_language_code,
                             gender=tts_gender
                         )
-                    ai_translation_audio_base64 = base64.b64encode(audio_content_bytes).decode('utf-8')
+                    ai_translation_audio_base64 = encode_audio_for_delivery(audio_content_bytes, deliver_audio_as_url)
                     logger.info("✅ AI response translation audio generated successfully")
                     
                 except Exception as e:
-                    logger.error(f"Error generating AI response translation audio: {e}")
+                    logger.error("Error generating AI response translation audio: %s", e)
                     response_json["ai_translation_tts_error"] = f"Failed to generate AI translation audio: {str(e)}"
 
         # Add audio to response with enhanced handling for AI assistant
@@ -972,6 +1083,10 @@ async def process_audio(
             logger.warning("No audio generated (neither translation nor direct_response).")
             response_json["translation_audio"] = None
 
+        if deliver_audio_as_url:
+            # Audio fields hold /audio/{id} URLs instead of base64 data
+            response_json["audio_delivery"] = "url"
+
         # --- Store conversation in session with ENHANCED fact integration ---
         def enhanced_message_storage():
             """Enhanced background task for message storage with asynchronous fact processing"""
@@ -1018,14 +1133,14 @@ async def process_audio(
                         message_type="translation"
                     )
                 
-                logger.info(f"✅ Enhanced message storage with fact processing completed for session {session_id}")
+                logger.info("✅ Enhanced message storage with fact processing completed for session %s", session_id)
             except Exception as e:
-                logger.error(f"❌ Enhanced message storage failed for session {session_id}: {e}")
+                logger.error("❌ Enhanced message storage failed for session %s: %s", session_id, e)
         
         # Start enhanced message storage in background thread (non-blocking)
         storage_thread = threading.Thread(target=enhanced_message_storage, daemon=True)
         storage_thread.start()
-        logger.info(f"🚀 Started enhanced message storage with async fact processing for session {session_id} - response will be sent immediately")
+        logger.info("🚀 Started enhanced message storage with async fact processing for session %s - response will be sent immediately", session_id)
         
         # MARK AUDIO SYNTHESIS END
         audio_latency_tracker.mark_synthesis_end(timing_data)
@@ -1035,6 +1150,8 @@ async def process_audio(
 
         # Clean up response for frontend (remove unnecessary data)
         frontend_response = create_frontend_response(response_json)
+        if idempotent_cache_key is not None:
+            idempotent_response_cache.set(idempotent_cache_key, frontend_response)
 
         logger.info("Successfully processed audio file and prepared response.")
         return frontend_response # Return the cleaned JSON response
@@ -1046,7 +1163,7 @@ async def process_audio(
     except Exception as e:
         error_occurred = True
         # Catch any other unexpected errors
-        logger.error(f"An unexpected error occurred in the main processing path: {e}", exc_info=True)
+        logger.error("An unexpected error occurred in the main processing path: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"An internal server error occurred: {str(e)}")
     
     finally:
@@ -1072,30 +1189,37 @@ async def available_languages():
     
     if azure_speech_service is None:
         logger.error("Azure Speech Language Service not initialized")
-        return JSONResponse({"error": "Azure Speech service not available"}, status_code=503)
+        return ORJSONResponse({"error": "Azure Speech service not available"}, status_code=503)
     
     try:
-        # Try to get languages from pre-loaded dataset first (synchronous)
-        if hasattr(azure_speech_service, 'languages_dataset') and azure_speech_service.languages_dataset:
-            languages = azure_speech_service.languages_dataset.copy()
-            logger.debug(f"Retrieved {len(languages)} languages from Azure datasets")
-            return JSONResponse(languages)
-        else:
-            # Fall back to async method if dataset not loaded
-            logger.info("Languages dataset not loaded, attempting async load")
-            languages = await azure_speech_service.get_supported_languages()
-            logger.debug(f"Retrieved {len(languages)} languages from Azure datasets (async)")
-            return JSONResponse(languages)
+        # The language list is serialized once at load (loading it first if needed); serve the cached bytes
+        languages_json = await azure_speech_service.get_supported_languages_json()
+        return Response(content=languages_json, media_type="application/json")
         
     except Exception as e:
-        logger.error(f"Error retrieving Azure languages from datasets: {e}", exc_info=True)
-        return JSONResponse({"error": "Failed to retrieve languages"}, status_code=500)
+        logger.error("Error retrieving Azure languages from datasets: %s", e, exc_info=True)
+        return ORJSONResponse({"error": "Failed to retrieve languages"}, status_code=500)
+
+@app.get("/audio/{audio_id}")
+async def get_audio(audio_id: str):
+    """Serve synthesized audio stored by process_audio when audio_delivery=url"""
+    audio_bytes = audio_blob_cache.get(audio_id)
+    if audio_bytes is None:
+        raise HTTPException(status_code=404, detail="Audio not found or expired")
+    return Response(content=audio_bytes, media_type=DEFAULT_AUDIO_MIME_TYPE)
 
 @app.get("/available-voices/")
-def available_voices():
-    """Return the full list of voices for the region (for use in TTS synthesis)."""
-    voices = get_azure_voices()
-    return JSONResponse(voices)
+async def available_voices(language_code: Optional[str] = None):
+    """Return the list of voices for the region (for use in TTS synthesis), optionally for one language."""
+    global azure_speech_service
+    
+    if azure_speech_service is None:
+        logger.error("Azure Speech Language Service not initialized")
+        return ORJSONResponse([])
+    
+    # The voice list is serialized once at load; serve the cached bytes as-is
+    voices_json = await azure_speech_service.get_supported_voices_json(language_code)
+    return Response(content=voices_json, media_type="application/json")
 
 @app.post("/translate-text/")
 async def translate_text(
@@ -1106,14 +1230,14 @@ async def translate_text(
 ):
     try:
         # Convert is_premium string to boolean
-        is_premium_bool = is_premium.lower() == "true"
+        is_premium_bool = is_premium.lower() in PREMIUM_TRUE_VALUES
         
         # Normalize language codes
-        source_language_normalized = source_language.lower().split('-')[0] if source_language else "en"
+        source_language_normalized = base_language_code(source_language) if source_language else "en"
         target_language_normalized = target_language  # Keep full code for TTS
         
         # Skip actual translation if source and target are the same
-        if source_language_normalized == target_language_normalized.lower().split('-')[0]:
+        if source_language_normalized == base_language_code(target_language_normalized):
             logger.info(f"Source and target languages are the same ({source_language_normalized}), skipping translation")
             translated_text = text
         else:
@@ -1131,7 +1255,7 @@ async def translate_text(
                 
                 if error_type == "translation_models_unavailable":
                     logger.error(f"All translation models unavailable: {error_message}")
-                    return JSONResponse(
+                    return ORJSONResponse(
                         status_code=503,
                         content={
                             "translation": f"Translation service is temporarily unavailable. Original text: {text}",
@@ -1163,34 +1287,34 @@ async def translate_text(
                 try:
                     # Use Azure TTS for premium users
                     logger.info("Using premium Azure TTS for welcome message")
-                    audio_content_bytes = synthesize_text_to_audio_gemini(
+                    audio_content_bytes = await synthesize_text_to_audio_gemini(
                         text=translated_text,
                         language_code=target_language_normalized,
                         gender=tts_gender,
                         tone="friendly"  # Use a friendly tone for welcome message
                     )
-                    audio_base64 = base64.b64encode(audio_content_bytes).decode('utf-8')
+                    audio_base64 = pybase64.b64encode_as_string(audio_content_bytes)
                     logger.info(f"Successfully generated premium audio, base64 length: {len(audio_base64)}")
                 except Exception as e:
                     logger.error(f"Premium TTS failed for welcome message: {e}")
                     # Fall back to standard TTS if premium fails
                     logger.info("Falling back to standard TTS")
-                    audio_content_bytes = synthesize_text_to_audio(
+                    audio_content_bytes = await synthesize_text_to_audio(
                         text=translated_text,
                         language_code=target_language_normalized,
                         gender=tts_gender
                     )
-                    audio_base64 = base64.b64encode(audio_content_bytes).decode('utf-8')
+                    audio_base64 = pybase64.b64encode_as_string(audio_content_bytes)
                     logger.info(f"Successfully generated standard audio (fallback), base64 length: {len(audio_base64)}")
             else:
                 # Standard TTS for non-premium users
                 logger.info("Using standard TTS for welcome message")
-                audio_content_bytes = synthesize_text_to_audio(
+                audio_content_bytes = await synthesize_text_to_audio(
                     text=translated_text,
                     language_code=target_language_normalized,
                     gender=tts_gender
                 )
-                audio_base64 = base64.b64encode(audio_content_bytes).decode('utf-8')
+                audio_base64 = pybase64.b64encode_as_string(audio_content_bytes)
                 logger.info(f"Successfully generated standard audio, base64 length: {len(audio_base64)}")
         except Exception as e:
             logger.error(f"All TTS methods failed: {e}")
@@ -1215,6 +1339,90 @@ async def translate_text(
         logger.error(f"Error in translate_text endpoint: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
 
+@app.post("/translate-text/stream/")
+async def translate_text_stream(
+    text: str = Form(...),
+    source_language: str = Form(...),
+    target_language: str = Form(...)
+):
+    """Stream the plain-text translation as Gemini generates it (no audio)"""
+    # Skip actual translation if source and target are the same
+    if base_language_code(source_language) == base_language_code(target_language):
+        return Response(content=text, media_type="text/plain; charset=utf-8")
+    
+    stream = translate_text_with_gemini_stream(text, source_language, target_language)
+    
+    # Wait for the first chunk before committing to a 200, so "no model available" can still be a 503
+    try:
+        first_chunk = await stream.__anext__()
+    except StopAsyncIteration:
+        first_chunk = ""
+    except Exception as e:
+        logger.error(f"Streaming translation unavailable: {e}")
+        return ORJSONResponse(
+            status_code=503,
+            content={
+                "service_status": "translation_unavailable",
+                "error_message": str(e),
+                "retry_after": MODEL_RETRY_DELAY
+            }
+        )
+    
+    async def body():
+        yield first_chunk
+        async for chunk in stream:
+            yield chunk
+    
+    return StreamingResponse(body(), media_type="text/plain; charset=utf-8")
+
+@app.post("/tts/stream/")
+async def stream_premium_tts(
+    text: str = Form(...),
+    language_code: str = Form(...),
+    gender: str = Form("NEUTRAL"),
+    tone: str = Form("neutral")
+):
+    """Stream premium Azure speech (MP3) while it is synthesized, so playback can start early"""
+    tts_gender = get_tts_gender(gender)
+    # Same SSML fixing and cache key as the premium audio in /process-audio/
+    processed_text = fix_ssml_content(text)
+    cache_key = tts_audio_cache.make_key((processed_text, language_code, tts_gender, tone, True))
+    cached_audio = await asyncio.to_thread(tts_audio_cache.get, cache_key)
+    if cached_audio is not None:
+        logger.info(f"TTS cache hit: {cache_key[:12]}")
+        return Response(content=cached_audio, media_type="audio/mpeg")
+    
+    # Wait for the first chunk before committing to a 200, so a failed synthesis is still a 500
+    try:
+        selected_voice, ssml_text = await asyncio.to_thread(_build_azure_ssml, processed_text, language_code, tts_gender, tone)
+        chunk_iter = _stream_with_azure(selected_voice, ssml_text)
+        first_chunk = await asyncio.to_thread(next, chunk_iter, b"")
+    except Exception as e:
+        logger.error(f"Azure TTS API error: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Text-to-Speech synthesis failed: {e}")
+    
+    async def body():
+        chunks = [first_chunk]
+        try:
+            yield first_chunk
+            while True:
+                # Each read blocks until Azure has rendered more audio, so it runs off the event loop
+                chunk = await asyncio.to_thread(next, chunk_iter, None)
+                if chunk is None:
+                    break
+                chunks.append(chunk)
+                yield chunk
+        except Exception as e:
+            logger.error(f"Azure TTS stream failed after {len(chunks)} chunks: {e}", exc_info=True)
+            raise
+        finally:
+            # Returns the synthesizer to the pool, or evicts it if the client disconnected early
+            await asyncio.to_thread(chunk_iter.close)
+        # Only a complete utterance is cached
+        await asyncio.to_thread(tts_audio_cache.put, cache_key, b"".join(chunks))
+    
+    return StreamingResponse(body(), media_type="audio/mpeg")
+
 # ==============================================
 # SESSION MANAGEMENT ENDPOINTS
 # ==============================================
@@ -1227,7 +1435,7 @@ async def create_session(
 ):
     """Create a new conversation session"""
     try:
-        is_premium_bool = is_premium.lower() == "true"
+        is_premium_bool = is_premium.lower() in PREMIUM_TRUE_VALUES
         
         session_id = in_memory_sessions.create_session(
             main_language=main_language,
@@ -1495,7 +1703,7 @@ async def analyze_audio_comprehensive(
         
         # Step 2: Analyze intent using AI-powered multilingual detection
         session_context = in_memory_sessions.get_session_context(sessionId) if sessionId else None
-        intent_analysis = analyze_conversation_intent_with_ai(
+        intent_analysis = analyze_conversation_intent(
             text=transcription,
             detected_language=detected_language,
             session_context=session_context
@@ -1631,7 +1839,7 @@ async def check_models_status():
                 "service_operational": available_count > 0
             }
         else:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=503,
                 content={
                     "overall_status": "error",
@@ -1643,7 +1851,7 @@ async def check_models_status():
             
     except Exception as e:
         logger.error(f"Error checking model status: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "overall_status": "error",
@@ -0,0 +1,132 @@
+"""
+Static locale name tables for the Azure speech language service
+
+Plain data only; azure_speech_language_service wraps these in read-only
+(and, for native names, interned) mappings at import.
+"""
+
+LANGUAGE_NAMES = {
+    'en': 'English', 'da': 'Danish', 'ur': 'Urdu', 'es': 'Spanish',
+    'fr': 'French', 'de': 'German', 'zh': 'Chinese', 'ja': 'Japanese',
+    'ko': 'Korean', 'ar': 'Arabic', 'hi': 'Hindi', 'it': 'Italian',
+    'pt': 'Portuguese', 'ru': 'Russian', 'nl': 'Dutch', 'sv': 'Swedish',
+    'no': 'Norwegian', 'fi': 'Finnish', 'pl': 'Polish', 'tr': 'Turkish',
+    'th': 'Thai', 'vi': 'Vietnamese', 'id': 'Indonesian', 'ms': 'Malay',
+    'he': 'Hebrew', 'fa': 'Persian', 'sw': 'Swahili', 'af': 'Afrikaans',
+    'cs': 'Czech', 'hu': 'Hungarian', 'ro': 'Romanian', 'bg': 'Bulgarian',
+    'hr': 'Croatian', 'sk': 'Slovak', 'sl': 'Slovene', 'et': 'Estonian',
+    'lv': 'Latvian', 'lt': 'Lithuanian', 'el': 'Greek', 'mt': 'Maltese',
+    'ga': 'Irish', 'cy': 'Welsh', 'is': 'Icelandic', 'mk': 'Macedonian',
+    'sq': 'Albanian', 'eu': 'Basque', 'ca': 'Catalan', 'gl': 'Galician',
+    'bn': 'Bengali', 'ta': 'Tamil', 'te': 'Telugu', 'ml': 'Malayalam',
+    'kn': 'Kannada', 'gu': 'Gujarati', 'mr': 'Marathi', 'pa': 'Punjabi',
+    'ne': 'Nepali', 'si': 'Sinhala', 'my': 'Myanmar', 'km': 'Khmer',
+    'lo': 'Lao', 'ka': 'Georgian', 'am': 'Amharic', 'zu': 'Zulu',
+    'xh': 'Xhosa', 'st': 'Southern Sotho', 'tn': 'Tswana', 've': 'Venda',
+    'ss': 'Swati', 'nr': 'Southern Ndebele', 'nso': 'Northern Sotho',
+    'ts': 'Tsonga',
+    # Additional missing languages
+    'as': 'Assamese', 'hy': 'Armenian', 'az': 'Azerbaijani', 'bs': 'Bosnian',
+    'fil': 'Filipino', 'iu': 'Inuktitut', 'ps': 'Pashto', 'jv': 'Javanese',
+    'kk': 'Kazakh', 'mn': 'Mongolian', 'nb': 'Norwegian Bokmål', 'or': 'Odia',
+    'so': 'Somali', 'sr': 'Serbian', 'su': 'Sundanese', 'uk': 'Ukrainian',
+    'uz': 'Uzbek', 'wuu': 'Wu Chinese', 'yue': 'Cantonese'
+}
+
+REGION_NAMES = {
+    # North America
+    'US': 'United States', 'CA': 'Canada', 'MX': 'Mexico',
+
+    # Europe
+    'GB': 'United Kingdom', 'IE': 'Ireland', 'FR': 'France', 'DE': 'Germany',
+    'ES': 'Spain', 'IT': 'Italy', 'PT': 'Portugal', 'NL': 'Netherlands',
+    'BE': 'Belgium', 'CH': 'Switzerland', 'AT': 'Austria', 'DK': 'Denmark',
+    'SE': 'Sweden', 'NO': 'Norway', 'FI': 'Finland', 'IS': 'Iceland',
+    'PL': 'Poland', 'CZ': 'Czech Republic', 'SK': 'Slovakia', 'HU': 'Hungary',
+    'RO': 'Romania', 'BG': 'Bulgaria', 'HR': 'Croatia', 'SI': 'Slovenia',
+    'EE': 'Estonia', 'LV': 'Latvia', 'LT': 'Lithuania', 'GR': 'Greece',
+    'MT': 'Malta', 'CY': 'Cyprus', 'AL': 'Albania', 'MK': 'Macedonia',
+    'RS': 'Serbia', 'BA': 'Bosnia and Herzegovina', 'ME': 'Montenegro',
+    'UA': 'Ukraine', 'BY': 'Belarus', 'MD': 'Moldova', 'RU': 'Russia',
+
+    # Asia-Pacific
+    'CN': 'China', 'TW': 'Taiwan', 'HK': 'Hong Kong', 'MO': 'Macau',
+    'JP': 'Japan', 'KR': 'Korea', 'IN': 'India', 'PK': 'Pakistan',
+    'BD': 'Bangladesh', 'LK': 'Sri Lanka', 'MV': 'Maldives', 'NP': 'Nepal',
+    'BT': 'Bhutan', 'AF': 'Afghanistan', 'TH': 'Thailand', 'VN': 'Vietnam',
+    'MY': 'Malaysia', 'SG': 'Singapore', 'ID': 'Indonesia', 'PH': 'Philippines',
+    'BN': 'Brunei', 'KH': 'Cambodia', 'LA': 'Laos', 'MM': 'Myanmar',
+    'AU': 'Australia', 'NZ': 'New Zealand', 'FJ': 'Fiji', 'PG': 'Papua New Guinea',
+
+    # Middle East
+    'SA': 'Saudi Arabia', 'AE': 'UAE', 'QA': 'Qatar', 'BH': 'Bahrain',
+    'KW': 'Kuwait', 'OM': 'Oman', 'YE': 'Yemen', 'IR': 'Iran',
+    'IQ': 'Iraq', 'IL': 'Israel', 'PS': 'Palestine', 'JO': 'Jordan',
+    'LB': 'Lebanon', 'SY': 'Syria', 'TR': 'Turkey', 'CY': 'Cyprus',
+    'GE': 'Georgia', 'AM': 'Armenia', 'AZ': 'Azerbaijan',
+
+    # Africa
+    'EG': 'Egypt', 'LY': 'Libya', 'TN': 'Tunisia', 'DZ': 'Algeria',
+    'MA': 'Morocco', 'SD': 'Sudan', 'SS': 'South Sudan', 'ET': 'Ethiopia',
+    'ER': 'Eritrea', 'DJ': 'Djibouti', 'SO': 'Somalia', 'KE': 'Kenya',
+    'UG': 'Uganda', 'TZ': 'Tanzania', 'RW': 'Rwanda', 'BI': 'Burundi',
+    'ZA': 'South Africa', 'NA': 'Namibia', 'BW': 'Botswana', 'ZW': 'Zimbabwe',
+    'ZM': 'Zambia', 'MW': 'Malawi', 'MZ': 'Mozambique', 'SZ': 'Eswatini',
+    'LS': 'Lesotho', 'MG': 'Madagascar', 'MU': 'Mauritius', 'SC': 'Seychelles',
+    'NG': 'Nigeria', 'GH': 'Ghana', 'CI': 'Côte d\'Ivoire', 'BF': 'Burkina Faso',
+    'ML': 'Mali', 'NE': 'Niger', 'TD': 'Chad', 'SN': 'Senegal',
+    'GM': 'Gambia', 'GW': 'Guinea-Bissau', 'GN': 'Guinea', 'SL': 'Sierra Leone',
+    'LR': 'Liberia', 'TG': 'Togo', 'BJ': 'Benin', 'CM': 'Cameroon',
+    'CF': 'Central African Republic', 'GQ': 'Equatorial Guinea', 'GA': 'Gabon',
+    'CG': 'Republic of the Congo', 'CD': 'Democratic Republic of the Congo',
+    'AO': 'Angola',
+
+    # Americas (South & Central)
+    'BR': 'Brazil', 'AR': 'Argentina', 'CL': 'Chile', 'PE': 'Peru',
+    'CO': 'Colombia', 'VE': 'Venezuela', 'EC': 'Ecuador', 'BO': 'Bolivia',
+    'PY': 'Paraguay', 'UY': 'Uruguay', 'GY': 'Guyana', 'SR': 'Suriname',
+    'GF': 'French Guiana', 'CR': 'Costa Rica', 'PA': 'Panama',
+    'NI': 'Nicaragua', 'HN': 'Honduras', 'SV': 'El Salvador', 'GT': 'Guatemala',
+    'BZ': 'Belize', 'CU': 'Cuba', 'JM': 'Jamaica', 'HT': 'Haiti',
+    'DO': 'Dominican Republic', 'PR': 'Puerto Rico', 'TT': 'Trinidad and Tobago',
+
+    # Central Asia
+    'KZ': 'Kazakhstan', 'UZ': 'Uzbekistan', 'TM': 'Turkmenistan',
+    'TJ': 'Tajikistan', 'KG': 'Kyrgyzstan', 'MN': 'Mongolia'
+}
+
+# ISO 15924 script subtags that appear in Azure locales (e.g. sr-Latn-RS, iu-Cans-CA)
+SCRIPT_NAMES = {
+    'Latn': 'Latin', 'Cyrl': 'Cyrillic', 'Cans': 'Syllabics', 'Arab': 'Arabic',
+    'Hans': 'Simplified', 'Hant': 'Traditional', 'Deva': 'Devanagari'
+}
+
+# Languages whose locales all share one native name (e.g. every 'ar-*' is العربية) are
+# keyed by base language; NATIVE_NAMES only holds the per-locale names
+NATIVE_NAMES_BY_LANGUAGE = {
+    'en': 'English', 'es': 'Español', 'fr': 'Français', 'de': 'Deutsch',
+    'ar': 'العربية', 'it': 'Italiano', 'pt': 'Português', 'nl': 'Nederlands',
+    'ur': 'اردو', 'yue': '粤语'
+}
+
+NATIVE_NAMES = {
+    'da-DK': 'Dansk',
+    'zh-CN': '中文 (简体)', 'zh-TW': '中文 (繁體)', 'zh-HK': '中文 (繁體)', 'zh-SG': '中文 (简体)',
+    'ja-JP': '日本語', 'ko-KR': '한국어', 'hi-IN': 'हिन्दी',
+    'ru-RU': 'Русский', 'sv-SE': 'Svenska',
+    'no-NO': 'Norsk', 'fi-FI': 'Suomi', 'pl-PL': 'Polski', 'tr-TR': 'Türkçe',
+    'th-TH': 'ไทย', 'vi-VN': 'Tiếng Việt', 'id-ID': 'Bahasa Indonesia',
+    'ms-MY': 'Bahasa Melayu', 'he-IL': 'עברית', 'fa-IR': 'فارسی',
+    'sw-KE': 'Kiswahili', 'af-ZA': 'Afrikaans', 'bn-IN': 'বাংলা',
+    'ta-IN': 'தமிழ்', 'te-IN': 'తెలుగు', 'ml-IN': 'മലയാളം',
+    'kn-IN': 'ಕನ್ನಡ', 'gu-IN': 'ગુજરાતી', 'mr-IN': 'मराठी',
+    'pa-IN': 'ਪੰਜਾਬੀ', 'am-ET': 'አማርኛ', 'zu-ZA': 'isiZulu',
+    # Additional missing languages
+    'as-IN': 'অসমীয়া', 'hy-AM': 'Հայերեն', 'az-AZ': 'Azərbaycan',
+    'bs-BA': 'Bosanski', 'fil-PH': 'Filipino', 'iu-Cans-CA': 'ᐃᓄᒃᑎᑐᑦ',
+    'iu-Latn-CA': 'Inuktitut', 'ps-AF': 'پښتو', 'jv-ID': 'Basa Jawa',
+    'kk-KZ': 'Қазақ тілі', 'mn-MN': 'Монгол', 'nb-NO': 'Norsk bokmål',
+    'or-IN': 'ଓଡ଼ିଆ', 'so-SO': 'Soomaaliga', 'sr-RS': 'Српски',
+    'sr-Latn-RS': 'Srpski', 'su-ID': 'Basa Sunda', 'uk-UA': 'Українська',
+    'uz-UZ': 'Oʻzbek', 'wuu-CN': '吴语'
+}
@@ -0,0 +1,91 @@
+"""
+AI assistant helpers: intent detection and conversation summaries
+"""
+import re
+import logging
+from collections import Counter
+from typing import Dict, Any, List, Optional
+
+from ..models.conversation import ConversationItem, ConversationSummary
+
+logger = logging.getLogger(__name__)
+
+# --- Precompiled patterns ---
+# One alternation regex runs the keyword scan inside re's C matcher instead of
+# a Python-level any(keyword in text) loop per message
+_ASSIST_RE = re.compile(
+    r"\b(?:help|explain|what is|how to|why|question|advice|recommend|suggest|tell me about|information|clarify)\b",
+    re.IGNORECASE
+)
+_Q_PREFIX_RE = re.compile(r"^\s*(?:what|how|why|when|where|can you)\b", re.IGNORECASE)
+
+
+def analyze_conversation_intent(
+    text: str,
+    detected_language: Optional[str] = None,
+    session_context: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Classify a message as a translation request or an assistant query
+
+    Args:
+        text: Transcribed message text
+        detected_language: Language the message was spoken in
+        session_context: Optional session context (unused by the keyword heuristic)
+
+    Returns:
+        Dict with intent, confidence, detected_domain and conversation_tone
+    """
+    keyword_match = _ASSIST_RE.search(text)
+    is_assistant_query = bool(keyword_match) or '?' in text or bool(_Q_PREFIX_RE.match(text))
+
+    if is_assistant_query:
+        intent = 'assistant_query'
+        confidence = 0.8 if keyword_match else 0.6
+    else:
+        intent = 'translation'
+        confidence = 0.9
+
+    logger.info(f"Intent analysis ({detected_language or 'unknown'}): {intent} ({confidence})")
+    return {
+        'intent': intent,
+        'confidence': confidence,
+        'detected_domain': None,
+        'conversation_tone': None
+    }
+
+
+def generate_conversation_summary(conversation: List[ConversationItem]) -> ConversationSummary:
+    """
+    Build a compact summary of a conversation for context compression
+
+    Args:
+        conversation: Ordered conversation items
+
+    Returns:
+        ConversationSummary with the most frequent topics and domain terms
+    """
+    # Single fused pass: one split per message feeds both counters and the token count
+    topic_counter: Counter = Counter()
+    domain_counter: Counter = Counter()
+    word_count = 0
+    for item in conversation:
+        words = item.text.split()
+        word_count += len(words)
+        for word in words:
+            if len(word) > 5:
+                topic_counter[word] += 1
+            if len(word) > 2 and word.isupper():
+                domain_counter[word] += 1
+
+    return ConversationSummary(
+        topics=[word for word, _ in topic_counter.most_common(10)],
+        keyDecisions=[],
+        domainTerms=[word for word, _ in domain_counter.most_common(10)],
+        timeRange={
+            "start": conversation[0].timestamp if conversation else "",
+            "end": conversation[-1].timestamp if conversation else ""
+        },
+        messageCount=len(conversation),
+        tokenEstimate=int(word_count * 1.3)  # Rough estimate, same ratio as the context endpoint
+    )
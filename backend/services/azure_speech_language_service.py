@@ -5,19 +5,180 @@ import azure.cognitiveservices.speech as speechsdk
 import logging
 import asyncio
 import os
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
-import json
+import time
+from sys import intern
+from collections import defaultdict
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Any, Tuple
+from dataclasses import dataclass
+import orjson
+import requests
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables
+from ._locale_data import LANGUAGE_NAMES, REGION_NAMES, SCRIPT_NAMES, NATIVE_NAMES_BY_LANGUAGE, NATIVE_NAMES
+
+# Load environment variables (skip the .env read when the process environment already has them)
 env_path = Path(__file__).resolve().parent.parent / '.env'
-load_dotenv(dotenv_path=env_path)
+if not os.environ.get("AZURE_SPEECH_KEY"):
+    load_dotenv(dotenv_path=env_path)
+
+_AZURE_SPEECH_KEY = os.environ.get("AZURE_SPEECH_KEY", "")
+_AZURE_SPEECH_REGION = os.environ.get("AZURE_SPEECH_REGION", "")
+# Extra regions whose voice lists are merged into the catalog (comma-separated, optional)
+_AZURE_SPEECH_VOICE_REGIONS = tuple(
+    region.strip() for region in os.environ.get("AZURE_SPEECH_VOICE_REGIONS", "").split(",") if region.strip()
+)
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Processed Azure voice catalog persisted between restarts (keyed by region, refreshed after the TTL)
+VOICES_CACHE_PATH = Path(__file__).resolve().parent / ".voices_cache.json"
+VOICES_CACHE_TTL_SECONDS = int(os.environ.get("AZURE_VOICES_CACHE_TTL_SECONDS", 24 * 60 * 60))  # 0 disables reuse
+
+# Voice list REST endpoint; answers 304 to If-None-Match when the catalog is unchanged
+VOICES_LIST_URL = "https://{region}.tts.speech.microsoft.com/cognitiveservices/voices/list"
+VOICES_LIST_TIMEOUT_SECONDS = 10
+
+# SDK gender enum -> API gender string (anything else, e.g. Unknown, is "Neutral")
+_GENDER_MAP = {
+    speechsdk.SynthesisVoiceGender.Female: "Female",
+    speechsdk.SynthesisVoiceGender.Male: "Male",
+}
+# Shared "no styles" value for the many voices without speaking styles
+_EMPTY_STYLES: Tuple[str, ...] = ()
+
+# REST gender string -> the same (shared) API gender strings
+_REST_GENDER_MAP = {"Female": "Female", "Male": "Male"}
+
+class _RawVoice(NamedTuple):
+    """One voice as listed by Azure, normalized from either the REST or the SDK listing"""
+    locale: str
+    name: str
+    short_name: str
+    local_name: str
+    gender: str
+    style_list: Tuple[str, ...]
+
+# --- Locale name tables ---
+# Data lives in _locale_data; wrapped once at import (read-only) and looked up per
+# voice while processing the Azure catalog
+
+def _interned_table(raw: Dict[str, str]) -> Mapping[str, str]:
+    """Read-only view of raw with keys and values interned (values flow into every language entry)"""
+    return MappingProxyType({intern(key): intern(value) for key, value in raw.items()})
+
+_LANGUAGE_NAMES: Mapping[str, str] = MappingProxyType(LANGUAGE_NAMES)
+_REGION_NAMES: Mapping[str, str] = MappingProxyType(REGION_NAMES)
+_SCRIPT_NAMES: Mapping[str, str] = MappingProxyType(SCRIPT_NAMES)
+_NATIVE_NAMES_BY_LANGUAGE: Mapping[str, str] = _interned_table(NATIVE_NAMES_BY_LANGUAGE)
+_NATIVE_NAMES: Mapping[str, str] = _interned_table(NATIVE_NAMES)
+
+@lru_cache(maxsize=None)
+def get_native_name(locale: str) -> str:
+    """Native language name for a locale (the tables are static, so results never go stale)"""
+    try:
+        return _NATIVE_NAMES_BY_LANGUAGE[locale.partition('-')[0]]
+    except KeyError:
+        pass
+    try:
+        return _NATIVE_NAMES[locale]
+    except KeyError:
+        return locale
+
+@lru_cache(maxsize=None)
+def _language_name(language_code: str) -> str:
+    """Friendly language name for a base language code"""
+    return _LANGUAGE_NAMES.get(language_code.lower(), language_code.upper())
+
+@lru_cache(maxsize=None)
+def _region_name(region_code: str) -> str:
+    """Friendly region name for a region code"""
+    return _REGION_NAMES.get(region_code.upper(), region_code)
+
+def _is_region_subtag(subtag: str) -> bool:
+    """BCP 47 region: two letters ('US') or three digits ('419')"""
+    return (len(subtag) == 2 and subtag.isalpha()) or (len(subtag) == 3 and subtag.isdigit())
+
+@lru_cache(maxsize=2048)
+def _describe_locale(locale: str) -> Tuple[str, str, str]:
+    """(language name, display name, region) for a locale - every voice of a locale hits the cache"""
+    base_language, *subtags = locale.split('-')  # 'en', 'da'
+    region = ""
+    # Script and dialect subtags stay in the display name so variants of one region don't collide:
+    # 'Serbian (Serbia, Latin)' for 'sr-Latn-RS', 'Chinese (China, sichuan)' for 'zh-CN-sichuan'
+    qualifiers = []
+    for subtag in subtags:
+        if not region and _is_region_subtag(subtag):
+            region = subtag
+        elif len(subtag) == 4 and subtag.isalpha():
+            qualifiers.append(_SCRIPT_NAMES.get(subtag.title(), subtag))
+        else:
+            qualifiers.append(subtag)
+    lang_name = _language_name(base_language)
+    labels = [_region_name(region)] if region else []
+    labels.extend(qualifiers)
+    display_name = f"{lang_name} ({', '.join(labels)})" if labels else lang_name
+    return lang_name, display_name, region
+
+# --- Fallback catalog (used when Azure is unavailable) ---
+# Languages are derived from the name tables above; only display names that differ
+# from the _describe_locale pattern are listed explicitly
+_FALLBACK_LANGUAGE_CODES = (
+    "en-US", "en-GB", "da-DK", "ur-PK", "ur-IN", "es-ES", "fr-FR", "de-DE", "zh-CN",
+    "ja-JP", "ko-KR", "ar-SA", "hi-IN", "it-IT", "pt-PT", "ru-RU", "nl-NL", "sv-SE",
+    "no-NO", "fi-FI", "tr-TR",
+    # Additional missing languages
+    "as-IN", "hy-AM", "az-AZ", "bs-BA", "fil-PH", "iu-Cans-CA", "iu-Latn-CA", "ps-AF",
+    "jv-ID", "kk-KZ", "mn-MN", "nb-NO", "or-IN", "so-SO", "sr-RS", "sr-Latn-RS",
+    "su-ID", "uk-UA", "uz-UZ", "wuu-CN", "yue-CN", "yue-HK",
+)
+
+_FALLBACK_DISPLAY_NAMES: Mapping[str, str] = MappingProxyType({
+    "zh-CN": "Chinese (Simplified)",
+})
+
+# (name, display_name, language_code, gender) - all Neural, 24 kHz, no styles
+_FALLBACK_VOICES = (
+    # English voices
+    ("en-US-JennyNeural", "Jenny (US)", "en-US", "Female"),
+    ("en-US-ChristopherNeural", "Christopher (US)", "en-US", "Male"),
+    ("en-GB-SoniaNeural", "Sonia (UK)", "en-GB", "Female"),
+    ("en-GB-RyanNeural", "Ryan (UK)", "en-GB", "Male"),
+    # Danish voices
+    ("da-DK-ChristelNeural", "Christel (DK)", "da-DK", "Female"),
+    ("da-DK-JeppeNeural", "Jeppe (DK)", "da-DK", "Male"),
+    # Urdu voices
+    ("ur-PK-UzmaNeural", "Uzma (PK)", "ur-PK", "Female"),
+    ("ur-PK-SalmanNeural", "Salman (PK)", "ur-PK", "Male"),
+    ("ur-IN-GulNeural", "Gul (IN)", "ur-IN", "Female"),
+    ("ur-IN-SalmanNeural", "Salman (IN)", "ur-IN", "Male"),
+    # Spanish voices
+    ("es-ES-ElviraNeural", "Elvira (ES)", "es-ES", "Female"),
+    ("es-ES-AlvaroNeural", "Alvaro (ES)", "es-ES", "Male"),
+    # French voices
+    ("fr-FR-DeniseNeural", "Denise (FR)", "fr-FR", "Female"),
+    ("fr-FR-HenriNeural", "Henri (FR)", "fr-FR", "Male"),
+    # German voices
+    ("de-DE-KatjaNeural", "Katja (DE)", "de-DE", "Female"),
+    ("de-DE-ConradNeural", "Conrad (DE)", "de-DE", "Male"),
+)
+
+def _build_fallback_language(code: str) -> Dict[str, Any]:
+    """Build a fallback language entry from its locale code"""
+    name, display_name, region = _describe_locale(code)
+    return {
+        "code": code,
+        "name": name,
+        "display_name": _FALLBACK_DISPLAY_NAMES.get(code, display_name),
+        "native_name": get_native_name(code),
+        "supports_neural": True,
+        "region": region
+    }
+
+@dataclass(slots=True)
 class SupportedLanguage:
     """Supported language information from Azure Speech Services"""
     code: str
@@ -27,29 +188,48 @@ class SupportedLanguage:
     supports_neural: bool = True
     region: str = ""
 
-@dataclass 
+@dataclass(slots=True, frozen=True)
 class SupportedVoice:
     """Supported voice information from Azure Speech Services"""
     name: str
+    shortname: str
     display_name: str
     language_code: str
     language_name: str
     gender: str
     voice_type: str  # Neural, Standard
     sample_rate_hertz: int = 24000
-    styles: List[str] = None
-    
-    def __post_init__(self):
-        if self.styles is None:
-            self.styles = []
+    styles: Tuple[str, ...] = _EMPTY_STYLES
+
+
+def _voice_from_dict(data: Dict[str, Any]) -> SupportedVoice:
+    """Rebuild a SupportedVoice from its serialized form (voices cache)"""
+    # Collapse the repeated per-voice strings: hundreds of voices share a handful of values
+    return SupportedVoice(
+        name=data["name"],
+        shortname=data["shortname"],
+        display_name=data["display_name"],
+        language_code=intern(data["language_code"]),
+        language_name=intern(data["language_name"]),
+        gender=intern(data["gender"]),
+        voice_type=intern(data["voice_type"]),
+        sample_rate_hertz=data.get("sample_rate_hertz", 24000),
+        styles=tuple(data["styles"]) if data.get("styles") else _EMPTY_STYLES
+    )
+
+# Per-language voice order: Neural before Standard, then gender, then name
+_VOICE_SORT_KEY = attrgetter("voice_type", "gender", "name")
 
 class AzureSpeechLanguageService:
     """Service for fetching supported languages and voices from Azure Speech SDK"""
     
     def __init__(self):
-        # Load environment variables
-        self.azure_speech_key = os.environ.get("AZURE_SPEECH_KEY", "")
-        self.azure_region = os.environ.get("AZURE_SPEECH_REGION", "")
+        self.azure_speech_key = _AZURE_SPEECH_KEY
+        self.azure_region = _AZURE_SPEECH_REGION
+        # Primary region first; voice lists are fetched from every region and merged
+        self.voice_regions = list(dict.fromkeys(
+            region for region in (self.azure_region, *_AZURE_SPEECH_VOICE_REGIONS) if region
+        ))
         
         # Debug logging for environment variables
         logger.info(f"Azure Speech Key found: {'Yes' if self.azure_speech_key else 'No'}")
@@ -61,9 +241,27 @@ class AzureSpeechLanguageService:
         
         # In-memory storage for MVP (loaded once on startup)
         self.languages_dataset: List[Dict[str, Any]] = []
-        self.voices_dataset: List[Dict[str, Any]] = []
-        self.voices_by_language: Dict[str, List[Dict[str, Any]]] = {}
+        self.voices_dataset: List[SupportedVoice] = []
+        self.voices_by_language: Dict[str, List[SupportedVoice]] = {}
+        self.languages_by_code: Dict[str, Dict[str, Any]] = {}
+        self._language_name_by_code: Dict[str, str] = {}
+        self._supported_codes: frozenset = frozenset()
+        self._language_name_by_base: Dict[str, str] = {}
+        # Read-only snapshots handed out by the getters (datasets are never mutated after load)
+        self._languages_snapshot: Tuple[Dict[str, Any], ...] = ()
+        self._voices_snapshot: Tuple[SupportedVoice, ...] = ()
+        self._voices_by_language_snapshot: Dict[str, Tuple[SupportedVoice, ...]] = {}
+        # Precomputed answers for get_voice_for_language_and_gender
+        self._voice_preference_index: Dict[Tuple[str, str], SupportedVoice] = {}
+        self._any_voice_for_lang: Dict[str, SupportedVoice] = {}
         self._is_loaded = False
+        self._neural_count = 0
+        # JSON bytes served directly by /available-languages/ and /available-voices/ (see _build_indexes)
+        self._languages_json: bytes = b"[]"
+        self._voices_json: bytes = b"[]"
+        self._voices_json_by_lang: Dict[str, bytes] = {}
+        # Created on first use: there may be no running event loop when the service is constructed
+        self._init_lock: Optional[asyncio.Lock] = None
         
         # Initialize speech config if available
         if self.azure_speech_key:
@@ -84,12 +282,31 @@ class AzureSpeechLanguageService:
             logger.info("📦 Datasets already loaded")
             return True
         
+        # Serialize concurrent cold-start callers so Azure is only queried once
+        # (no await between the check and the assignment, so this is race-free on the loop)
+        if self._init_lock is None:
+            self._init_lock = asyncio.Lock()
+        async with self._init_lock:
+            if self._is_loaded:
+                logger.info("📦 Datasets loaded by a concurrent initialization")
+                return True
+            return await self._initialize_datasets()
+    
+    async def _initialize_datasets(self) -> bool:
+        """Load datasets from cache, Azure or fallback data (caller holds _init_lock)"""
         logger.info("🚀 Initializing language and voice datasets on startup...")
         
         try:
             if self.speech_config:
-                # Fetch real data from Azure
-                await self._fetch_and_store_azure_data()
+                # Warm start from a fresh on-disk catalog; otherwise ask Azure, revalidating a
+                # stale catalog with its ETags so an unchanged voice list isn't downloaded again
+                cache = self._read_voices_cache()
+                if cache is not None and time.time() - cache.get("fetched_at", 0) < VOICES_CACHE_TTL_SECONDS:
+                    self._apply_voices_cache(cache)
+                else:
+                    if cache is not None:
+                        logger.info("🕒 Voices cache expired - revalidating with Azure")
+                    await self._fetch_and_store_azure_data(cache)
             else:
                 # Use fallback data
                 self._load_fallback_data()
@@ -106,72 +323,143 @@ class AzureSpeechLanguageService:
             logger.info(f"⚠️ Using fallback data: {len(self.languages_dataset)} languages")
             return False
     
-    async def _fetch_and_store_azure_data(self):
+    def _fetch_region_voices_rest(self, region: str, etag: Optional[str]) -> Tuple[Optional[List[_RawVoice]], Optional[str]]:
+        """List a region's voices over REST; returns (None, etag) when Azure answers 304 Not Modified"""
+        headers = {"Ocp-Apim-Subscription-Key": self.azure_speech_key}
+        if etag:
+            headers["If-None-Match"] = etag
+        response = requests.get(VOICES_LIST_URL.format(region=region), headers=headers, timeout=VOICES_LIST_TIMEOUT_SECONDS)
+        if response.status_code == 304:
+            return None, etag
+        response.raise_for_status()
+        voices = [
+            _RawVoice(
+                locale=voice["Locale"],
+                name=voice["Name"],
+                short_name=voice["ShortName"],
+                local_name=voice.get("LocalName", voice.get("DisplayName", voice["ShortName"])),
+                gender=_REST_GENDER_MAP.get(voice.get("Gender"), "Neutral"),
+                style_list=tuple(voice["StyleList"]) if voice.get("StyleList") else _EMPTY_STYLES
+            )
+            for voice in orjson.loads(response.content)
+        ]
+        return voices, response.headers.get("ETag")
+    
+    def _fetch_region_voices_sdk(self, region: str) -> List[_RawVoice]:
+        """List a region's voices through the Speech SDK (fallback when the REST listing fails)"""
+        # The primary region reuses the service's speech config
+        speech_config = self.speech_config if region == self.azure_region else speechsdk.SpeechConfig(
+            subscription=self.azure_speech_key,
+            region=region
+        )
+        synthesizer = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=None)
+        voices_result = synthesizer.get_voices_async().get()
+        if voices_result.reason != speechsdk.ResultReason.VoicesListRetrieved:
+            raise Exception(f"Failed to retrieve voices from Azure: {voices_result.reason}")
+        return [
+            _RawVoice(
+                locale=voice.locale,
+                name=voice.name,
+                short_name=voice.short_name,
+                local_name=voice.local_name,
+                gender=_GENDER_MAP.get(voice.gender, "Neutral"),
+                style_list=tuple(voice.style_list) if getattr(voice, 'style_list', None) else _EMPTY_STYLES
+            )
+            for voice in voices_result.voices
+        ]
+    
+    async def _fetch_region_voices(self, region: str, etag: Optional[str]) -> Tuple[Optional[List[_RawVoice]], Optional[str]]:
+        """REST listing (conditional on etag) with an SDK fallback; blocking calls run in worker threads"""
+        try:
+            return await asyncio.to_thread(self._fetch_region_voices_rest, region, etag)
+        except Exception as e:
+            logger.warning(f"⚠️ REST voice listing failed for {region} ({e}) - falling back to the Speech SDK")
+            return await asyncio.to_thread(self._fetch_region_voices_sdk, region), None
+    
+    async def _fetch_and_store_azure_data(self, cache: Optional[Dict[str, Any]] = None):
         """Fetch real data from Azure and store in memory collections"""
         logger.info("🔄 Fetching real-time data from Azure Speech Services...")
+        etags = (cache or {}).get("etags") or {}
         
-        # Create synthesizer
-        synthesizer = speechsdk.SpeechSynthesizer(
-            speech_config=self.speech_config, 
-            audio_config=None
+        # Fetch every region's voice list concurrently
+        results = await asyncio.gather(
+            *(self._fetch_region_voices(region, etags.get(region)) for region in self.voice_regions),
+            return_exceptions=True
         )
         
-        # Fetch all voices from Azure (this gives us both languages and voices)
-        def get_all_voices():
-            return synthesizer.get_voices_async().get()
+        # Every region unchanged since the cached catalog: keep it (only the timestamp moves)
+        if cache is not None and all(
+            not isinstance(result, BaseException) and result[0] is None for result in results
+        ):
+            logger.info("✅ Azure voice list unchanged (304) - reusing cached catalog")
+            self._apply_voices_cache(cache)
+            self._store_azure_data_cache(etags)
+            return
         
-        # Run in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        voices_result = await loop.run_in_executor(None, get_all_voices)
+        # Some regions changed: the cache only holds the merged catalog, so refetch the
+        # unchanged ones unconditionally
+        results = list(results)
+        for index, result in enumerate(results):
+            if not isinstance(result, BaseException) and result[0] is None:
+                try:
+                    results[index] = await self._fetch_region_voices(self.voice_regions[index], None)
+                except Exception as e:
+                    results[index] = e
         
-        if voices_result.reason != speechsdk.ResultReason.VoicesListRetrieved:
-            raise Exception(f"Failed to retrieve voices from Azure: {voices_result.reason}")
+        # Merge by short name: the same voice is usually offered in several regions
+        region_voices: List[_RawVoice] = []
+        new_etags: Dict[str, str] = {}
+        seen_short_names = set()
+        for region, result in zip(self.voice_regions, results):
+            if isinstance(result, BaseException):
+                if region == self.azure_region:
+                    raise Exception(f"Failed to retrieve voices from Azure: {result}")
+                logger.warning(f"⚠️ Skipping voices from region {region}: {result}")
+                continue
+            raw_voices, etag = result
+            if etag:
+                new_etags[region] = etag
+            for voice in raw_voices:
+                if voice.short_name not in seen_short_names:
+                    seen_short_names.add(voice.short_name)
+                    region_voices.append(voice)
         
         # Process voices and extract unique languages
-        language_map = {}
         voices = []
         
-        logger.info(f"📥 Processing {len(voices_result.voices)} voices from Azure...")
+        logger.info(f"📥 Processing {len(region_voices)} voices from {len(self.voice_regions)} Azure region(s)...")
         
-        for voice in voices_result.voices:
-            locale = voice.locale  # e.g., 'en-US', 'da-DK'
-            
-            # Extract language info if not seen before
-            if locale not in language_map:
-                language_parts = locale.split('-')
-                base_language = language_parts[0]  # 'en', 'da'
-                region = language_parts[1] if len(language_parts) > 1 else ""
-                
-                # Create language entry
-                language_map[locale] = {
-                    "code": locale,
-                    "name": self._get_language_name(base_language),
-                    "display_name": f"{self._get_language_name(base_language)} ({self._get_region_name(region)})",
-                    "native_name": self._get_native_name(locale),
-                    "supports_neural": True,
-                    "region": region
-                }
-            
-            # Parse voice gender
-            gender = "Neutral"
-            if hasattr(voice, 'gender'):
-                if voice.gender == speechsdk.SynthesisVoiceGender.Female:
-                    gender = "Female"
-                elif voice.gender == speechsdk.SynthesisVoiceGender.Male:
-                    gender = "Male"
-            
-            # Create voice entry
-            voice_info = {
-                "name": voice.name,
-                "shortname": voice.short_name,
-                "display_name": voice.local_name,
-                "language_code": locale,
-                "language_name": language_map[locale]["display_name"],
-                "gender": gender,
-                "voice_type": "Neural" if "Neural" in voice.short_name else "Standard",
-                "sample_rate_hertz": 24000,
-                "styles": getattr(voice, 'style_list', [])
+        # Pass 1: describe each distinct locale once (e.g., 'en-US', 'da-DK')
+        language_map = {}
+        for locale in {intern(voice.locale) for voice in region_voices}:
+            lang_name, display_name, region = _describe_locale(locale)
+            language_map[locale] = {
+                "code": locale,
+                "name": lang_name,
+                "display_name": display_name,
+                "native_name": get_native_name(locale),
+                "supports_neural": True,
+                "region": region
             }
+        
+        # Pass 2: build voices that reference their locale's entry
+        for voice in region_voices:
+            language = language_map[voice.locale]
+            locale = language["code"]
+            display_name = language["display_name"]
+            
+            # Create voice entry (locale, display name and gender are shared objects across voices)
+            voice_info = SupportedVoice(
+                name=voice.name,
+                shortname=voice.short_name,
+                display_name=voice.local_name,
+                language_code=locale,
+                language_name=display_name,
+                gender=voice.gender,
+                voice_type="Neural" if voice.short_name.endswith("Neural") else "Standard",
+                sample_rate_hertz=24000,
+                styles=voice.style_list
+            )
             voices.append(voice_info)
         
         # Store in datasets
@@ -181,126 +469,146 @@ class AzureSpeechLanguageService:
         # Sort languages by display name
         self.languages_dataset.sort(key=lambda l: l["display_name"])
         
-        # Sort voices: Neural first, then by language, then by gender, then by name
-        self.voices_dataset.sort(key=lambda v: (
-            v["language_code"],
-            v["voice_type"] != "Neural",
-            v["gender"],
-            v["name"]
-        ))
+        # Create voices-by-language lookup for fast access (also orders the voices)
+        self._build_indexes()
+        
+        logger.info(f"✅ Azure data processed: {len(self.languages_dataset)} languages, {len(self.voices_dataset)} voices")
+        self._store_azure_data_cache(new_etags)
+    
+    def _build_indexes(self):
+        """Build lookup structures derived from the loaded datasets"""
+        self.languages_by_code = {lang["code"]: lang for lang in self.languages_dataset}
+        # Case-insensitive name lookups: exact locale, then first language sharing the base code
+        self._language_name_by_code = {code.lower(): lang["name"] for code, lang in self.languages_by_code.items()}
+        self._language_name_by_base = {}
+        for lang in self.languages_dataset:
+            self._language_name_by_base.setdefault(lang["code"].partition('-')[0].lower(), lang["name"])
         
-        # Create voices-by-language lookup for fast access
-        self.voices_by_language = {}
+        voices_by_language: Dict[str, List[SupportedVoice]] = defaultdict(list)
         for voice in self.voices_dataset:
-            lang_code = voice["language_code"]
-            if lang_code not in self.voices_by_language:
-                self.voices_by_language[lang_code] = []
-            self.voices_by_language[lang_code].append(voice)
+            voices_by_language[voice.language_code].append(voice)
+        # Plain dict from here on so lookups of unknown codes don't insert empty lists
+        self.voices_by_language = dict(voices_by_language)
+        # A language is supported when at least one voice can speak it
+        self._supported_codes = frozenset(self.voices_by_language)
         
-        logger.info(f"✅ Azure data processed: {len(self.languages_dataset)} languages, {len(self.voices_dataset)} voices")
+        # Sort each language's voices (Neural first, then by gender, then by name) and
+        # derive the global order by chaining languages in code order - several small
+        # sorts instead of one large 4-key sort over every voice. voice_type is only ever
+        # "Neural" or "Standard", so its natural order already puts Neural first and the
+        # key can be a C-level attrgetter instead of a per-voice lambda
+        for lang_voices in self.voices_by_language.values():
+            lang_voices.sort(key=_VOICE_SORT_KEY)
+        self.voices_dataset = [
+            voice for lang_code in sorted(self.voices_by_language) for voice in self.voices_by_language[lang_code]
+        ]
+        
+        # Voice preference: first Neural voice per (language, gender); otherwise the
+        # language's first voice, which the sort above makes a Neural one when available
+        self._voice_preference_index = {}
+        self._any_voice_for_lang = {}
+        neural_count = 0
+        for lang_code, lang_voices in self.voices_by_language.items():
+            self._any_voice_for_lang[lang_code] = lang_voices[0]
+            for voice in lang_voices:
+                if voice.voice_type == "Neural":
+                    neural_count += 1
+                    self._voice_preference_index.setdefault((lang_code, voice.gender), voice)
+        self._neural_count = neural_count
+        
+        self._languages_snapshot = tuple(self.languages_dataset)
+        self._voices_snapshot = tuple(self.voices_dataset)
+        self._voices_by_language_snapshot = {code: tuple(voices) for code, voices in self.voices_by_language.items()}
+        
+        # Pre-serialized API payloads for the language and voice list endpoints
+        self._languages_json = orjson.dumps(self.languages_dataset)
+        self._voices_json = orjson.dumps(self.voices_dataset)
+        self._voices_json_by_lang = {code: orjson.dumps(voices) for code, voices in self.voices_by_language.items()}
+    
+    def _read_voices_cache(self) -> Optional[Dict[str, Any]]:
+        """Read the on-disk Azure catalog if it was built for these regions (fresh or not)"""
+        try:
+            cache = orjson.loads(VOICES_CACHE_PATH.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable voices cache: {e}")
+            return None
+        
+        if cache.get("region") != self.azure_region or cache.get("voice_regions") != self.voice_regions:
+            return None
+        return cache
+    
+    def _apply_voices_cache(self, cache: Dict[str, Any]):
+        """Load the datasets from a catalog returned by _read_voices_cache"""
+        self.languages_dataset = cache["languages"]
+        self.voices_dataset = [_voice_from_dict(voice) for voice in cache["voices"]]
+        self._build_indexes()
+        logger.info(f"📦 Loaded {len(self.languages_dataset)} languages, {len(self.voices_dataset)} voices from voices cache")
+    
+    def _store_azure_data_cache(self, etags: Dict[str, str]):
+        """Atomically persist the processed Azure catalog (and per-region ETags) for warm restarts"""
+        cache = {
+            "region": self.azure_region,
+            "voice_regions": self.voice_regions,
+            "etags": etags,
+            "fetched_at": time.time(),
+            "languages": self.languages_dataset,
+            "voices": self.voices_dataset  # orjson serializes the dataclasses natively
+        }
+        tmp_path = VOICES_CACHE_PATH.with_name(f"{VOICES_CACHE_PATH.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_bytes(orjson.dumps(cache))
+            os.replace(tmp_path, VOICES_CACHE_PATH)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to write voices cache: {e}")
+            tmp_path.unlink(missing_ok=True)
     
     def _load_fallback_data(self):
         """Load fallback data when Azure is not available"""
         logger.info("📂 Loading fallback language and voice data...")
         
         # Comprehensive fallback languages
-        self.languages_dataset = [
-            {"code": "en-US", "name": "English", "display_name": "English (United States)", "native_name": "English", "supports_neural": True, "region": "US"},
-            {"code": "en-GB", "name": "English", "display_name": "English (United Kingdom)", "native_name": "English", "supports_neural": True, "region": "GB"},
-            {"code": "da-DK", "name": "Danish", "display_name": "Danish (Denmark)", "native_name": "Dansk", "supports_neural": True, "region": "DK"},
-            {"code": "ur-PK", "name": "Urdu", "display_name": "Urdu (Pakistan)", "native_name": "اردو", "supports_neural": True, "region": "PK"},
-            {"code": "ur-IN", "name": "Urdu", "display_name": "Urdu (India)", "native_name": "اردو", "supports_neural": True, "region": "IN"},
-            {"code": "es-ES", "name": "Spanish", "display_name": "Spanish (Spain)", "native_name": "Español", "supports_neural": True, "region": "ES"},
-            {"code": "fr-FR", "name": "French", "display_name": "French (France)", "native_name": "Français", "supports_neural": True, "region": "FR"},
-            {"code": "de-DE", "name": "German", "display_name": "German (Germany)", "native_name": "Deutsch", "supports_neural": True, "region": "DE"},
-            {"code": "zh-CN", "name": "Chinese", "display_name": "Chinese (Simplified)", "native_name": "中文 (简体)", "supports_neural": True, "region": "CN"},
-            {"code": "ja-JP", "name": "Japanese", "display_name": "Japanese (Japan)", "native_name": "日本語", "supports_neural": True, "region": "JP"},
-            {"code": "ko-KR", "name": "Korean", "display_name": "Korean (Korea)", "native_name": "한국어", "supports_neural": True, "region": "KR"},
-            {"code": "ar-SA", "name": "Arabic", "display_name": "Arabic (Saudi Arabia)", "native_name": "العربية", "supports_neural": True, "region": "SA"},
-            {"code": "hi-IN", "name": "Hindi", "display_name": "Hindi (India)", "native_name": "हिन्दी", "supports_neural": True, "region": "IN"},
-            {"code": "it-IT", "name": "Italian", "display_name": "Italian (Italy)", "native_name": "Italiano", "supports_neural": True, "region": "IT"},
-            {"code": "pt-PT", "name": "Portuguese", "display_name": "Portuguese (Portugal)", "native_name": "Português", "supports_neural": True, "region": "PT"},
-            {"code": "ru-RU", "name": "Russian", "display_name": "Russian (Russia)", "native_name": "Русский", "supports_neural": True, "region": "RU"},
-            {"code": "nl-NL", "name": "Dutch", "display_name": "Dutch (Netherlands)", "native_name": "Nederlands", "supports_neural": True, "region": "NL"},
-            {"code": "sv-SE", "name": "Swedish", "display_name": "Swedish (Sweden)", "native_name": "Svenska", "supports_neural": True, "region": "SE"},
-            {"code": "no-NO", "name": "Norwegian", "display_name": "Norwegian (Norway)", "native_name": "Norsk", "supports_neural": True, "region": "NO"},
-            {"code": "fi-FI", "name": "Finnish", "display_name": "Finnish (Finland)", "native_name": "Suomi", "supports_neural": True, "region": "FI"},
-            {"code": "tr-TR", "name": "Turkish", "display_name": "Turkish (Turkey)", "native_name": "Türkçe", "supports_neural": True, "region": "TR"},
-            # Additional missing languages
-            {"code": "as-IN", "name": "Assamese", "display_name": "Assamese (India)", "native_name": "অসমীয়া", "supports_neural": True, "region": "IN"},
-            {"code": "hy-AM", "name": "Armenian", "display_name": "Armenian (Armenia)", "native_name": "Հայերեն", "supports_neural": True, "region": "AM"},
-            {"code": "az-AZ", "name": "Azerbaijani", "display_name": "Azerbaijani (Azerbaijan)", "native_name": "Azərbaycan", "supports_neural": True, "region": "AZ"},
-            {"code": "bs-BA", "name": "Bosnian", "display_name": "Bosnian (Bosnia and Herzegovina)", "native_name": "Bosanski", "supports_neural": True, "region": "BA"},
-            {"code": "fil-PH", "name": "Filipino", "display_name": "Filipino (Philippines)", "native_name": "Filipino", "supports_neural": True, "region": "PH"},
-            {"code": "iu-Cans-CA", "name": "Inuktitut", "display_name": "Inuktitut (Canada, Syllabics)", "native_name": "ᐃᓄᒃᑎᑐᑦ", "supports_neural": True, "region": "CA"},
-            {"code": "iu-Latn-CA", "name": "Inuktitut", "display_name": "Inuktitut (Canada, Latin)", "native_name": "Inuktitut", "supports_neural": True, "region": "CA"},
-            {"code": "ps-AF", "name": "Pashto", "display_name": "Pashto (Afghanistan)", "native_name": "پښتو", "supports_neural": True, "region": "AF"},
-            {"code": "jv-ID", "name": "Javanese", "display_name": "Javanese (Indonesia)", "native_name": "Basa Jawa", "supports_neural": True, "region": "ID"},
-            {"code": "kk-KZ", "name": "Kazakh", "display_name": "Kazakh (Kazakhstan)", "native_name": "Қазақ тілі", "supports_neural": True, "region": "KZ"},
-            {"code": "mn-MN", "name": "Mongolian", "display_name": "Mongolian (Mongolia)", "native_name": "Монгол", "supports_neural": True, "region": "MN"},
-            {"code": "nb-NO", "name": "Norwegian Bokmål", "display_name": "Norwegian Bokmål (Norway)", "native_name": "Norsk bokmål", "supports_neural": True, "region": "NO"},
-            {"code": "or-IN", "name": "Odia", "display_name": "Odia (India)", "native_name": "ଓଡ଼ିଆ", "supports_neural": True, "region": "IN"},
-            {"code": "so-SO", "name": "Somali", "display_name": "Somali (Somalia)", "native_name": "Soomaaliga", "supports_neural": True, "region": "SO"},
-            {"code": "sr-RS", "name": "Serbian", "display_name": "Serbian (Serbia)", "native_name": "Српски", "supports_neural": True, "region": "RS"},
-            {"code": "sr-Latn-RS", "name": "Serbian", "display_name": "Serbian (Serbia, Latin)", "native_name": "Srpski", "supports_neural": True, "region": "RS"},
-            {"code": "su-ID", "name": "Sundanese", "display_name": "Sundanese (Indonesia)", "native_name": "Basa Sunda", "supports_neural": True, "region": "ID"},
-            {"code": "uk-UA", "name": "Ukrainian", "display_name": "Ukrainian (Ukraine)", "native_name": "Українська", "supports_neural": True, "region": "UA"},
-            {"code": "uz-UZ", "name": "Uzbek", "display_name": "Uzbek (Uzbekistan)", "native_name": "Oʻzbek", "supports_neural": True, "region": "UZ"},
-            {"code": "wuu-CN", "name": "Wu Chinese", "display_name": "Wu Chinese (China)", "native_name": "吴语", "supports_neural": True, "region": "CN"},
-            {"code": "yue-CN", "name": "Cantonese", "display_name": "Cantonese (China)", "native_name": "粤语", "supports_neural": True, "region": "CN"},
-            {"code": "yue-HK", "name": "Cantonese", "display_name": "Cantonese (Hong Kong)", "native_name": "粤语", "supports_neural": True, "region": "HK"},
-        ]
+        self.languages_dataset = [_build_fallback_language(code) for code in _FALLBACK_LANGUAGE_CODES]
         
         # Comprehensive fallback voices
+        language_names = {lang["code"]: lang["display_name"] for lang in self.languages_dataset}
         self.voices_dataset = [
-            # English voices
-            {"name": "en-US-JennyNeural", "display_name": "Jenny (US)", "language_code": "en-US", "language_name": "English (United States)", "gender": "Female", "voice_type": "Neural", "sample_rate_hertz": 24000, "styles": []},
-            {"name": "en-US-ChristopherNeural", "display_name": "Christopher (US)", "language_code": "en-US", "language_name": "English (United States)", "gender": "Male", "voice_type": "Neural", "sample_rate_hertz": 24000, "styles": []},
-            {"name": "en-GB-SoniaNeural", "display_name": "Sonia (UK)", "language_code": "en-GB", "language_name": "English (United Kingdom)", "gender": "Female", "voice_type": "Neural", "sample_rate_hertz": 24000, "styles": []},
-            {"name": "en-GB-RyanNeural", "display_name": "Ryan (UK)", "language_code": "en-GB", "language_name": "English (United Kingdom)", "gender": "Male", "voice_type": "Neural", "sample_rate_hertz": 24000, "styles": []},
-            
-            # Danish voices
-            {"name": "da-DK-ChristelNeural", "display_name": "Christel (DK)", "language_code": "da-DK", "language_name": "Danish (Denmark)", "gender": "Female", "voice_type": "Neural", "sample_rate_hertz": 24000, "styles": []},
-            {"name": "da-DK-JeppeNeural", "display_name": "Jeppe (DK)", "language_code": "da-DK", "language_name": "Danish (Denmark)", "gender": "Male", "voice_type": "Neural", "sample_rate_hertz": 24000, "styles": []},
-            
-            # Urdu voices
-            {"name": "ur-PK-UzmaNeural", "display_name": "Uzma (PK)", "language_code": "ur-PK", "language_name": "Urdu (Pakistan)", "gender": "Female", "voice_type": "Neural", "sample_rate_hertz": 24000, "styles": []},
-            {"name": "ur-PK-SalmanNeural", "display_name": "Salman (PK)", "language_code": "ur-PK", "language_name": "Urdu (Pakistan)", "gender": "Male", "voice_type": "Neural", "sample_rate_hertz": 24000, "styles": []},
-            {"name": "ur-IN-GulNeural", "display_name": "Gul (IN)", "language_code": "ur-IN", "language_name": "Urdu (India)", "gender": "Female", "voice_type": "Neural", "sample_rate_hertz": 24000, "styles": []},
-            {"name": "ur-IN-SalmanNeural", "display_name": "Salman (IN)", "language_code": "ur-IN", "language_name": "Urdu (India)", "gender": "Male", "voice_type": "Neural", "sample_rate_hertz": 24000, "styles": []},
-            
-            # Spanish voices
-            {"name": "es-ES-ElviraNeural", "display_name": "Elvira (ES)", "language_code": "es-ES", "language_name": "Spanish (Spain)", "gender": "Female", "voice_type": "Neural", "sample_rate_hertz": 24000, "styles": []},
-            {"name": "es-ES-AlvaroNeural", "display_name": "Alvaro (ES)", "language_code": "es-ES", "language_name": "Spanish (Spain)", "gender": "Male", "voice_type": "Neural", "sample_rate_hertz": 24000, "styles": []},
-            
-            # French voices
-            {"name": "fr-FR-DeniseNeural", "display_name": "Denise (FR)", "language_code": "fr-FR", "language_name": "French (France)", "gender": "Female", "voice_type": "Neural", "sample_rate_hertz": 24000, "styles": []},
-            {"name": "fr-FR-HenriNeural", "display_name": "Henri (FR)", "language_code": "fr-FR", "language_name": "French (France)", "gender": "Male", "voice_type": "Neural", "sample_rate_hertz": 24000, "styles": []},
-            
-            # German voices
-            {"name": "de-DE-KatjaNeural", "display_name": "Katja (DE)", "language_code": "de-DE", "language_name": "German (Germany)", "gender": "Female", "voice_type": "Neural", "sample_rate_hertz": 24000, "styles": []},
-            {"name": "de-DE-ConradNeural", "display_name": "Conrad (DE)", "language_code": "de-DE", "language_name": "German (Germany)", "gender": "Male", "voice_type": "Neural", "sample_rate_hertz": 24000, "styles": []},
+            SupportedVoice(
+                name=name,
+                shortname=name,
+                display_name=display_name,
+                language_code=language_code,
+                language_name=language_names[language_code],
+                gender=gender,
+                voice_type="Neural"
+            )
+            for name, display_name, language_code, gender in _FALLBACK_VOICES
         ]
         
-        # Create voices-by-language lookup
-        self.voices_by_language = {}
-        for voice in self.voices_dataset:
-            lang_code = voice["language_code"]
-            if lang_code not in self.voices_by_language:
-                self.voices_by_language[lang_code] = []
-            self.voices_by_language[lang_code].append(voice)
+        # Create language and voices-by-language lookups
+        self._build_indexes()
     
-    async def get_supported_languages(self) -> List[Dict[str, Any]]:
+    async def get_supported_languages(self) -> Tuple[Dict[str, Any], ...]:
         """Get supported languages from in-memory dataset"""
         
         # Ensure datasets are loaded
         if not self._is_loaded:
             await self.initialize_datasets_on_startup()
         
-        logger.info(f"📊 Returning {len(self.languages_dataset)} languages from dataset")
-        return self.languages_dataset.copy()  # Return copy to prevent external modification
+        logger.info(f"📊 Returning {len(self._languages_snapshot)} languages from dataset")
+        return self._languages_snapshot  # Immutable snapshot - no per-call copy needed
     
-    async def get_supported_voices(self, language_code: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def get_supported_languages_json(self) -> bytes:
+        """Get supported languages as pre-serialized JSON bytes (for direct HTTP responses)"""
+        
+        # Ensure datasets are loaded
+        if not self._is_loaded:
+            await self.initialize_datasets_on_startup()
+        
+        return self._languages_json
+    
+    async def get_supported_voices(self, language_code: Optional[str] = None) -> Tuple[SupportedVoice, ...]:
         """Get supported voices from in-memory dataset"""
         
         # Ensure datasets are loaded
@@ -309,45 +617,45 @@ class AzureSpeechLanguageService:
         
         if language_code:
             # Return voices for specific language
-            voices = self.voices_by_language.get(language_code, [])
+            voices = self._voices_by_language_snapshot.get(language_code, ())
             logger.info(f"🎙️ Returning {len(voices)} voices for {language_code}")
-            return voices.copy()
+            return voices
         else:
             # Return all voices
-            logger.info(f"🎙️ Returning {len(self.voices_dataset)} total voices")
-            return self.voices_dataset.copy()
+            logger.info(f"🎙️ Returning {len(self._voices_snapshot)} total voices")
+            return self._voices_snapshot
     
-    def get_voice_for_language_and_gender(self, language_code: str, gender: str = "Female") -> Optional[Dict[str, Any]]:
-        """Get a specific voice for language and gender preference"""
-        
-        voices = self.voices_by_language.get(language_code, [])
+    async def get_supported_voices_json(self, language_code: Optional[str] = None) -> bytes:
+        """Get supported voices as pre-serialized JSON bytes (for direct HTTP responses)"""
         
-        # Try to find Neural voice with preferred gender
-        for voice in voices:
-            if voice["voice_type"] == "Neural" and voice["gender"] == gender:
-                return voice
-        
-        # Fallback: any Neural voice for this language
-        for voice in voices:
-            if voice["voice_type"] == "Neural":
-                return voice
-        
-        # Fallback: any voice for this language
-        if voices:
-            return voices[0]
+        # Ensure datasets are loaded
+        if not self._is_loaded:
+            await self.initialize_datasets_on_startup()
         
-        return None
+        if language_code:
+            return self._voices_json_by_lang.get(language_code, b"[]")
+        return self._voices_json
+    
+    def get_voice_for_language_and_gender(self, language_code: str, gender: str = "Female") -> Optional[SupportedVoice]:
+        """Get a specific voice for language and gender preference"""
+        # Neural voice with preferred gender, else any Neural voice, else any voice for this language
+        return (
+            self._voice_preference_index.get((language_code, gender))
+            or self._any_voice_for_lang.get(language_code)
+        )
     
     def get_language_info(self, language_code: str) -> Optional[Dict[str, Any]]:
         """Get language information by code"""
-        for lang in self.languages_dataset:
-            if lang["code"] == language_code:
-                return lang
-        return None
+        return self.languages_by_code.get(language_code)
+    
+    def find_language_name(self, language_code: str) -> Optional[str]:
+        """Get the language name for a locale or base code (case-insensitive), or None if unknown"""
+        code = language_code.lower()
+        return self._language_name_by_code.get(code) or self._language_name_by_base.get(code.partition('-')[0])
     
     def is_language_supported(self, language_code: str) -> bool:
         """Check if a language is supported"""
-        return language_code in self.voices_by_language
+        return language_code in self._supported_codes
     
     def get_dataset_stats(self) -> Dict[str, Any]:
         """Get statistics about loaded datasets"""
@@ -357,143 +665,18 @@ class AzureSpeechLanguageService:
             "voices_count": len(self.voices_dataset),
             "azure_available": bool(self.speech_config),
             "languages_with_voices": len(self.voices_by_language),
-            "neural_voices_count": len([v for v in self.voices_dataset if v["voice_type"] == "Neural"]),
+            "neural_voices_count": self._neural_count,
             "data_source": "Azure Speech Services" if self.speech_config else "Fallback Data"
         }
     
     def _get_language_name(self, language_code: str) -> str:
         """Get friendly language name from language code"""
-        language_names = {
-            'en': 'English', 'da': 'Danish', 'ur': 'Urdu', 'es': 'Spanish',
-            'fr': 'French', 'de': 'German', 'zh': 'Chinese', 'ja': 'Japanese',
-            'ko': 'Korean', 'ar': 'Arabic', 'hi': 'Hindi', 'it': 'Italian',
-            'pt': 'Portuguese', 'ru': 'Russian', 'nl': 'Dutch', 'sv': 'Swedish',
-            'no': 'Norwegian', 'fi': 'Finnish', 'pl': 'Polish', 'tr': 'Turkish',
-            'th': 'Thai', 'vi': 'Vietnamese', 'id': 'Indonesian', 'ms': 'Malay',
-            'he': 'Hebrew', 'fa': 'Persian', 'sw': 'Swahili', 'af': 'Afrikaans',
-            'cs': 'Czech', 'hu': 'Hungarian', 'ro': 'Romanian', 'bg': 'Bulgarian',
-            'hr': 'Croatian', 'sk': 'Slovak', 'sl': 'Slovene', 'et': 'Estonian',
-            'lv': 'Latvian', 'lt': 'Lithuanian', 'el': 'Greek', 'mt': 'Maltese',
-            'ga': 'Irish', 'cy': 'Welsh', 'is': 'Icelandic', 'mk': 'Macedonian',
-            'sq': 'Albanian', 'eu': 'Basque', 'ca': 'Catalan', 'gl': 'Galician',
-            'bn': 'Bengali', 'ta': 'Tamil', 'te': 'Telugu', 'ml': 'Malayalam',
-            'kn': 'Kannada', 'gu': 'Gujarati', 'mr': 'Marathi', 'pa': 'Punjabi',
-            'ne': 'Nepali', 'si': 'Sinhala', 'my': 'Myanmar', 'km': 'Khmer',
-            'lo': 'Lao', 'ka': 'Georgian', 'am': 'Amharic', 'zu': 'Zulu',
-            'xh': 'Xhosa', 'st': 'Southern Sotho', 'tn': 'Tswana', 've': 'Venda',
-            'ss': 'Swati', 'nr': 'Southern Ndebele', 'nso': 'Northern Sotho',
-            'ts': 'Tsonga',
-            # Additional missing languages
-            'as': 'Assamese', 'hy': 'Armenian', 'az': 'Azerbaijani', 'bs': 'Bosnian',
-            'fil': 'Filipino', 'iu': 'Inuktitut', 'ps': 'Pashto', 'jv': 'Javanese',
-            'kk': 'Kazakh', 'mn': 'Mongolian', 'nb': 'Norwegian Bokmål', 'or': 'Odia',
-            'so': 'Somali', 'sr': 'Serbian', 'su': 'Sundanese', 'uk': 'Ukrainian',
-            'uz': 'Uzbek', 'wuu': 'Wu Chinese', 'yue': 'Cantonese'
-        }
-        return language_names.get(language_code.lower(), language_code.upper())
+        return _language_name(language_code)
 
     def _get_region_name(self, region_code: str) -> str:
         """Get friendly region name from region code"""
-        region_names = {
-            # North America
-            'US': 'United States', 'CA': 'Canada', 'MX': 'Mexico',
-            
-            # Europe
-            'GB': 'United Kingdom', 'IE': 'Ireland', 'FR': 'France', 'DE': 'Germany',
-            'ES': 'Spain', 'IT': 'Italy', 'PT': 'Portugal', 'NL': 'Netherlands',
-            'BE': 'Belgium', 'CH': 'Switzerland', 'AT': 'Austria', 'DK': 'Denmark',
-            'SE': 'Sweden', 'NO': 'Norway', 'FI': 'Finland', 'IS': 'Iceland',
-            'PL': 'Poland', 'CZ': 'Czech Republic', 'SK': 'Slovakia', 'HU': 'Hungary',
-            'RO': 'Romania', 'BG': 'Bulgaria', 'HR': 'Croatia', 'SI': 'Slovenia',
-            'EE': 'Estonia', 'LV': 'Latvia', 'LT': 'Lithuania', 'GR': 'Greece',
-            'MT': 'Malta', 'CY': 'Cyprus', 'AL': 'Albania', 'MK': 'Macedonia',
-            'RS': 'Serbia', 'BA': 'Bosnia and Herzegovina', 'ME': 'Montenegro',
-            'UA': 'Ukraine', 'BY': 'Belarus', 'MD': 'Moldova', 'RU': 'Russia',
-            
-            # Asia-Pacific
-            'CN': 'China', 'TW': 'Taiwan', 'HK': 'Hong Kong', 'MO': 'Macau',
-            'JP': 'Japan', 'KR': 'Korea', 'IN': 'India', 'PK': 'Pakistan',
-            'BD': 'Bangladesh', 'LK': 'Sri Lanka', 'MV': 'Maldives', 'NP': 'Nepal',
-            'BT': 'Bhutan', 'AF': 'Afghanistan', 'TH': 'Thailand', 'VN': 'Vietnam',
-            'MY': 'Malaysia', 'SG': 'Singapore', 'ID': 'Indonesia', 'PH': 'Philippines',
-            'BN': 'Brunei', 'KH': 'Cambodia', 'LA': 'Laos', 'MM': 'Myanmar',
-            'AU': 'Australia', 'NZ': 'New Zealand', 'FJ': 'Fiji', 'PG': 'Papua New Guinea',
-            
-            # Middle East
-            'SA': 'Saudi Arabia', 'AE': 'UAE', 'QA': 'Qatar', 'BH': 'Bahrain',
-            'KW': 'Kuwait', 'OM': 'Oman', 'YE': 'Yemen', 'IR': 'Iran',
-            'IQ': 'Iraq', 'IL': 'Israel', 'PS': 'Palestine', 'JO': 'Jordan',
-            'LB': 'Lebanon', 'SY': 'Syria', 'TR': 'Turkey', 'CY': 'Cyprus',
-            'GE': 'Georgia', 'AM': 'Armenia', 'AZ': 'Azerbaijan',
-            
-            # Africa
-            'EG': 'Egypt', 'LY': 'Libya', 'TN': 'Tunisia', 'DZ': 'Algeria',
-            'MA': 'Morocco', 'SD': 'Sudan', 'SS': 'South Sudan', 'ET': 'Ethiopia',
-            'ER': 'Eritrea', 'DJ': 'Djibouti', 'SO': 'Somalia', 'KE': 'Kenya',
-            'UG': 'Uganda', 'TZ': 'Tanzania', 'RW': 'Rwanda', 'BI': 'Burundi',
-            'ZA': 'South Africa', 'NA': 'Namibia', 'BW': 'Botswana', 'ZW': 'Zimbabwe',
-            'ZM': 'Zambia', 'MW': 'Malawi', 'MZ': 'Mozambique', 'SZ': 'Eswatini',
-            'LS': 'Lesotho', 'MG': 'Madagascar', 'MU': 'Mauritius', 'SC': 'Seychelles',
-            'NG': 'Nigeria', 'GH': 'Ghana', 'CI': 'Côte d\'Ivoire', 'BF': 'Burkina Faso',
-            'ML': 'Mali', 'NE': 'Niger', 'TD': 'Chad', 'SN': 'Senegal',
-            'GM': 'Gambia', 'GW': 'Guinea-Bissau', 'GN': 'Guinea', 'SL': 'Sierra Leone',
-            'LR': 'Liberia', 'TG': 'Togo', 'BJ': 'Benin', 'CM': 'Cameroon',
-            'CF': 'Central African Republic', 'GQ': 'Equatorial Guinea', 'GA': 'Gabon',
-            'CG': 'Republic of the Congo', 'CD': 'Democratic Republic of the Congo',
-            'AO': 'Angola',
-            
-            # Americas (South & Central)
-            'BR': 'Brazil', 'AR': 'Argentina', 'CL': 'Chile', 'PE': 'Peru',
-            'CO': 'Colombia', 'VE': 'Venezuela', 'EC': 'Ecuador', 'BO': 'Bolivia',
-            'PY': 'Paraguay', 'UY': 'Uruguay', 'GY': 'Guyana', 'SR': 'Suriname',
-            'GF': 'French Guiana', 'CR': 'Costa Rica', 'PA': 'Panama',
-            'NI': 'Nicaragua', 'HN': 'Honduras', 'SV': 'El Salvador', 'GT': 'Guatemala',
-            'BZ': 'Belize', 'CU': 'Cuba', 'JM': 'Jamaica', 'HT': 'Haiti',
-            'DO': 'Dominican Republic', 'PR': 'Puerto Rico', 'TT': 'Trinidad and Tobago',
-            
-            # Central Asia
-            'KZ': 'Kazakhstan', 'UZ': 'Uzbekistan', 'TM': 'Turkmenistan',
-            'TJ': 'Tajikistan', 'KG': 'Kyrgyzstan', 'MN': 'Mongolia'
-        }
-        return region_names.get(region_code.upper(), region_code)
+        return _region_name(region_code)
 
     def _get_native_name(self, locale: str) -> str:
         """Get native language name for locale"""
-        native_names = {
-            'en-US': 'English', 'en-GB': 'English', 'en-AU': 'English', 'en-CA': 'English',
-            'en-IE': 'English', 'en-NZ': 'English', 'en-ZA': 'English', 'en-IN': 'English',
-            'da-DK': 'Dansk', 'ur-PK': 'اردو', 'ur-IN': 'اردو',             'es-ES': 'Español', 'es-MX': 'Español', 'es-AR': 'Español', 'es-CO': 'Español',
-            'es-VE': 'Español', 'es-CL': 'Español', 'es-PE': 'Español', 'es-UY': 'Español',
-            'es-EC': 'Español', 'es-BO': 'Español', 'es-PY': 'Español', 'es-CR': 'Español',
-            'es-PA': 'Español', 'es-GT': 'Español', 'es-HN': 'Español', 'es-SV': 'Español',
-            'es-NI': 'Español', 'es-DO': 'Español', 'es-CU': 'Español', 'es-PR': 'Español',
-            'fr-FR': 'Français', 'fr-CA': 'Français', 'fr-BE': 'Français', 'fr-CH': 'Français',
-            'de-DE': 'Deutsch', 'de-AT': 'Deutsch', 'de-CH': 'Deutsch',
-            'zh-CN': '中文 (简体)', 'zh-TW': '中文 (繁體)', 'zh-HK': '中文 (繁體)', 'zh-SG': '中文 (简体)',
-            'ja-JP': '日本語',             'ko-KR': '한국어', 'ar-SA': 'العربية', 'ar-EG': 'العربية', 'ar-AE': 'العربية', 'ar-BH': 'العربية',
-            'ar-QA': 'العربية', 'ar-KW': 'العربية', 'ar-OM': 'العربية', 'ar-YE': 'العربية',
-            'ar-JO': 'العربية', 'ar-LB': 'العربية', 'ar-SY': 'العربية', 'ar-IQ': 'العربية',
-            'ar-LY': 'العربية', 'ar-TN': 'العربية', 'ar-DZ': 'العربية', 'ar-MA': 'العربية',
-            'hi-IN': 'हिन्दी', 'it-IT': 'Italiano', 'it-CH': 'Italiano',
-            'pt-PT': 'Português', 'pt-BR': 'Português',
-            'ru-RU': 'Русский', 'nl-NL': 'Nederlands', 'nl-BE': 'Nederlands', 'sv-SE': 'Svenska',
-            'no-NO': 'Norsk', 'fi-FI': 'Suomi', 'pl-PL': 'Polski', 'tr-TR': 'Türkçe',
-            'th-TH': 'ไทย', 'vi-VN': 'Tiếng Việt', 'id-ID': 'Bahasa Indonesia',
-            'ms-MY': 'Bahasa Melayu', 'he-IL': 'עברית', 'fa-IR': 'فارسی',
-            'sw-KE': 'Kiswahili', 'af-ZA': 'Afrikaans', 'bn-IN': 'বাংলা',
-            'ta-IN': 'தமிழ்', 'te-IN': 'తెలుగు', 'ml-IN': 'മലയാളം',
-            'kn-IN': 'ಕನ್ನಡ', 'gu-IN': 'ગુજરાતી', 'mr-IN': 'मराठी',
-            'pa-IN': 'ਪੰਜਾਬੀ', 'am-ET': 'አማርኛ', 'zu-ZA': 'isiZulu',
-            # Additional missing languages
-            'as-IN': 'অসমীয়া', 'hy-AM': 'Հայերեն', 'az-AZ': 'Azərbaycan',
-            'bs-BA': 'Bosanski', 'fil-PH': 'Filipino', 'iu-Cans-CA': 'ᐃᓄᒃᑎᑐᑦ',
-            'iu-Latn-CA': 'Inuktitut', 'ps-AF': 'پښتو', 'jv-ID': 'Basa Jawa',
-            'kk-KZ': 'Қазақ тілі', 'mn-MN': 'Монгол', 'nb-NO': 'Norsk bokmål',
-            'or-IN': 'ଓଡ଼ିଆ', 'so-SO': 'Soomaaliga', 'sr-RS': 'Српски',
-            'sr-Latn-RS': 'Srpski', 'su-ID': 'Basa Sunda', 'uk-UA': 'Українська',
-            'uz-UZ': 'Oʻzbek', 'wuu-CN': '吴语', 'yue-CN': '粤语', 'yue-HK': '粤语'
-        }
-        return native_names.get(locale, locale)
-
-# Global instance
-azure_speech_language_service = AzureSpeechLanguageService()
+        return get_native_name(locale)
@@ -0,0 +1,99 @@
+# Azure Synthesizer Pool for A3I Translator
+# Reuses pre-connected SpeechSynthesizer instances so premium TTS skips the per-call WebSocket handshake
+
+import logging
+import random
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Iterator, Optional, Tuple
+
+import azure.cognitiveservices.speech as speechsdk
+
+logger = logging.getLogger(__name__)
+
+
+class AzureSynthesizerPool:
+    """Pool of warm SpeechSynthesizers; the voice is chosen per request in the SSML, so any instance fits"""
+
+    def __init__(
+        self,
+        subscription_key: str,
+        region: str,
+        num_prewarm: int = 3,
+        max_size: int = 8,
+        max_age_seconds: float = 10 * 60,
+        output_format=speechsdk.SpeechSynthesisOutputFormat.Audio16Khz32KBitRateMonoMp3
+    ):
+        self.subscription_key = subscription_key
+        self.region = region
+        self.num_prewarm = num_prewarm
+        self.max_size = max_size
+        self.max_age_seconds = max_age_seconds
+        self.output_format = output_format
+        self._speech_config: Optional[speechsdk.SpeechConfig] = None
+        # (synthesizer, open connection, expires_at); deque append/pop are thread-safe
+        self._idle: Deque[Tuple[speechsdk.SpeechSynthesizer, speechsdk.Connection, float]] = deque()
+
+    def _get_speech_config(self) -> speechsdk.SpeechConfig:
+        if self._speech_config is None:
+            speech_config = speechsdk.SpeechConfig(subscription=self.subscription_key, region=self.region)
+            speech_config.set_speech_synthesis_output_format(self.output_format)
+            self._speech_config = speech_config
+        return self._speech_config
+
+    def _create(self) -> Tuple[speechsdk.SpeechSynthesizer, speechsdk.Connection, float]:
+        synthesizer = speechsdk.SpeechSynthesizer(speech_config=self._get_speech_config(), audio_config=None)
+        # Open the service connection now instead of on the first speak_* call
+        connection = speechsdk.Connection.from_speech_synthesizer(synthesizer)
+        connection.open(True)
+        # Jittered lifetime so pooled connections don't all expire (and reconnect) together
+        expires_at = time.monotonic() + self.max_age_seconds * random.uniform(0.8, 1.0)
+        return synthesizer, connection, expires_at
+
+    def prewarm(self) -> None:
+        """Open num_prewarm connections up front (blocking; run off the event loop)"""
+        if not self.subscription_key:
+            logger.info("Azure synthesizer pool not prewarmed: no Azure Speech key")
+            return
+        while len(self._idle) < self.num_prewarm:
+            try:
+                self._idle.append(self._create())
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to prewarm Azure synthesizer: {e}")
+                return
+        logger.info(f"✅ Prewarmed {len(self._idle)} Azure speech synthesizers")
+
+    @contextmanager
+    def synthesizer(self) -> Iterator[speechsdk.SpeechSynthesizer]:
+        """Borrow a warm synthesizer; it is returned to the pool unless it failed or expired"""
+        entry = None
+        now = time.monotonic()
+        while entry is None:
+            try:
+                candidate = self._idle.popleft()
+            except IndexError:
+                entry = self._create()
+                break
+            if candidate[2] > now:
+                entry = candidate
+            else:
+                self._close(candidate)
+
+        try:
+            yield entry[0]
+        except BaseException:
+            self._close(entry)
+            raise
+        else:
+            if entry[2] > time.monotonic() and len(self._idle) < self.max_size:
+                self._idle.append(entry)
+            else:
+                self._close(entry)
+
+    @staticmethod
+    def _close(entry: Tuple[speechsdk.SpeechSynthesizer, speechsdk.Connection, float]) -> None:
+        try:
+            entry[1].close()
+        except Exception as e:
+            logger.debug(f"Ignoring error while closing Azure synthesizer connection: {e}")
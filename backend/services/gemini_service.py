@@ -1,11 +1,19 @@
 from google import genai
 from google.genai import types
 from google.genai.types import HarmCategory, HarmBlockThreshold, GenerateContentConfig
+import hashlib
 import os
+import random
+import textwrap
+import time
 import logging
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, AsyncIterator, Callable, Optional, Tuple
 from datetime import datetime
 
+from .response_cache import gemini_translation_cache
+
 logger = logging.getLogger(__name__)
 
 # Gemini Safety Settings
@@ -16,14 +24,118 @@ COMMON_SAFETY_SETTINGS = [
     {"category": HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT, "threshold": HarmBlockThreshold.BLOCK_NONE},
 ]
 
+# --- Model health ---
+# Models that hit quota or were unavailable: model -> (status, cooldown expiry on the
+# monotonic clock). A cooling model is tried last, so while a chain's primary model is
+# down requests go straight to the first healthy fallback instead of failing on it first.
+# Once the cooldown expires the chain's declared order applies again.
+MODEL_COOLDOWN_SECONDS = 60
+_MODEL_HEALTH: Dict[str, Tuple[str, float]] = {}
+
+def _classify_model_error(error: Exception) -> str:
+    """Map a Gemini API error to an availability status"""
+    error_msg = str(error).lower()
+    if "429" in error_msg or "quota" in error_msg:
+        return "quota_exceeded"
+    if "unavailable" in error_msg or "not found" in error_msg:
+        return "unavailable"
+    if "permission" in error_msg or "forbidden" in error_msg:
+        return "permission_denied"
+    return "error"
+
+def _ordered_models(models: List[str]) -> List[str]:
+    """Return models in their declared order, with cooling-down ones moved last"""
+    now = time.monotonic()
+    ready = []
+    cooling = []
+    for model_name in models:
+        _, expires_at = _MODEL_HEALTH.get(model_name, ("ok", 0.0))
+        if expires_at > now:
+            cooling.append(model_name)
+        else:
+            ready.append(model_name)
+    return ready + cooling
+
+def _record_model_success(model_name: str) -> None:
+    """A model that answered is healthy again, even if its cooldown hasn't expired"""
+    _MODEL_HEALTH.pop(model_name, None)
+
+def _record_model_failure(model_name: str, status: str) -> None:
+    # Generic errors may be caused by the request itself, so only availability problems cool a model down
+    if status == "error":
+        return
+    _MODEL_HEALTH[model_name] = (status, time.monotonic() + MODEL_COOLDOWN_SECONDS)
+
+# --- Request configs ---
+# GenerateContentConfig objects are never mutated by the SDK, so the fixed ones are built once
+def _audio_generation_settings(is_premium: bool) -> Dict[str, Any]:
+    return dict(
+        temperature=0.3 if is_premium else 0.4,
+        top_p=0.9 if is_premium else 0.8,
+        top_k=50 if is_premium else 40,
+        max_output_tokens=4096 if is_premium else 2048,
+        response_mime_type="application/json",
+        safety_settings=COMMON_SAFETY_SETTINGS
+    )
+
+_AUDIO_GENERATION_SETTINGS = {
+    is_premium: _audio_generation_settings(is_premium) for is_premium in (True, False)
+}
+_AUDIO_INLINE_CONFIGS = {
+    is_premium: GenerateContentConfig(**settings) for is_premium, settings in _AUDIO_GENERATION_SETTINGS.items()
+}
+_TRANSLATION_CONFIG = GenerateContentConfig(
+    temperature=0.2,  # Lower temperature for more accurate translation
+    top_p=0.95,
+    top_k=40,
+    max_output_tokens=1024,
+    safety_settings=COMMON_SAFETY_SETTINGS
+)
+_EXPERT_CONFIG = GenerateContentConfig(
+    temperature=0.7,
+    max_output_tokens=500,
+    safety_settings=COMMON_SAFETY_SETTINGS
+)
+_PROBE_CONFIG = GenerateContentConfig(
+    max_output_tokens=10,
+    temperature=0.1
+)
+
 def get_gemini_client():
     """Get configured Gemini client"""
     api_key = os.environ.get("GOOGLE_API_KEY")
     if not api_key:
         logger.error("GOOGLE_API_KEY environment variable not set - please configure in .env file")
         raise ValueError("Google API key missing - Gemini functionality unavailable")
+    return _client_for_key(api_key)
+
+@lru_cache(maxsize=1)
+def _client_for_key(api_key: str):
+    # Keyed on the key string so a rotated GOOGLE_API_KEY gets a fresh client
     return genai.Client(api_key=api_key)
 
+def _extract_text(response) -> Optional[str]:
+    """Join the first candidate's text parts (skipping thoughts), or None if it has no text"""
+    candidates = response.candidates
+    if not candidates:
+        return None
+    content = candidates[0].content
+    parts = content.parts if content else None
+    if not parts:
+        return None
+    texts = [part.text for part in parts if part.text is not None and not part.thought]
+    return "".join(texts) if texts else None
+
+def _token_counts(usage_metadata) -> Tuple[int, int, int]:
+    """Return (input, output, total) token counts; the SDK leaves unset counts as None"""
+    if not usage_metadata:
+        return 0, 0, 0
+    return (
+        usage_metadata.prompt_token_count or 0,
+        usage_metadata.candidates_token_count or 0,
+        usage_metadata.total_token_count or 0
+    )
+
 def generate_gemini_content(client, model: str, contents: List[types.Content], config: GenerateContentConfig):
     """Basic Gemini content generation"""
     try:
@@ -33,9 +145,94 @@ def generate_gemini_content(client, model: str, contents: List[types.Content], c
             config=config
         )
     except Exception as e:
-        logger.error(f"Gemini API error: {e}")
+        logger.error("Gemini API error: %s", e)
         raise
 
+# Fallback chains, best model first
+AUDIO_MODELS = [
+    "gemini-2.0-flash",
+    "gemini-1.5-flash-latest",
+    "gemini-1.5-flash",
+    "gemini-1.5-pro-latest",
+    "gemini-1.5-pro"
+]
+TRANSLATION_MODELS = [
+    "gemini-1.5-flash-latest",
+    "gemini-1.5-flash",
+    "gemini-1.5-pro-latest",
+    "gemini-1.5-pro"
+]
+
+GeminiRequest = Tuple[List[types.Content], GenerateContentConfig]
+
+def _build_audio_requests(
+    audio_content: bytes,
+    content_type: str,
+    system_prompt: str,
+    main_language: str,
+    other_language: str,
+    is_premium: bool
+) -> Tuple[GeminiRequest, GeminiRequest]:
+    """
+    Build both audio request variants once, before the fallback loop:
+    gemini-2.x gets the system prompt inlined in the user turn,
+    gemini-1.5 fallbacks get it as a proper system_instruction
+    """
+    # Prepare user message with system instructions
+    current_user_languages = f"Main Language {main_language}, {other_language}"
+    audio_part = types.Part(
+        inline_data=types.Blob(
+            mime_type=content_type,
+            data=audio_content
+        )
+    )
+
+    inline_request = (
+        [types.Content(role="user", parts=[
+            types.Part(text=f"""System Instructions:{system_prompt} User request: {current_user_languages}"""),
+            audio_part
+        ])],
+        _AUDIO_INLINE_CONFIGS[is_premium]
+    )
+    system_instruction_request = (
+        [types.Content(role="user", parts=[
+            types.Part(text=f"User request: {current_user_languages}"),
+            audio_part
+        ])],
+        # Configure based on premium status
+        GenerateContentConfig(system_instruction=system_prompt, **_AUDIO_GENERATION_SETTINGS[is_premium])
+    )
+    return inline_request, system_instruction_request
+
+# Prompt templates are dedented once at import so indentation isn't sent (and billed) as input tokens
+_TRANSLATION_PROMPT_TEMPLATE = textwrap.dedent("""
+    Translate the following text from {source_language} to {target_language}.
+    Keep the translation simple and natural, preserving the tone of the original text.
+    Return only the translated text, with no additional notes or explanations.
+
+    Text to translate: {text}
+""").strip()
+
+_EXPERT_PROMPT_TEMPLATE = textwrap.dedent("""
+    You are an expert AI assistant helping with language translation and communication.
+
+    Conversation context:
+    {context_text}
+
+    User query: {query}
+
+    Please provide a helpful, accurate response in {target_language}.
+    Be concise but informative. If this relates to translation or language learning,
+    provide practical advice.
+""").strip()
+
+def _translation_prompt(text: str, source_language: str, target_language: str) -> str:
+    return _TRANSLATION_PROMPT_TEMPLATE.format(
+        source_language=source_language,
+        target_language=target_language,
+        text=text
+    )
+
 def process_audio_with_gemini(
     audio_content: bytes, 
     content_type: str, 
@@ -61,78 +258,58 @@ def process_audio_with_gemini(
     try:
         client = get_gemini_client()
         
-        # Prepare user message with system instructions
-        current_user_languages = f"Main Language {main_language}, {other_language}"
-        enhanced_user_message = f"""System Instructions:{system_prompt} User request: {current_user_languages}"""
-
-        contents = [
-            types.Content(
-                role="user",
-                parts=[
-                    types.Part(text=enhanced_user_message),
-                    types.Part(
-                        inline_data=types.Blob(
-                            mime_type=content_type,
-                            data=audio_content
-                        )
-                    )
-                ]
-            )
-        ]
-        
-        # Configure based on premium status
-        config = GenerateContentConfig(
-            temperature=0.3 if is_premium else 0.4,
-            top_p=0.9 if is_premium else 0.8,
-            top_k=50 if is_premium else 40,
-            max_output_tokens=4096 if is_premium else 2048,
-            response_mime_type="application/json",
-            safety_settings=COMMON_SAFETY_SETTINGS
+        inline_request, system_instruction_request = _build_audio_requests(
+            audio_content, content_type, system_prompt, main_language, other_language, is_premium
         )
         
         # Model fallback chain with comprehensive error handling
-        models_to_try = [
-            "gemini-2.0-flash",
-            "gemini-1.5-flash-latest", 
-            "gemini-1.5-flash",
-            "gemini-1.5-pro-latest",
-            "gemini-1.5-pro"
-        ]
+        models_to_try = AUDIO_MODELS
         
         response = None
         last_error = None
+        quota_failures = 0
         
-        for model_name in models_to_try:
+        for model_name in _ordered_models(models_to_try):
+            contents, config = inline_request if model_name.startswith("gemini-2") else system_instruction_request
             try:
-                logger.info(f"Attempting {model_name} for audio processing")
+                logger.info("Attempting %s for audio processing", model_name)
                 response = client.models.generate_content(
                     model=model_name,
                     contents=contents,
                     config=config
                 )
-                logger.info(f"Successfully used {model_name}")
+                logger.info("Successfully used %s", model_name)
+                _record_model_success(model_name)
                 break
                 
             except Exception as e:
                 last_error = e
-                error_msg = str(e).lower()
+                status = _classify_model_error(e)
+                _record_model_failure(model_name, status)
                 
                 # Log specific error types
-                if "429" in str(e) or "quota" in error_msg:
-                    logger.warning(f"Quota exceeded for {model_name}: {e}")
-                elif "unavailable" in error_msg or "not found" in error_msg:
-                    logger.warning(f"Model {model_name} unavailable: {e}")
-                elif "permission" in error_msg or "forbidden" in error_msg:
-                    logger.warning(f"Permission denied for {model_name}: {e}")
+                if status == "quota_exceeded":
+                    logger.warning("Quota exceeded for %s: %s", model_name, e)
+                    quota_failures += 1
+                    # Persistent rate limiting: fail fast instead of tying up the worker on every fallback
+                    if quota_failures >= 2:
+                        logger.error("Repeated quota errors - giving up on remaining fallback models")
+                        break
+                    # Short jittered backoff so concurrent requests don't retry in lockstep
+                    time.sleep(random.uniform(0.1, 0.5))
+                elif status == "unavailable":
+                    logger.warning("Model %s unavailable: %s", model_name, e)
+                elif status == "permission_denied":
+                    logger.warning("Permission denied for %s: %s", model_name, e)
                 else:
-                    logger.warning(f"Error with {model_name}: {e}")
+                    logger.warning("Error with %s: %s", model_name, e)
                 
                 # Continue to next model
                 continue
         
         # If all models failed
         if response is None:
-            logger.error(f"All Gemini models failed. Last error: {last_error}")
+            logger.error("All Gemini models failed. Last error: %s", last_error)
             return {
                 "success": False,
                 "error": "all_models_unavailable",
@@ -141,7 +318,7 @@ def process_audio_with_gemini(
 
         # Validate response
         if response.prompt_feedback and response.prompt_feedback.block_reason:
-            logger.error(f"Response blocked: {response.prompt_feedback.block_reason}")
+            logger.error("Response blocked: %s", response.prompt_feedback.block_reason)
             return {
                 "success": False,
                 "error": "content_blocked",
@@ -149,7 +326,8 @@ def process_audio_with_gemini(
                 "safety_ratings": response.prompt_feedback.safety_ratings
             }
 
-        if not response.candidates or not response.candidates[0].content.parts:
+        response_text = _extract_text(response)
+        if response_text is None:
             logger.error("No content returned from Gemini")
             return {
                 "success": False,
@@ -158,18 +336,19 @@ def process_audio_with_gemini(
             }
 
         usage_metadata = getattr(response, 'usage_metadata', None)
+        input_tokens, output_tokens, total_tokens = _token_counts(usage_metadata)
         return {
             "success": True,
-             "response_text": response.candidates[0].content.parts[0].text,
-             "prompt_feedback": response.prompt_feedback,
-             "usage_metadata": usage_metadata,
-             "input_tokens": getattr(usage_metadata, 'prompt_token_count', 0) if usage_metadata else 0,
-             "output_tokens": getattr(usage_metadata, 'candidates_token_count', 0) if usage_metadata else 0,
-             "total_tokens": getattr(usage_metadata, 'total_token_count', 0) if usage_metadata else 0
+            "response_text": response_text,
+            "prompt_feedback": response.prompt_feedback,
+            "usage_metadata": usage_metadata,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": total_tokens
         }
         
     except Exception as e:
-        logger.error(f"Error in Gemini audio processing: {e}", exc_info=True)
+        logger.error("Error in Gemini audio processing: %s", e, exc_info=True)
         return {
             "success": False,
             "error": "processing_failed",
@@ -194,40 +373,33 @@ def translate_text_with_gemini(
     Returns:
         Dict containing translation result or error info
     """
+    # Translations are a pure function of (text, source, target); repeat phrases skip the API
+    cache_key = (hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(), source_language, target_language)
+    cached_translation = gemini_translation_cache.get(cache_key)
+    if cached_translation is not None:
+        logger.info("Translation cache hit for %s -> %s", source_language, target_language)
+        return {
+            "success": True,
+            "translation": cached_translation
+        }
+    
     try:
         client = get_gemini_client()
         
         # Create translation prompt
-        enhanced_user_message = f"""
-        Translate the following text from {source_language} to {target_language}.
-        Keep the translation simple and natural, preserving the tone of the original text.
-        Return only the translated text, with no additional notes or explanations.
-        
-        Text to translate: {text}
-        """
-        
-        config = GenerateContentConfig(
-            temperature=0.2,  # Lower temperature for more accurate translation
-            top_p=0.95,
-            top_k=40,
-            max_output_tokens=1024,
-            safety_settings=COMMON_SAFETY_SETTINGS
-        )
+        enhanced_user_message = _translation_prompt(text, source_language, target_language)
+        
+        config = _TRANSLATION_CONFIG
         
         # Try different models with fallback
-        models_to_try = [
-            "gemini-1.5-flash-latest",
-            "gemini-1.5-flash", 
-            "gemini-1.5-pro-latest",
-            "gemini-1.5-pro"
-        ]
+        models_to_try = TRANSLATION_MODELS
         
         response = None
         last_error = None
         
-        for model_name in models_to_try:
+        for model_name in _ordered_models(models_to_try):
             try:
-                logger.info(f"Attempting {model_name} for text translation")
+                logger.info("Attempting %s for text translation", model_name)
                 response = client.models.generate_content(
                     model=model_name,
                     contents=[types.Content(
@@ -236,17 +408,19 @@ def translate_text_with_gemini(
                     )],
                     config=config
                 )
-                logger.info(f"Successfully used {model_name} for translation")
+                logger.info("Successfully used %s for translation", model_name)
+                _record_model_success(model_name)
                 break
                 
             except Exception as e:
                 last_error = e
-                logger.warning(f"Model {model_name} failed for translation: {e}")
+                _record_model_failure(model_name, _classify_model_error(e))
+                logger.warning("Model %s failed for translation: %s", model_name, e)
                 continue
         
         # If all models failed
         if response is None:
-            logger.error(f"All translation models failed. Last error: {last_error}")
+            logger.error("All translation models failed. Last error: %s", last_error)
             return {
                 "success": False,
                 "error": "translation_models_unavailable",
@@ -254,14 +428,16 @@ def translate_text_with_gemini(
             }
         
         # Validate response
-        if not response.candidates or not response.candidates[0].content.parts:
+        translated_text = _extract_text(response)
+        if translated_text is None:
             return {
                 "success": False,
                 "error": "no_translation_returned"
             }
             
-        translated_text = response.candidates[0].content.parts[0].text.strip()
-        logger.info(f"Successfully translated text from {source_language} to {target_language}")
+        translated_text = translated_text.strip()
+        logger.info("Successfully translated text from %s to %s", source_language, target_language)
+        gemini_translation_cache.set(cache_key, translated_text)
         
         return {
             "success": True,
@@ -269,13 +445,85 @@ def translate_text_with_gemini(
         }
         
     except Exception as e:
-        logger.error(f"Error in text translation: {e}", exc_info=True)
+        logger.error("Error in text translation: %s", e, exc_info=True)
         return {
             "success": False,
             "error": "translation_failed",
             "error_message": str(e)
         }
 
+async def _stream_with_fallback(
+    models: List[str],
+    build_request: Callable[[str], GeminiRequest],
+    purpose: str,
+    usage: Optional[Dict[str, int]]
+) -> AsyncIterator[str]:
+    """
+    Yield response text chunks from the first model in the chain that answers.
+    
+    Falling back is only possible until the first chunk has been yielded; a model failing
+    mid-stream raises, since another model can't continue its partial output.
+    """
+    client = get_gemini_client()
+    last_error = None
+    
+    for model_name in _ordered_models(models):
+        contents, config = build_request(model_name)
+        usage_metadata = None
+        started = False
+        try:
+            logger.info("Attempting %s for streamed %s", model_name, purpose)
+            stream = await client.aio.models.generate_content_stream(
+                model=model_name,
+                contents=contents,
+                config=config
+            )
+            async for chunk in stream:
+                # Counts are cumulative; the last chunk that carries them has the totals
+                if chunk.usage_metadata:
+                    usage_metadata = chunk.usage_metadata
+                text = _extract_text(chunk)
+                if text:
+                    started = True
+                    yield text
+                    
+        except Exception as e:
+            _record_model_failure(model_name, _classify_model_error(e))
+            if started:
+                raise
+            last_error = e
+            logger.warning("Model %s failed for streamed %s: %s", model_name, purpose, e)
+            continue
+        
+        logger.info("Successfully streamed %s with %s", purpose, model_name)
+        _record_model_success(model_name)
+        if usage is not None:
+            usage["input_tokens"], usage["output_tokens"], usage["total_tokens"] = _token_counts(usage_metadata)
+        return
+    
+    logger.error("All Gemini models failed for streamed %s. Last error: %s", purpose, last_error)
+    raise RuntimeError(f"All Gemini models are currently unavailable. Last error: {last_error}")
+
+def translate_text_with_gemini_stream(
+    text: str,
+    source_language: str,
+    target_language: str,
+    usage: Optional[Dict[str, int]] = None
+) -> AsyncIterator[str]:
+    """
+    Streaming variant of translate_text_with_gemini; yields the translation as it is generated
+    
+    Raises RuntimeError if no model could start a response.
+    """
+    request = (
+        [types.Content(
+            role="user",
+            parts=[types.Part(text=_translation_prompt(text, source_language, target_language))]
+        )],
+        _TRANSLATION_CONFIG
+    )
+    return _stream_with_fallback(TRANSLATION_MODELS, lambda model_name: request, "translation", usage)
+
 def generate_expert_response_with_gemini(
     query: str,
     context_text: str,
@@ -296,25 +544,14 @@ def generate_expert_response_with_gemini(
         client = get_gemini_client()
         
         # Create expert prompt
-        expert_prompt = f"""
-        You are an expert AI assistant helping with language translation and communication.
-        
-        Conversation context:
-        {context_text}
-        
-        User query: {query}
-        
-        Please provide a helpful, accurate response in {target_language}. 
-        Be concise but informative. If this relates to translation or language learning,
-        provide practical advice.
-        """
-        
-        config = GenerateContentConfig(
-            temperature=0.7,
-            max_output_tokens=500,
-            safety_settings=COMMON_SAFETY_SETTINGS
+        expert_prompt = _EXPERT_PROMPT_TEMPLATE.format(
+            context_text=context_text,
+            query=query,
+            target_language=target_language
         )
         
+        config = _EXPERT_CONFIG
+        
         # Try different models with fallback
         models_to_try = [
             "gemini-1.5-flash",
@@ -326,9 +563,9 @@ def generate_expert_response_with_gemini(
         response = None
         last_error = None
         
-        for model_name in models_to_try:
+        for model_name in _ordered_models(models_to_try):
             try:
-                logger.info(f"Attempting {model_name} for expert response")
+                logger.info("Attempting %s for expert response", model_name)
                 response = client.models.generate_content(
                     model=model_name,
                     contents=[types.Content(
@@ -337,17 +574,19 @@ def generate_expert_response_with_gemini(
                     )],
                     config=config
                 )
-                logger.info(f"Successfully used {model_name} for expert response")
+                logger.info("Successfully used %s for expert response", model_name)
+                _record_model_success(model_name)
                 break
                 
             except Exception as e:
                 last_error = e
-                logger.warning(f"Model {model_name} failed for expert response: {e}")
+                _record_model_failure(model_name, _classify_model_error(e))
+                logger.warning("Model %s failed for expert response: %s", model_name, e)
                 continue
         
         # If all models failed, return graceful fallback
         if response is None:
-            logger.error(f"All expert response models failed. Last error: {last_error}")
+            logger.error("All expert response models failed. Last error: %s", last_error)
             return {
                 "success": True,  # Still return success with fallback message
                 "answer": f"I apologize, but I'm currently experiencing technical difficulties with my language models. Please try again in a few moments, or contact support if the issue persists.",
@@ -357,7 +596,7 @@ def generate_expert_response_with_gemini(
                 "error_message": f"All models unavailable: {str(last_error)}"
             }
         
-        expert_answer = response.text if response.text else "I'm not able to provide a response to that query."
+        expert_answer = _extract_text(response) or "I'm not able to provide a response to that query."
         
         return {
             "success": True,
@@ -368,7 +607,7 @@ def generate_expert_response_with_gemini(
         }
         
     except Exception as e:
-        logger.error(f"Error generating expert response: {e}", exc_info=True)
+        logger.error("Error generating expert response: %s", e, exc_info=True)
         return {
             "success": False,
             "answer": "I'm sorry, I encountered an error while processing your request.",
@@ -396,47 +635,41 @@ def check_model_availability() -> Dict[str, Any]:
             "gemini-1.5-pro"
         ]
         
-        availability = {}
-        
-        for model_name in models_to_check:
+        probe_contents = [types.Content(
+            role="user",
+            parts=[types.Part(text="Hello")]
+        )]
+
+        def probe(model_name: str) -> Dict[str, Any]:
             try:
                 # Simple test request
-                test_response = client.models.generate_content(
+                client.models.generate_content(
                     model=model_name,
-                    contents=[types.Content(
-                        role="user",
-                        parts=[types.Part(text="Hello")]
-                    )],
-                    config=GenerateContentConfig(
-                        max_output_tokens=10,
-                        temperature=0.1
-                    )
+                    contents=probe_contents,
+                    config=_PROBE_CONFIG
                 )
-                availability[model_name] = {
+                _record_model_success(model_name)
+                logger.info("Model %s is available", model_name)
+                return {
                     "available": True,
                     "status": "operational",
                     "last_checked": datetime.now().isoformat()
                 }
-                logger.info(f"Model {model_name} is available")
                 
             except Exception as e:
-                error_msg = str(e).lower()
-                if "429" in str(e) or "quota" in error_msg:
-                    status = "quota_exceeded"
-                elif "unavailable" in error_msg or "not found" in error_msg:
-                    status = "unavailable"
-                elif "permission" in error_msg:
-                    status = "permission_denied"
-                else:
-                    status = "error"
-                    
-                availability[model_name] = {
+                status = _classify_model_error(e)
+                _record_model_failure(model_name, status)
+                logger.warning("Model %s unavailable: %s", model_name, e)
+                return {
                     "available": False,
                     "status": status,
                     "error": str(e),
                     "last_checked": datetime.now().isoformat()
                 }
-                logger.warning(f"Model {model_name} unavailable: {e}")
+        
+        # Probe all models concurrently so the check takes max(latency) rather than sum(latency)
+        with ThreadPoolExecutor(max_workers=len(models_to_check)) as executor:
+            availability = dict(zip(models_to_check, executor.map(probe, models_to_check)))
         
         return {
             "success": True,
@@ -445,7 +678,7 @@ def check_model_availability() -> Dict[str, Any]:
         }
         
     except Exception as e:
-        logger.error(f"Error checking model availability: {e}")
+        logger.error("Error checking model availability: %s", e)
         return {
             "success": False,
             "error": str(e),
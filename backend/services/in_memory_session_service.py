@@ -1,25 +1,46 @@
 # In-Memory Session Service for A3I Translator
 # Handles session-scoped conversation memory and context management
 
-import json
+import bisect
+import re
+import sys
 import uuid
 import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from pathlib import Path
 import logging
 
+import orjson
+
 # Import the Gemini service
 from .gemini_service import get_gemini_client
 
 logger = logging.getLogger(__name__)
 
 class InMemorySessionService:
+    """
+    Session store tuned for read-mostly access (read-copy-update).
+    
+    Readers never lock: they load self.sessions (and a session's memory_facts) once and
+    work on that snapshot. Writers build a modified copy and publish it with a single
+    attribute/key store, so a reader sees either the old or the new dict, never one being
+    changed. Published fact dicts are replaced rather than mutated, and a session's
+    messages list is only ever appended to.
+    
+    Writers that touch one session hold only that session's "_lock", so different sessions
+    never contend. self.lock guards the top-level sessions dict (adding and removing
+    sessions); when both are needed it is taken first, then the session lock.
+    """
+    
     def __init__(self, export_directory: str = "conversation_exports"):
-        self.sessions: Dict[str, Dict] = {}  # session_id -> session_data
+        self.sessions: Dict[str, Dict] = {}  # session_id -> session_data (replaced, never mutated)
         self.export_dir = Path(export_directory)
         self.export_dir.mkdir(exist_ok=True)
-        self.lock = threading.RLock()  # Thread-safe operations
+        # Serializes session creation/removal; readers don't take it. Not reentrant: methods
+        # that run under it call *_nolock helpers rather than other locking methods
+        self.lock = threading.Lock()
         
         # Session configuration
         self.max_session_duration = timedelta(hours=4)  # Auto-cleanup after 4 hours
@@ -40,23 +61,124 @@ class InMemorySessionService:
         session_id = str(uuid.uuid4())
         
         with self.lock:
-            self.sessions[session_id] = {
-                "session_id": session_id,
-                "main_language": main_language,
-                "other_language": other_language,
-                "is_premium": is_premium,
-                "created_at": datetime.now(),
-                "last_activity": datetime.now(),
-                "messages": [],  # List of conversation messages
-                "memory_facts": {},  # Dictionary of extracted facts
-                "context_references": [],  # List of message references
-                "message_count": 0,
-                "facts_count": 0
-            }
+            self._publish_session(session_id, self._new_session(session_id, main_language, other_language, is_premium))
         
         logger.info(f"Created in-memory session: {session_id}")
         return session_id
     
+    def get_or_create_session(
+        self,
+        session_id: str,
+        main_language: str,
+        other_language: str,
+        is_premium: bool = False
+    ) -> bool:
+        """Ensure a session with a client-chosen ID exists; returns True if it was created"""
+        if session_id in self.sessions:
+            return False
+        
+        with self.lock:
+            # Re-check under the writer lock: another request may have created it meanwhile
+            if session_id in self.sessions:
+                return False
+            self._publish_session(session_id, self._new_session(session_id, main_language, other_language, is_premium))
+        
+        logger.info(f"Created in-memory session: {session_id}")
+        return True
+    
+    @staticmethod
+    def _new_session(session_id: str, main_language: str, other_language: str, is_premium: bool) -> Dict[str, Any]:
+        now = datetime.now()
+        return {
+            "session_id": session_id,
+            "main_language": main_language,
+            "other_language": other_language,
+            "is_premium": is_premium,
+            "created_at": now,
+            "last_activity": now,
+            "messages": [],  # List of conversation messages (append-only)
+            "_message_times": [],  # Parallel list of message datetimes, for bisecting the sliding window
+            "memory_facts": {},  # Dictionary of extracted facts (copy-on-write)
+            "_fact_index": InMemorySessionService._index_facts({}),  # Views derived from memory_facts
+            "context_references": [],  # List of message references
+            "message_count": 0,
+            "facts_count": 0,
+            "_lock": threading.Lock()  # Per-session writer lock (not exported)
+        }
+    
+    def _publish_session(self, session_id: str, session: Dict[str, Any]) -> None:
+        """Publish a copy of the sessions dict that includes session (caller holds self.lock)"""
+        sessions = dict(self.sessions)
+        sessions[session_id] = session
+        self.sessions = sessions
+    
+    def _unpublish_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Publish a copy of the sessions dict without session_id (caller holds self.lock)"""
+        sessions = dict(self.sessions)
+        session = sessions.pop(session_id, None)
+        self.sessions = sessions
+        return session
+    
+    @contextmanager
+    def _locked_session(self, session_id: str) -> Iterator[Optional[Dict[str, Any]]]:
+        """Hold session_id's writer lock and yield the session, or None if it isn't live"""
+        session = self.sessions.get(session_id)
+        if session is None:
+            yield None
+            return
+        with session["_lock"]:
+            # An export may have removed it while we waited; don't write to a detached session
+            yield session if self.sessions.get(session_id) is session else None
+    
+    @staticmethod
+    def _publish_facts(session: Dict[str, Any], memory_facts: Dict[str, Dict]) -> None:
+        """Swap in a new memory_facts dict (caller holds the session's lock and built it as a copy)"""
+        session["memory_facts"] = memory_facts
+        session["_fact_index"] = InMemorySessionService._index_facts(memory_facts)
+        session["facts_count"] = len(memory_facts)
+    
+    @staticmethod
+    def _index_facts(memory_facts: Dict[str, Dict]) -> Dict[str, Any]:
+        """
+        Build the read-side views of a facts snapshot once per write, so context builders
+        don't regroup every fact on every call. Lists keep memory_facts insertion order.
+        """
+        # Grouped by fact_type under each reader's default for untyped facts: 'other' for the
+        # translation and comprehensive contexts, 'general' for format_context_for_llm
+        by_type: Dict[str, List[Dict]] = {}
+        by_category: Dict[str, List[Dict]] = {}
+        # "key: value" strings for the context builders: parallel to the groups, and per person
+        type_labels: Dict[str, List[str]] = {}
+        category_labels: Dict[str, List[str]] = {}
+        person_labels: Dict[str, List[str]] = {}
+        for fact in memory_facts.values():
+            fact_type = fact.get('fact_type', 'other')
+            category = fact.get('fact_type', 'general')
+            label = f"{fact.get('fact_key', 'unknown')}: {fact.get('fact_value', 'unknown')}"
+            by_type.setdefault(fact_type, []).append(fact)
+            type_labels.setdefault(fact_type, []).append(label)
+            by_category.setdefault(category, []).append(fact)
+            category_labels.setdefault(category, []).append(label)
+            person = fact.get('person', 'unknown')
+            if person != 'unknown':
+                person_labels.setdefault(person, []).append(f"{fact.get('fact_key', '')}: {fact.get('fact_value', '')}")
+        # Most recent first; the sort is stable, so equal timestamps keep insertion order
+        by_recency = sorted(memory_facts.values(), key=lambda x: x.get('timestamp', ''), reverse=True)
+        # Lowercased search_memory_facts haystack for each fact, parallel to by_recency
+        search_texts = [
+            f"{fact.get('fact_key', '')} {fact.get('fact_value', '')} {fact.get('extracted_from', '')}".lower()
+            for fact in by_recency
+        ]
+        return {
+            "by_type": by_type,
+            "type_labels": type_labels,
+            "by_category": by_category,
+            "category_labels": category_labels,
+            "person_labels": person_labels,
+            "by_recency": by_recency,
+            "search_texts": search_texts
+        }
+    
     def add_message(
         self,
         session_id: str,
@@ -67,12 +189,11 @@ class InMemorySessionService:
         interaction_id: Optional[str] = None
     ) -> Optional[Dict]:
         """Add message to session (fact extraction handled by comprehensive AI processing)"""
-        with self.lock:
-            if session_id not in self.sessions:
+        with self._locked_session(session_id) as session:
+            if session is None:
                 logger.warning(f"Session {session_id} not found")
                 return None
             
-            session = self.sessions[session_id]
             message_id = len(session["messages"])
             
             # Auto-extract facts if enabled
@@ -80,68 +201,78 @@ class InMemorySessionService:
             # extracted_facts = [] (no longer needed since facts come from Gemini JSON)
             
             # Create message object
+            now = datetime.now()
             message = {
                 "id": message_id,
-                "speaker": speaker,
+                # Few distinct values across all sessions: intern so messages share one copy
+                "speaker": self._intern(speaker),
                 "text": text,
-                "language": language,
-                "type": message_type,
-                "timestamp": datetime.now().isoformat(),
+                "language": self._intern(language),
+                "type": self._intern(message_type),
+                "timestamp": now.isoformat(),
                 "interaction_id": interaction_id
             }
             
             # Add to session
             session["messages"].append(message)
-            session["last_activity"] = datetime.now()
+            session["_message_times"].append(now)
+            session["last_activity"] = now
             session["message_count"] += 1
             
             logger.info(f"Added message to session {session_id}: {len(text)} chars (facts managed by comprehensive AI processing)")
             return message
     
+    @staticmethod
+    def _intern(value: Any) -> Any:
+        """sys.intern for strings; other values (e.g. a null language from the LLM JSON) pass through"""
+        return sys.intern(value) if type(value) is str else value
+    
     def get_session_context(self, session_id: str, max_messages: int = None) -> Dict[str, Any]:
         """Get session context for AI processing"""
         max_messages = self.max_context_messages
-            
-        with self.lock:
-            if session_id not in self.sessions:
-                return {
-                    "messages": [],
-                    "memory_facts": {},
-                    "session_info": {},
-                    "context_analysis": {"exists": False}
-                }
-            
-            session = self.sessions[session_id]
-            
-            # Get recent messages (sliding window)
-            cutoff_time = datetime.now() - timedelta(minutes=self.sliding_window_minutes)
-            recent_messages = []
-            
-            for msg in session["messages"]:
-                msg_time = datetime.fromisoformat(msg["timestamp"])
-                if msg_time > cutoff_time:
-                    recent_messages.append(msg)
-            
-            # Limit to max_messages most recent
-            recent_messages = recent_messages[-max_messages:] if recent_messages else []
-            
-            # Session statistics
-            session_info = {
-                "session_id": session_id,
-                "duration_minutes": (datetime.now() - session["created_at"]).total_seconds() / 60,
-                "message_count": session["message_count"],
-                "facts_count": session["facts_count"],
-                "languages": [session["main_language"], session["other_language"]],
-                "last_activity": session["last_activity"].isoformat(),
-                "is_premium": session["is_premium"]
-            }
-            
+        
+        session = self.sessions.get(session_id)
+        if session is None:
             return {
-                "messages": recent_messages,
-                "memory_facts": session["memory_facts"],
-                "session_info": session_info,
-                "context_analysis": {"exists": True, "message_count": len(recent_messages)}
+                "messages": [],
+                "memory_facts": {},
+                "session_info": {},
+                "context_analysis": {"exists": False}
             }
+        
+        # One consistent facts snapshot for the whole response
+        memory_facts = session["memory_facts"]
+        
+        # Get recent messages (sliding window). Messages are appended in time order, so
+        # bisect the parallel datetimes instead of parsing every ISO timestamp
+        cutoff_time = datetime.now() - timedelta(minutes=self.sliding_window_minutes)
+        messages = session["messages"]
+        message_times = session["_message_times"]
+        # An in-flight add_message may have appended to only one of the two lists so far
+        count = min(len(messages), len(message_times))
+        start = bisect.bisect_right(message_times, cutoff_time, 0, count)
+        recent_messages = messages[start:count]
+        
+        # Limit to max_messages most recent
+        recent_messages = recent_messages[-max_messages:] if recent_messages else []
+        
+        # Session statistics
+        session_info = {
+            "session_id": session_id,
+            "duration_minutes": (datetime.now() - session["created_at"]).total_seconds() / 60,
+            "message_count": session["message_count"],
+            "facts_count": len(memory_facts),
+            "languages": [session["main_language"], session["other_language"]],
+            "last_activity": session["last_activity"].isoformat(),
+            "is_premium": session["is_premium"]
+        }
+        
+        return {
+            "messages": recent_messages,
+            "memory_facts": memory_facts,
+            "session_info": session_info,
+            "context_analysis": {"exists": True, "message_count": len(recent_messages)}
+        }
     
     def search_memory_facts(
         self, 
@@ -149,115 +280,91 @@ class InMemorySessionService:
         query_terms: List[str]
     ) -> List[Dict]:
         """Search memory facts for relevant information"""
-        with self.lock:
-            if session_id not in self.sessions:
-                return []
-            
-            session = self.sessions[session_id]
-            memory_facts = session["memory_facts"]
-            
-            if not memory_facts or not query_terms:
-                return []
-            
-            # Simple text matching across fact values and keys
-            matching_facts = []
-            for fact_key, fact_data in memory_facts.items():
-                fact_text = f"{fact_data.get('fact_key', '')} {fact_data.get('fact_value', '')} {fact_data.get('extracted_from', '')}".lower()
-                
-                if any(term.lower() in fact_text for term in query_terms):
-                    matching_facts.append(fact_data)
-            
-            # Sort by timestamp (most recent first)
-            matching_facts.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-            
-            return matching_facts[:10]  # Return top 10 matches
+        session = self.sessions.get(session_id)
+        if session is None:
+            return []
+        fact_index = session["_fact_index"]
+        
+        if not fact_index["by_recency"] or not query_terms:
+            return []
+        
+        # Simple text matching across fact values and keys: one alternation regex tests all
+        # terms per fact against the haystacks lowercased at write time
+        terms_re = re.compile("|".join(re.escape(term.lower()) for term in query_terms))
+        
+        # Scan most recent first so the scan can stop at the top 10 matches
+        matching_facts = []
+        for fact_data, fact_text in zip(fact_index["by_recency"], fact_index["search_texts"]):
+            if terms_re.search(fact_text):
+                matching_facts.append(fact_data)
+                if len(matching_facts) == 10:
+                    break
+        
+        return matching_facts  # Top 10 matches
     
     def get_translation_context(self, session_id: str, text_to_translate: str) -> str:
         """Get optimal context for translation prompts (facts + recent messages)"""
-        with self.lock:
-            if session_id not in self.sessions:
-                return ""
-            
-            session = self.sessions[session_id]
-            
-            # Get recent conversation messages (last 3-4 messages for immediate context)
-            recent_messages = []
-            if session["messages"]:
-                for msg in session["messages"][-4:]:
-                    recent_messages.append(f"{msg['speaker']}: {msg['text'][:100]}")
-            
-            # Get relevant facts from session memory
-            session_facts = list(session["memory_facts"].values())
-            
-            # Build context combining recent messages and facts
-            context_parts = []
-            
-            # Add recent conversation context
-            if recent_messages:
-                recent_context = " | ".join(recent_messages[-2:])  # Last 2 messages
-                context_parts.append(f"Recent: {recent_context}")
-            
-            # Add facts-based context
-            if session_facts:
-                # Group facts by type
-                fact_groups = {}
-                for fact in session_facts:
-                    fact_type = fact.get('fact_type', 'other')
-                    if fact_type not in fact_groups:
-                        fact_groups[fact_type] = []
-                    fact_groups[fact_type].append(fact)
-                
-                # Add personal/relationship context
-                personal_facts = fact_groups.get('personal_info', []) + fact_groups.get('relationships', [])
-                if personal_facts:
-                    personal_context = []
-                    for fact in personal_facts[:3]:  # Max 3 personal facts
-                        fact_key = fact.get('fact_key', 'unknown')
-                        fact_value = fact.get('fact_value', 'unknown')
-                        personal_context.append(f"{fact_key}: {fact_value}")
-                    if personal_context:
-                        context_parts.append(f"Personal: {' | '.join(personal_context)}")
-                
-                # Add other relevant fact types
-                for fact_type in ['locations', 'professional', 'preferences']:
-                    if fact_type in fact_groups:
-                        type_context = []
-                        for fact in fact_groups[fact_type][:2]:  # Max 2 facts per type
-                            fact_key = fact.get('fact_key', 'unknown')
-                            fact_value = fact.get('fact_value', 'unknown')
-                            type_context.append(f"{fact_key}: {fact_value}")
-                        if type_context:
-                            context_parts.append(f"{fact_type.title()}: {' | '.join(type_context)}")
-            
-            # Format final context
-            if context_parts:
-                context = f"CONTEXT: {' • '.join(context_parts[:4])}"  # Max 4 context categories
-                return f"{context}\nINSTRUCTION: Use this context to resolve pronouns, clarify references, and maintain conversational flow."
-            
+        session = self.sessions.get(session_id)
+        if session is None:
             return ""
+        
+        # Get recent conversation messages (last 3-4 messages for immediate context)
+        recent_messages = []
+        if session["messages"]:
+            for msg in session["messages"][-4:]:
+                recent_messages.append(f"{msg['speaker']}: {msg['text'][:100]}")
+        
+        # Get relevant facts from session memory, grouped and formatted by type at write time
+        fact_labels = session["_fact_index"]["type_labels"]
+        
+        # Build context combining recent messages and facts
+        context_parts = []
+        
+        # Add recent conversation context
+        if recent_messages:
+            recent_context = " | ".join(recent_messages[-2:])  # Last 2 messages
+            context_parts.append(f"Recent: {recent_context}")
+        
+        # Add facts-based context
+        if fact_labels:
+            # Add personal/relationship context
+            personal_context = (fact_labels.get('personal_info', []) + fact_labels.get('relationships', []))[:3]  # Max 3 personal facts
+            if personal_context:
+                context_parts.append(f"Personal: {' | '.join(personal_context)}")
+            
+            # Add other relevant fact types
+            for fact_type in ['locations', 'professional', 'preferences']:
+                if fact_type in fact_labels:
+                    type_context = fact_labels[fact_type][:2]  # Max 2 facts per type
+                    if type_context:
+                        context_parts.append(f"{fact_type.title()}: {' | '.join(type_context)}")
+        
+        # Format final context
+        if context_parts:
+            context = f"CONTEXT: {' • '.join(context_parts[:4])}"  # Max 4 context categories
+            return f"{context}\nINSTRUCTION: Use this context to resolve pronouns, clarify references, and maintain conversational flow."
+        
+        return ""
     
     def get_ai_assistant_context(self, session_id: str, query: str) -> str:
         """Get context for AI assistant queries (primarily facts-based)"""
-        with self.lock:
-            if session_id not in self.sessions:
-                return ""
-            
-            session = self.sessions[session_id]
-            
-            # For AI assistant, search relevant facts based on query
-            query_terms = query.lower().split()
-            relevant_facts = self.search_memory_facts(session_id, query_terms)
-            
-            if not relevant_facts:
-                # If no specific relevant facts, provide a summary of all recent facts
-                all_facts = list(session["memory_facts"].values())
-                if all_facts:
-                    # Get most recent facts (last 5)
-                    recent_facts = sorted(all_facts, key=lambda x: x.get('timestamp', ''), reverse=True)[:5]
-                    return self._format_facts_context(recent_facts, "Recent conversation facts")
-                return ""
-            
-            return self._format_facts_context(relevant_facts[:5], "Relevant facts")
+        session = self.sessions.get(session_id)
+        if session is None:
+            return ""
+        
+        # For AI assistant, search relevant facts based on query
+        query_terms = query.lower().split()
+        relevant_facts = self.search_memory_facts(session_id, query_terms)
+        
+        if not relevant_facts:
+            # If no specific relevant facts, provide a summary of all recent facts
+            # Get most recent facts (last 5), pre-sorted at write time
+            recent_facts = session["_fact_index"]["by_recency"][:5]
+            if recent_facts:
+                return self._format_facts_context(recent_facts, "Recent conversation facts")
+            return ""
+        
+        return self._format_facts_context(relevant_facts[:5], "Relevant facts")
     
     def _format_facts_context(self, facts: List[Dict], context_label: str) -> str:
         """Format facts into a clean context string for AI processing"""
@@ -291,55 +398,52 @@ class InMemorySessionService:
     
     def get_comprehensive_session_context(self, session_id: str, query: str = "") -> Dict[str, Any]:
         """Get comprehensive context including facts, messages, and session info for enhanced AI processing"""
-        with self.lock:
-            if session_id not in self.sessions:
-                return {"exists": False}
-            
-            session = self.sessions[session_id]
-            
-            # Get basic session context
-            basic_context = self.get_session_context(session_id)
-            
-            # Get facts summary
-            all_facts = list(session["memory_facts"].values())
-            facts_summary = {}
-            
-            if all_facts:
-                # Categorize facts
-                for fact in all_facts:
-                    fact_type = fact.get('fact_type', 'other')
-                    if fact_type not in facts_summary:
-                        facts_summary[fact_type] = []
-                    facts_summary[fact_type].append({
+        session = self.sessions.get(session_id)
+        if session is None:
+            return {"exists": False}
+        
+        # Get basic session context
+        basic_context = self.get_session_context(session_id)
+        
+        # Get facts summary
+        fact_groups = session["_fact_index"]["by_type"]
+        facts_summary = {}
+        
+        if fact_groups:
+            # Categorize facts (already grouped by type at write time)
+            for fact_type, type_facts in fact_groups.items():
+                facts_summary[fact_type] = [
+                    {
                         'key': fact.get('fact_key', ''),
                         'value': fact.get('fact_value', ''),
                         'speaker': fact.get('speaker', ''),
                         'confidence': fact.get('confidence', 0),
                         'timestamp': fact.get('timestamp', '')
-                    })
-                
-                # Sort each category by timestamp (most recent first)
-                for fact_type in facts_summary:
-                    facts_summary[fact_type].sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-            
-            # Enhanced context for AI
-            enhanced_context = {
-                **basic_context,
-                "facts_summary": facts_summary,
-                "formatted_context": self.get_ai_assistant_context(session_id, query),
-                "total_facts_by_type": {fact_type: len(facts) for fact_type, facts in facts_summary.items()},
-                "session_languages": [session["main_language"], session["other_language"]],
-                "conversation_flow": self._get_conversation_flow_summary(session_id)
-            }
+                    }
+                    for fact in type_facts
+                ]
             
-            return enhanced_context
+            # Sort each category by timestamp (most recent first)
+            for fact_type in facts_summary:
+                facts_summary[fact_type].sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+        
+        # Enhanced context for AI
+        enhanced_context = {
+            **basic_context,
+            "facts_summary": facts_summary,
+            "formatted_context": self.get_ai_assistant_context(session_id, query),
+            "total_facts_by_type": {fact_type: len(facts) for fact_type, facts in facts_summary.items()},
+            "session_languages": [session["main_language"], session["other_language"]],
+            "conversation_flow": self._get_conversation_flow_summary(session_id)
+        }
+        
+        return enhanced_context
     
     def _get_conversation_flow_summary(self, session_id: str) -> Dict[str, Any]:
         """Get a summary of conversation flow patterns"""
-        if session_id not in self.sessions:
+        session = self.sessions.get(session_id)
+        if session is None:
             return {}
-        
-        session = self.sessions[session_id]
         messages = session["messages"]
         
         if not messages:
@@ -448,14 +552,23 @@ class InMemorySessionService:
     
     def export_session_to_file(self, session_id: str) -> Optional[str]:
         """Export session to JSON file and remove from memory"""
+        # Detach under the lock, then write to disk without blocking other sessions
         with self.lock:
-            if session_id not in self.sessions:
-                logger.warning(f"Session {session_id} not found for export")
-                return None
-            
-            session = self.sessions[session_id]
-            
-            # Prepare export data
+            detached = self._detach_session_nolock(session_id)
+        if detached is None:
+            return None
+        return self._write_export(session_id, *detached)
+    
+    def _detach_session_nolock(self, session_id: str) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Unpublish a session and build its export data; the caller holds self.lock"""
+        session = self.sessions.get(session_id)
+        if session is None:
+            logger.warning(f"Session {session_id} not found for export")
+            return None
+        
+        # Wait out any in-flight writer so the export doesn't miss its update
+        with session["_lock"]:
+            # Prepare export data (shallow: once unpublished nothing writes to the session)
             export_data = {
                 "session_metadata": {
                     "session_id": session_id,
@@ -474,55 +587,65 @@ class InMemorySessionService:
                 "format_version": "2.0"
             }
             
-            # Generate filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"conversation_{session_id}_{timestamp}.json"
-            filepath = self.export_dir / filename
+            # Remove from memory
+            self._unpublish_session(session_id)
+        
+        return session, export_data
+    
+    def _write_export(self, session_id: str, session: Dict[str, Any], export_data: Dict[str, Any]) -> Optional[str]:
+        """Write a detached session's export data to disk; restores the session if the write fails"""
+        # Generate filename
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"conversation_{session_id}_{timestamp}.json"
+        filepath = self.export_dir / filename
+        
+        try:
+            # Write to file (orjson emits UTF-8 directly, like ensure_ascii=False)
+            filepath.write_bytes(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+            
+            logger.info(f"Exported session {session_id} to {filename} and removed from memory")
+            return str(filepath)
             
-            try:
-                # Write to file
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
-                
-                # Remove from memory
-                del self.sessions[session_id]
-                
-                logger.info(f"Exported session {session_id} to {filename} and removed from memory")
-                return str(filepath)
-                
-            except Exception as e:
-                logger.error(f"Failed to export session {session_id}: {e}")
-                return None
+        except Exception as e:
+            logger.error(f"Failed to export session {session_id}: {e}")
+            # Put it back so the conversation isn't lost, unless the ID was reused meanwhile
+            with self.lock:
+                if session_id not in self.sessions:
+                    self._publish_session(session_id, session)
+            return None
     
     def get_active_session_count(self) -> int:
         """Get number of active sessions"""
-        with self.lock:
-            return len(self.sessions)
+        return len(self.sessions)
     
     def cleanup_old_sessions(self) -> int:
         """Clean up sessions older than max duration"""
+        # Hold the writer lock across check and detach so a session can't become active in between
         with self.lock:
             current_time = datetime.now()
-            expired_sessions = []
+            detached_sessions = []
             
-            for session_id, session_data in self.sessions.items():
+            for session_id, session_data in self.sessions.items():  # Snapshot; detaching publishes a new dict
                 if current_time - session_data["last_activity"] > self.max_session_duration:
-                    expired_sessions.append(session_id)
-            
-            # Export and remove expired sessions
-            exported_count = 0
-            for session_id in expired_sessions:
-                if self.export_session_to_file(session_id):
-                    exported_count += 1
-            
-            logger.info(f"Cleaned up {exported_count} expired sessions")
-            return exported_count
+                    detached = self._detach_session_nolock(session_id)
+                    if detached is not None:
+                        detached_sessions.append((session_id, *detached))
+        
+        # Export and remove expired sessions, off the lock
+        exported_count = 0
+        for session_id, session, export_data in detached_sessions:
+            if self._write_export(session_id, session, export_data):
+                exported_count += 1
+        
+        logger.info(f"Cleaned up {exported_count} expired sessions")
+        return exported_count
     
     def format_context_for_llm(self, session_id: str, current_query: str = "") -> str:
         """Format session context for LLM processing with explicit usage instructions"""
+        session = self.sessions.get(session_id)
         context = self.get_session_context(session_id)
         
-        if not context["context_analysis"]["exists"]:
+        if session is None or not context["context_analysis"]["exists"]:
             return "No session context available. This is a new conversation."
         
         formatted_parts = []
@@ -543,43 +666,25 @@ class InMemorySessionService:
         formatted_parts.append(f"   Languages: {' ↔ '.join(session_info['languages'])}")
         formatted_parts.append("")
         
-        # Add comprehensive memory facts
-        memory_facts = context["memory_facts"]
-        if memory_facts:
-            # Group facts by category for better organization
-            fact_categories = {}
-            for fact_data in memory_facts.values():
-                category = fact_data.get('fact_type', 'general')
-                if category not in fact_categories:
-                    fact_categories[category] = []
-                fact_categories[category].append(fact_data)
-            
+        # Add comprehensive memory facts, grouped by category at write time
+        fact_index = session["_fact_index"]
+        fact_categories = fact_index["by_category"]
+        if fact_categories:
             formatted_parts.append("💾 KNOWN FACTS DATABASE:")
             for category, facts in fact_categories.items():
                 if facts:
                     formatted_parts.append(f"   📋 {category.upper()}:")
-                    for fact in facts[:4]:  # Max 4 facts per category
-                        fact_key = fact.get('fact_key', 'unknown')
-                        fact_value = fact.get('fact_value', 'unknown')
+                    for fact, fact_label in zip(facts[:4], fact_index["category_labels"][category]):  # Max 4 facts per category
                         confidence = fact.get('confidence', 0.5)
-                        formatted_parts.append(f"      • {fact_key}: {fact_value} (confidence: {confidence:.1f})")
+                        formatted_parts.append(f"      • {fact_label} (confidence: {confidence:.1f})")
             formatted_parts.append("")
         
         # Add speaker profiles if available
-        speaker_profiles = {}
-        for fact_data in memory_facts.values() if memory_facts else []:
-            person = fact_data.get('person', 'unknown')
-            if person != 'unknown' and person not in speaker_profiles:
-                speaker_profiles[person] = []
-            if person != 'unknown':
-                speaker_profiles[person].append(fact_data)
-        
+        speaker_profiles = fact_index["person_labels"]
         if speaker_profiles:
-            formatted_parts.append("� KNOWN SPEAKERS:")
-            for person, person_facts in speaker_profiles.items():
-                fact_summary = []
-                for fact in person_facts[:3]:  # Top 3 facts per person
-                    fact_summary.append(f"{fact.get('fact_key', '')}: {fact.get('fact_value', '')}")
+            formatted_parts.append("👥 KNOWN SPEAKERS:")
+            for person, person_labels in speaker_profiles.items():
+                fact_summary = person_labels[:3]  # Top 3 facts per person
                 if fact_summary:
                     formatted_parts.append(f"   • {person}: {' | '.join(fact_summary)}")
             formatted_parts.append("")
@@ -629,11 +734,10 @@ class InMemorySessionService:
     
     def get_session_facts(self, session_id: str) -> List[Dict]:
         """Get all facts for a session"""
-        with self.lock:
-            session = self.sessions.get(session_id)
-            if not session:
-                return []
-            return list(session["memory_facts"].values())
+        session = self.sessions.get(session_id)
+        if not session:
+            return []
+        return list(session["memory_facts"].values())
     
     # ===============================================
     # DEDICATED FACT MANAGEMENT METHODS
@@ -644,8 +748,7 @@ class InMemorySessionService:
     def add_session_fact(self, session_id: str, fact: Dict) -> bool:
         """Add a new fact to the session"""
         try:
-            with self.lock:
-                session = self.sessions.get(session_id)
+            with self._locked_session(session_id) as session:
                 if not session:
                     logger.warning(f"Session {session_id} not found for fact addition")
                     return False
@@ -655,9 +758,10 @@ class InMemorySessionService:
                     logger.warning("Fact missing fact_id")
                     return False
                 
-                # Add to memory_facts
-                session["memory_facts"][fact_id] = fact
-                session["facts_count"] = len(session["memory_facts"])
+                # Add to a copy of memory_facts and publish it
+                memory_facts = dict(session["memory_facts"])
+                memory_facts[fact_id] = fact
+                self._publish_facts(session, memory_facts)
                 session["last_activity"] = datetime.now()
                 
                 logger.info(f"Added fact {fact_id} to session {session_id}")
@@ -670,8 +774,7 @@ class InMemorySessionService:
     def endorse_fact(self, session_id: str, fact_id: str, boost: float = 0.1) -> bool:
         """Endorse an existing fact by boosting its confidence"""
         try:
-            with self.lock:
-                session = self.sessions.get(session_id)
+            with self._locked_session(session_id) as session:
                 if not session:
                     return False
                 
@@ -680,6 +783,9 @@ class InMemorySessionService:
                     logger.warning(f"Fact {fact_id} not found for endorsement")
                     return False
                 
+                # Readers may hold the published fact; update a copy
+                fact = dict(fact)
+                
                 # Boost confidence (max 1.0)
                 current_confidence = fact.get("confidence", 0.5)
                 new_confidence = min(1.0, current_confidence + boost)
@@ -689,6 +795,9 @@ class InMemorySessionService:
                 fact["endorsement_count"] = fact.get("endorsement_count", 1) + 1
                 fact["last_updated"] = datetime.now().isoformat()
                 
+                memory_facts = dict(session["memory_facts"])
+                memory_facts[fact_id] = fact
+                self._publish_facts(session, memory_facts)
                 session["last_activity"] = datetime.now()
                 
                 logger.info(f"Endorsed fact {fact_id}: confidence {current_confidence:.2f} -> {new_confidence:.2f}")
@@ -701,8 +810,7 @@ class InMemorySessionService:
     def correct_fact(self, session_id: str, fact_id: str, new_fact: Dict, correction_details: str = "") -> bool:
         """Correct an existing fact with new information"""
         try:
-            with self.lock:
-                session = self.sessions.get(session_id)
+            with self._locked_session(session_id) as session:
                 if not session:
                     return False
                 
@@ -715,7 +823,7 @@ class InMemorySessionService:
                 new_fact["fact_id"] = fact_id
                 new_fact["created_at"] = old_fact.get("created_at")
                 new_fact["last_updated"] = datetime.now().isoformat()
-                new_fact["correction_history"] = old_fact.get("correction_history", [])
+                new_fact["correction_history"] = list(old_fact.get("correction_history", []))
                 
                 # Add correction record
                 correction_record = {
@@ -727,7 +835,9 @@ class InMemorySessionService:
                 new_fact["correction_history"].append(correction_record)
                 
                 # Replace the fact
-                session["memory_facts"][fact_id] = new_fact
+                memory_facts = dict(session["memory_facts"])
+                memory_facts[fact_id] = new_fact
+                self._publish_facts(session, memory_facts)
                 session["last_activity"] = datetime.now()
                 
                 logger.info(f"Corrected fact {fact_id}: {correction_details}")
@@ -740,14 +850,14 @@ class InMemorySessionService:
     def delete_fact(self, session_id: str, fact_id: str, reason: str = "") -> bool:
         """Delete a fact from the session"""
         try:
-            with self.lock:
-                session = self.sessions.get(session_id)
+            with self._locked_session(session_id) as session:
                 if not session:
                     return False
                 
                 if fact_id in session["memory_facts"]:
-                    deleted_fact = session["memory_facts"].pop(fact_id)
-                    session["facts_count"] = len(session["memory_facts"])
+                    memory_facts = dict(session["memory_facts"])
+                    deleted_fact = memory_facts.pop(fact_id)
+                    self._publish_facts(session, memory_facts)
                     session["last_activity"] = datetime.now()
                     
                     # Log deletion
@@ -765,8 +875,7 @@ class InMemorySessionService:
     def deduplicate_facts(self, session_id: str, target_fact_id: str, similar_fact: Dict) -> bool:
         """Merge two similar facts, keeping the higher confidence version"""
         try:
-            with self.lock:
-                session = self.sessions.get(session_id)
+            with self._locked_session(session_id) as session:
                 if not session:
                     return False
                 
@@ -788,15 +897,19 @@ class InMemorySessionService:
                         target_fact.get("endorsement_count", 1) + 
                         similar_fact.get("endorsement_count", 1)
                     )
-                    session["memory_facts"][target_fact_id] = similar_fact
+                    merged_fact = similar_fact
                     logger.info(f"Deduplicated: replaced {target_fact_id} with higher confidence version")
                 else:
-                    # Boost existing fact's confidence and endorsement count
-                    target_fact["confidence"] = min(1.0, target_confidence + 0.1)
-                    target_fact["endorsement_count"] = target_fact.get("endorsement_count", 1) + 1
-                    target_fact["last_updated"] = datetime.now().isoformat()
+                    # Boost existing fact's confidence and endorsement count (on a copy; readers may hold it)
+                    merged_fact = dict(target_fact)
+                    merged_fact["confidence"] = min(1.0, target_confidence + 0.1)
+                    merged_fact["endorsement_count"] = target_fact.get("endorsement_count", 1) + 1
+                    merged_fact["last_updated"] = datetime.now().isoformat()
                     logger.info(f"Deduplicated: boosted confidence of {target_fact_id}")
                 
+                memory_facts = dict(session["memory_facts"])
+                memory_facts[target_fact_id] = merged_fact
+                self._publish_facts(session, memory_facts)
                 session["last_activity"] = datetime.now()
                 return True
                 
@@ -807,15 +920,15 @@ class InMemorySessionService:
     def store_fact_directly(self, session_id: str, fact_id: str, fact_data: dict) -> bool:
         """Store a fact directly without extraction processing"""
         try:
-            with self.lock:
-                session = self.sessions.get(session_id)
+            with self._locked_session(session_id) as session:
                 if not session:
                     logger.warning(f"Session {session_id} not found for direct fact storage")
                     return False
                 
-                # Store in memory_facts using the new structure
-                session["memory_facts"][fact_id] = fact_data
-                session["facts_count"] = len(session["memory_facts"])
+                # Store in a copy of memory_facts using the new structure
+                memory_facts = dict(session["memory_facts"])
+                memory_facts[fact_id] = fact_data
+                self._publish_facts(session, memory_facts)
                 session["last_activity"] = datetime.now()
                 
                 logger.info(f"Stored fact {fact_id} directly in session {session_id}")
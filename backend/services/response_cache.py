@@ -0,0 +1,62 @@
+# Response Cache for A3I Translator
+# Bounded in-memory TTL cache for expensive, deterministic upstream results
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TTLResponseCache:
+    """Thread-safe LRU cache whose entries expire after a fixed time-to-live"""
+
+    def __init__(self, name: str, ttl_seconds: float, max_entries: int = 512):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        with self.lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry when full"""
+        with self.lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Gemini audio-processing results keyed by (sha256(audio), sha256(system prompt), main_language, other_language, is_premium)
+gemini_audio_result_cache = TTLResponseCache("gemini_audio", ttl_seconds=24 * 60 * 60, max_entries=512)
+
+# Gemini text translations keyed by (blake2b(text), source_language, target_language)
+gemini_translation_cache = TTLResponseCache("gemini_translations", ttl_seconds=24 * 60 * 60, max_entries=4096)
+
+# Synthesized audio served by URL (GET /audio/{audio_id}) instead of inline base64
+audio_blob_cache = TTLResponseCache("audio_blobs", ttl_seconds=10 * 60, max_entries=256)
+
+# Full /process-audio/ responses keyed by the client's Idempotency-Key header plus request fields
+idempotent_response_cache = TTLResponseCache("idempotent_responses", ttl_seconds=60, max_entries=256)
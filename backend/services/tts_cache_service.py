@@ -0,0 +1,164 @@
+# TTS Audio Cache for A3I Translator
+# Two-tier (in-memory LRU + on-disk) cache for synthesized speech audio
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TTSAudioCache:
+    """Caches synthesized audio bytes keyed by the inputs that produced them"""
+
+    def __init__(
+        self,
+        cache_directory: Optional[str] = None,
+        max_memory_entries: int = 1024
+    ):
+        self.cache_dir = Path(cache_directory or os.environ.get(
+            "TTS_CACHE_DIR", str(Path(tempfile.gettempdir()) / "tts_cache")
+        ))
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_memory_entries = max_memory_entries
+        self._memory_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self.lock = threading.Lock()
+
+        # Singleflight: concurrent async misses for the same key share one synthesis
+        self._inflight: Dict[str, "asyncio.Task[bytes]"] = {}
+
+        # Cache configuration
+        self.max_entry_age = timedelta(hours=72)     # Disk entries expire after 72 hours
+        self.cleanup_interval = timedelta(hours=1)   # Check every hour
+
+        # Start cleanup thread
+        self._start_cleanup_thread()
+
+    @staticmethod
+    def make_key(key_tuple: Tuple) -> str:
+        """Build a stable sha256 cache key from (text, language, gender, tone, premium)"""
+        # Enums are keyed by name so the key survives enum repr changes across versions
+        parts = [getattr(part, "name", None) or str(part) for part in key_tuple]
+        return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached audio from memory, then disk, or None on a miss"""
+        with self.lock:
+            audio = self._memory_cache.get(key)
+            if audio is not None:
+                self._memory_cache.move_to_end(key)
+                return audio
+
+        cache_file = self.cache_dir / f"{key}.mp3"
+        try:
+            audio = cache_file.read_bytes()
+        except OSError:
+            return None
+
+        # Promote disk hit into the in-memory tier
+        self._remember(key, audio)
+        return audio
+
+    def put(self, key: str, audio: bytes) -> None:
+        """Store audio in both tiers"""
+        if not audio:
+            return
+        self._remember(key, audio)
+
+        cache_file = self.cache_dir / f"{key}.mp3"
+        tmp_file = cache_file.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            tmp_file.write_bytes(audio)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.warning(f"Failed to write TTS cache entry {key[:12]}: {e}")
+            tmp_file.unlink(missing_ok=True)
+
+    def get_or_create(self, key_tuple: Tuple, producer: Callable[[], bytes]) -> bytes:
+        """Return cached audio for key_tuple, calling producer() only on a miss"""
+        key = self.make_key(key_tuple)
+        audio = self.get(key)
+        if audio is not None:
+            logger.info(f"TTS cache hit: {key[:12]}")
+            return audio
+
+        audio = producer()
+        self.put(key, audio)
+        return audio
+
+    async def aget_or_create(self, key_tuple: Tuple, producer: Callable[[], Awaitable[bytes]]) -> bytes:
+        """Async variant of get_or_create for coroutine-based synthesizers"""
+        key = self.make_key(key_tuple)
+        audio = self.get(key)
+        if audio is not None:
+            logger.info(f"TTS cache hit: {key[:12]}")
+            return audio
+
+        # Join an identical synthesis already in flight instead of calling the API again.
+        # The check-and-register below has no await, so it is atomic on the event loop.
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            logger.info(f"TTS request coalesced with in-flight synthesis: {key[:12]}")
+        else:
+            # Synthesize in its own task so a caller that is cancelled (client disconnect)
+            # doesn't cancel the synthesis other callers are waiting on
+            inflight = asyncio.ensure_future(self._produce(key, producer))
+            # Mark the result retrieved so a failure nobody awaits doesn't log "exception never retrieved"
+            inflight.add_done_callback(lambda task: task.cancelled() or task.exception())
+            self._inflight[key] = inflight
+        return await asyncio.shield(inflight)
+
+    async def _produce(self, key: str, producer: Callable[[], Awaitable[bytes]]) -> bytes:
+        try:
+            audio = await producer()
+            self.put(key, audio)
+            return audio
+        finally:
+            self._inflight.pop(key, None)
+
+    def _remember(self, key: str, audio: bytes) -> None:
+        with self.lock:
+            self._memory_cache[key] = audio
+            self._memory_cache.move_to_end(key)
+            while len(self._memory_cache) > self.max_memory_entries:
+                self._memory_cache.popitem(last=False)
+
+    def cleanup_expired_entries(self) -> int:
+        """Delete disk entries older than max_entry_age"""
+        cutoff = time.time() - self.max_entry_age.total_seconds()
+        removed = 0
+        for cache_file in self.cache_dir.glob("*.mp3"):
+            try:
+                if cache_file.stat().st_mtime < cutoff:
+                    cache_file.unlink()
+                    removed += 1
+            except OSError:
+                continue
+
+        logger.info(f"Cleaned up {removed} expired TTS cache entries")
+        return removed
+
+    def _start_cleanup_thread(self):
+        """Start background thread for periodic cleanup"""
+        def cleanup_worker():
+            while True:
+                try:
+                    self.cleanup_expired_entries()
+                    time.sleep(self.cleanup_interval.total_seconds())
+                except Exception as e:
+                    logger.error(f"Error in TTS cache cleanup thread: {e}")
+
+        cleanup_thread = threading.Thread(target=cleanup_worker, daemon=True)
+        cleanup_thread.start()
+        logger.info("Started TTS cache cleanup thread")
+
+# Global instance
+tts_audio_cache = TTSAudioCache()
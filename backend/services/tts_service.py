@@ -1,36 +1,95 @@
+import asyncio
 import logging
 import base64
+import re
+from functools import lru_cache
+from typing import List
 from google.cloud import texttospeech_v1beta1 as texttospeech
 from fastapi import HTTPException
 from ..utils.ssml_utils import process_text_to_ssml
+from .tts_cache_service import tts_audio_cache
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_AUDIO_ENCODING = texttospeech.AudioEncoding.MP3
 DEFAULT_AUDIO_MIME_TYPE = "audio/mp3"
 
+# Long text is split on sentence boundaries and synthesized in parallel chunks;
+# MP3 frames are self-synchronizing, so the chunk audio can simply be concatenated
+TTS_CHUNK_CHARS = 150
+TTS_PARALLEL_MIN_CHARS = 300
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?\u3002\uff01\uff1f\u061f\u0964])\s+')
+
 # Placeholder for Azure TTS integration
 # from azure.cognitiveservices.speech import SpeechConfig, SpeechSynthesizer
 # ...
 
-def synthesize_text_to_audio(text: str, language_code: str, gender: texttospeech.SsmlVoiceGender) -> bytes:
+# --- Reusable request messages ---
+# Built once and shared read-only across calls instead of per synthesis
+_AUDIO_CONFIG = texttospeech.AudioConfig(
+    audio_encoding=DEFAULT_AUDIO_ENCODING,
+    speaking_rate=0.9,
+    pitch=0.0,
+    sample_rate_hertz=24000
+)
+
+@lru_cache(maxsize=64)
+def _voice_params(language_code: str, gender: texttospeech.SsmlVoiceGender) -> texttospeech.VoiceSelectionParams:
+    return texttospeech.VoiceSelectionParams(
+        language_code=language_code,
+        ssml_gender=gender
+    )
+
+# --- Shared client ---
+# The async client binds to the running event loop, so it is created on first use
+# (not at import) - this also gives forked uvicorn workers their own gRPC channel
+_TTS_ASYNC_CLIENT = None
+
+def _get_tts_client() -> texttospeech.TextToSpeechAsyncClient:
+    global _TTS_ASYNC_CLIENT
+    if _TTS_ASYNC_CLIENT is None:
+        _TTS_ASYNC_CLIENT = texttospeech.TextToSpeechAsyncClient()
+        logger.info("Google Cloud Text-to-Speech async client initialized.")
+    return _TTS_ASYNC_CLIENT
+
+def _split_for_tts(text: str) -> List[str]:
+    """Group sentences into chunks of roughly TTS_CHUNK_CHARS characters"""
+    chunks = []
+    current = ""
+    for sentence in _SENTENCE_END_RE.split(text):
+        if current and len(current) + len(sentence) + 1 > TTS_CHUNK_CHARS:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+async def synthesize_text_to_audio(text: str, language_code: str, gender: texttospeech.SsmlVoiceGender) -> bytes:
+    if len(text) >= TTS_PARALLEL_MIN_CHARS:
+        chunks = _split_for_tts(text)
+        if len(chunks) > 1:
+            logger.info(f"Synthesizing {len(chunks)} chunks in parallel for {len(text)} characters")
+            audios = await asyncio.gather(*(
+                _synthesize_cached(chunk, language_code, gender) for chunk in chunks
+            ))
+            return b"".join(audios)
+    return await _synthesize_cached(text, language_code, gender)
+
+async def _synthesize_cached(text: str, language_code: str, gender: texttospeech.SsmlVoiceGender) -> bytes:
+    return await tts_audio_cache.aget_or_create(
+        (text, language_code, gender, "neutral", False),
+        lambda: _synthesize_with_google(text, language_code, gender)
+    )
+
+async def _synthesize_with_google(text: str, language_code: str, gender: texttospeech.SsmlVoiceGender) -> bytes:
     try:
         synthesis_input = texttospeech.SynthesisInput(text=text)
-        voice = texttospeech.VoiceSelectionParams(
-            language_code=language_code,
-            ssml_gender=gender
-        )
-        audio_config = texttospeech.AudioConfig(
-            audio_encoding=DEFAULT_AUDIO_ENCODING,
-            speaking_rate=0.9,
-            pitch=0.0,
-            sample_rate_hertz=24000
-        )
-        tts_client = texttospeech.TextToSpeechClient()
-        response = tts_client.synthesize_speech(
+        response = await _get_tts_client().synthesize_speech(
             input=synthesis_input,
-            voice=voice,
-            audio_config=audio_config
+            voice=_voice_params(language_code, gender),
+            audio_config=_AUDIO_CONFIG
         )
         logger.info(f"Successfully synthesized speech for language code: {language_code}")
         return response.audio_content
@@ -0,0 +1,10 @@
+"""
+Language code helpers shared by the translation and TTS paths
+"""
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def base_language_code(language_code: str) -> str:
+    """Lowercased base language of a BCP-47 code ('en-US' -> 'en'); memoized since callers see few distinct codes"""
+    return language_code.split('-', 1)[0].lower()
@@ -1,7 +1,7 @@
 """
 Response parsing utilities for handling malformed Gemini JSON responses
 """
-import json
+import orjson
 import re
 from datetime import datetime
 from typing import Dict, Any
@@ -24,11 +24,11 @@ def fix_json_response(response_text: str, main_language: str = "unknown", other_
     """
     try:
         # First, try to parse as-is
-        response_json = json.loads(response_text)
+        response_json = orjson.loads(response_text)
         if isinstance(response_json, list) and len(response_json) > 0:
             response_json = response_json[0]
         return response_json
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         logger.warning("Initial JSON parsing failed. Attempting to fix common issues...")
         
         # Common fixes for malformed JSON
@@ -52,12 +52,12 @@ def fix_json_response(response_text: str, main_language: str = "unknown", other_
         fixed_text += ']' * open_brackets
         
         try:
-            response_json = json.loads(fixed_text)
+            response_json = orjson.loads(fixed_text)
             if isinstance(response_json, list) and len(response_json) > 0:
                 response_json = response_json[0]
             logger.info("Successfully fixed and parsed JSON response")
             return response_json
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.error("Unable to fix JSON. Creating fallback response.")
             return create_fallback_response(response_text, main_language, other_language)
 